@@ -3,10 +3,14 @@ ByThePong Web - Aplicação Flask Principal
 Backend web mantendo POO e encapsulamento
 """
 
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, Response, render_template, request, jsonify, session, stream_with_context
 # from flask_socketio import SocketIO, emit
 import uuid
 import json
+import random
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 import os
 
@@ -16,14 +20,60 @@ from ball import Ball
 from paddle import Paddle
 from score_manager import ScoreManager
 
+# Limites das sessões em memória (configuráveis pelo ambiente)
+DEFAULT_IDLE_TTL = float(os.environ.get('BYTHEPONG_SESSION_TTL', 600))       # segundos sem acesso
+DEFAULT_MAX_SESSIONS = int(os.environ.get('BYTHEPONG_MAX_SESSIONS', 1000))   # sessões simultâneas
+DEFAULT_REAP_INTERVAL = 30.0                                                 # segundos entre varreduras
+# Simulação no servidor: passos de física por segundo (mesmo passo fixo do jogo desktop)
+DEFAULT_TICK_RATE = int(os.environ.get('BYTHEPONG_TICK_RATE', 60))
+MAX_CATCH_UP_TICKS = 5  # passos recuperados por vez quando o servidor atrasa
+WINNING_SCORE = 3
+# Stream de estado (Server-Sent Events)
+DEFAULT_HEARTBEAT = 15.0   # segundos sem mudança até enviar um comentário de keep-alive
+SSE_RETRY_MS = 2000        # espera sugerida ao navegador antes de reconectar
+
 class WebGameManager:
     """
     Gerenciador de jogos web - mantém encapsulamento e coordena sessões
+    
+    Sessões sem acesso por mais de idle_ttl segundos são removidas por uma
+    thread em segundo plano; acima de max_sessions, a menos usada recentemente
+    é descartada (LRU).
+    
+    Os jogos em andamento são simulados no servidor por uma única thread que
+    avança todas as sessões em um passo fixo (tick_rate vezes por segundo).
     """
     
-    def __init__(self):
-        self.__active_games = {}  # Dicionário de jogos ativos
+    def __init__(self, idle_ttl: float = DEFAULT_IDLE_TTL, max_sessions: int = DEFAULT_MAX_SESSIONS,
+                 reap_interval: float = DEFAULT_REAP_INTERVAL, tick_rate: int = DEFAULT_TICK_RATE):
+        """
+        Inicializa o gerenciador
+        
+        Args:
+            idle_ttl (float): Segundos sem acesso até a sessão expirar
+            max_sessions (int): Máximo de sessões vivas (as menos usadas saem primeiro)
+            reap_interval (float): Intervalo da varredura de sessões ociosas
+            tick_rate (int): Passos de simulação por segundo
+        """
+        # Jogos ativos em ordem de último acesso (mais antigo primeiro)
+        self.__active_games = OrderedDict()
         self.__score_manager = ScoreManager()
+        self.__idle_ttl = idle_ttl
+        self.__max_sessions = max(1, max_sessions)
+        self.__reap_interval = reap_interval
+        self.__lock = threading.RLock()
+        self.__evicted_idle = 0
+        self.__evicted_lru = 0
+        self.__reaper_thread = None
+        self.__stop_event = threading.Event()
+        self.__tick_interval = 1.0 / max(1, tick_rate)
+        self.__ticker_thread = None
+        self.__games_running = threading.Event()  # acorda o ticker quando um jogo começa
+        self.__ticks = 0
+        # Ranking já serializado: (versão, etag, corpo), refeito só quando a versão muda
+        self.__ranking_cache = None
+        # Distingue as versões desta instância das de um processo anterior (versão recomeça em 0)
+        self.__ranking_epoch = uuid.uuid4().hex[:8]
     
     def create_game_session(self, player_name: str, difficulty: str = "normal") -> str:
         """
@@ -60,14 +110,29 @@ class WebGameManager:
             'difficulty': difficulty,
             'difficulty_settings': difficulty_settings,
             'game_running': False,
+            'winner': None,
+            'tick': 0,  # passos simulados (muda a cada alteração do estado)
+            # Streams de estado da sessão: acordados só quando ela muda ou é removida
+            'changed': threading.Condition(),
+            'watchers': 0,
+            'closed': False,
             'game_start_time': 0,
+            'steps': 0,  # passos simulados da partida atual (tempo de jogo = steps / tick_rate)
             'game_duration': 120,  # 2 minutos
             'created_at': datetime.now(),
+            'last_access': time.monotonic(),
             'width': 800,
             'height': 600
         }
         
-        self.__active_games[game_id] = game_session
+        with self.__lock:
+            self.__active_games[game_id] = game_session
+            # Limite rígido: descarta as sessões usadas há mais tempo
+            while len(self.__active_games) > self.__max_sessions:
+                _, evicted = self.__active_games.popitem(last=False)
+                self.__evicted_lru += 1
+                self.__close_session(evicted)
+        self.__ensure_reaper()
         return game_id
     
     def __get_difficulty_settings(self, difficulty: str) -> dict:
@@ -118,7 +183,13 @@ class WebGameManager:
         Returns:
             dict: Dados da sessão ou None
         """
-        return self.__active_games.get(game_id)
+        with self.__lock:
+            game = self.__active_games.get(game_id)
+            if game is not None:
+                # Marca o acesso: a sessão vai para o fim da fila de expiração
+                game['last_access'] = time.monotonic()
+                self.__active_games.move_to_end(game_id)
+            return game
     
     def get_game_state(self, game_id: str) -> dict:
         """
@@ -163,6 +234,8 @@ class WebGameManager:
             },
             'difficulty': game['difficulty'],
             'game_running': game['game_running'],
+            'winner': game['winner'],
+            'tick': game['tick'],
             'width': game['width'],
             'height': game['height']
         }
@@ -181,11 +254,18 @@ class WebGameManager:
         if not game:
             return False
         
-        game['game_running'] = True
-        game['game_start_time'] = datetime.now().timestamp()
-        game['player'].reset_score()
-        game['bot'].reset_score()
-        game['ball'].reset(game['width'] // 2, game['height'] // 2)
+        with self.__lock:
+            game['game_running'] = True
+            game['winner'] = None
+            game['game_start_time'] = datetime.now().timestamp()
+            game['steps'] = 0
+            game['player'].reset_score()
+            game['bot'].reset_score()
+            game['ball'].reset(game['width'] // 2, game['height'] // 2)
+            game['tick'] += 1
+            self.__games_running.set()
+            self.__notify_watchers(game)
+        self.__ensure_ticker()
         
         return True
     
@@ -204,10 +284,11 @@ class WebGameManager:
         if not game or not game['game_running']:
             return False
         
-        if direction == "up":
-            game['left_paddle'].move_up(game['height'])
-        elif direction == "down":
-            game['left_paddle'].move_down(game['height'])
+        with self.__lock:
+            if direction == "up":
+                game['left_paddle'].move_up(game['height'])
+            elif direction == "down":
+                game['left_paddle'].move_down(game['height'])
         
         return True
     
@@ -218,8 +299,280 @@ class WebGameManager:
         Args:
             game_id (str): ID da sessão
         """
-        if game_id in self.__active_games:
-            del self.__active_games[game_id]
+        with self.__lock:
+            game = self.__active_games.pop(game_id, None)
+            if game is not None:
+                self.__close_session(game)
+    
+    def wait_for_update(self, game_id: str, last_tick: int, timeout: float) -> bool:
+        """
+        Espera o estado do jogo mudar em relação ao último enviado ao cliente
+        
+        Args:
+            game_id (str): ID da sessão
+            last_tick (int): Valor de 'tick' já enviado (None = nenhum)
+            timeout (float): Máximo de segundos esperando
+            
+        Returns:
+            bool: True se o estado mudou (ou a sessão deixou de existir), False no timeout
+        """
+        with self.__lock:
+            game = self.__active_games.get(game_id)
+        if game is None:
+            return True
+        
+        # Espera na condição da própria sessão: passos de outros jogos não acordam este stream
+        changed = game['changed']
+        with changed:
+            game['watchers'] += 1
+            try:
+                return changed.wait_for(lambda: game['closed'] or game['tick'] != last_tick, timeout)
+            finally:
+                game['watchers'] -= 1
+    
+    @staticmethod
+    def __notify_watchers(game: dict):
+        """Acorda os streams da sessão (nada a fazer se ninguém a acompanha)"""
+        if game['watchers']:
+            with game['changed']:
+                game['changed'].notify_all()
+    
+    def __close_session(self, game: dict):
+        """Marca a sessão removida e encerra a espera dos seus streams"""
+        game['closed'] = True
+        self.__notify_watchers(game)
+    
+    # ---------------------- Expiração de sessões ----------------------
+    def __ensure_reaper(self):
+        """Inicia a thread de varredura na primeira sessão criada"""
+        if self.__reaper_thread is None or not self.__reaper_thread.is_alive():
+            with self.__lock:
+                if self.__reaper_thread is None or not self.__reaper_thread.is_alive():
+                    self.__stop_event.clear()
+                    self.__reaper_thread = threading.Thread(target=self.__reap_loop, daemon=True)
+                    self.__reaper_thread.start()
+    
+    def __reap_loop(self):
+        while not self.__stop_event.wait(self.__reap_interval):
+            try:
+                self.reap_idle_sessions()
+            except Exception as e:
+                print(f"Erro ao remover sessões ociosas: {e}")
+    
+    def reap_idle_sessions(self) -> int:
+        """
+        Remove as sessões sem acesso há mais de idle_ttl segundos
+        
+        Returns:
+            int: Quantidade de sessões removidas
+        """
+        deadline = time.monotonic() - self.__idle_ttl
+        removed = 0
+        with self.__lock:
+            # Ordem de acesso: basta olhar o início da fila até a primeira sessão recente
+            while self.__active_games:
+                game_id, game = next(iter(self.__active_games.items()))
+                if game['last_access'] > deadline:
+                    break
+                del self.__active_games[game_id]
+                self.__close_session(game)
+                removed += 1
+            self.__evicted_idle += removed
+        return removed
+    
+    # ---------------------- Simulação no servidor ----------------------
+    def __ensure_ticker(self):
+        """Inicia a thread de simulação no primeiro jogo iniciado"""
+        if self.__ticker_thread is None or not self.__ticker_thread.is_alive():
+            with self.__lock:
+                if self.__ticker_thread is None or not self.__ticker_thread.is_alive():
+                    self.__ticker_thread = threading.Thread(target=self.__tick_loop, daemon=True)
+                    self.__ticker_thread.start()
+    
+    def __tick_loop(self):
+        """Avança todos os jogos em passo fixo; dorme enquanto nenhum estiver rodando"""
+        interval = self.__tick_interval
+        next_tick = time.perf_counter()
+        while not self.__stop_event.is_set():
+            if not self.__games_running.is_set():
+                self.__games_running.wait()
+                next_tick = time.perf_counter()
+                continue
+            
+            now = time.perf_counter()
+            if now < next_tick:
+                self.__stop_event.wait(next_tick - now)
+                continue
+            # Atrasado: recupera alguns passos e descarta o resto (evita espiral)
+            steps = min(MAX_CATCH_UP_TICKS, int((now - next_tick) / interval) + 1)
+            next_tick = max(next_tick + steps * interval, now - interval)
+            try:
+                for _ in range(steps):
+                    self.tick()
+            except Exception as e:
+                print(f"Erro ao simular jogos: {e}")
+    
+    def tick(self) -> int:
+        """
+        Avança um passo de física em todos os jogos em andamento (uma única passada)
+        
+        Returns:
+            int: Quantidade de jogos simulados
+        """
+        finished = []
+        interval = self.__tick_interval
+        with self.__lock:
+            running = [game for game in self.__active_games.values() if game['game_running']]
+            if not running:
+                self.__games_running.clear()
+                return 0
+            step = self.__step_game
+            notify = self.__notify_watchers
+            for game in running:
+                if step(game, interval):
+                    finished.append(game)
+                notify(game)
+            self.__ticks += 1
+        
+        # Ranking gravado fora da trava (escrita em arquivo)
+        for game in finished:
+            player = game['player']
+            try:
+                self.__score_manager.add_score(player.name, player.score, won=game['winner'] == 'player')
+            except Exception as e:
+                print(f"Erro ao salvar pontuação: {e}")
+        return len(running)
+    
+    @staticmethod
+    def __step_game(game: dict, interval: float) -> bool:
+        """
+        Um passo da física do jogo desktop (IA, bola, colisões, pontuação)
+        
+        Args:
+            game (dict): Sessão em andamento
+            interval (float): Duração simulada de um passo (s), base do tempo limite
+            
+        Returns:
+            bool: True se a partida terminou neste passo
+        """
+        ball = game['ball']
+        left_paddle = game['left_paddle']
+        right_paddle = game['right_paddle']
+        width = game['width']
+        height = game['height']
+        game['tick'] += 1
+        game['steps'] += 1
+        
+        # IA: segue a bola com a chance de reação da dificuldade
+        diff = ball.y - right_paddle.center_y()
+        if abs(diff) > 5 and random.random() < game['difficulty_settings']['ai_difficulty']:
+            if diff > 0:
+                right_paddle.move_down(height)
+            else:
+                right_paddle.move_up(height)
+        
+        ball.move()
+        ball_x = ball.x
+        ball_y = ball.y
+        radius = ball.radius
+        
+        # Paredes
+        if ball_y <= radius:
+            ball.bounce_y()
+            ball.y = radius + 1
+        elif ball_y >= height - radius:
+            ball.bounce_y()
+            ball.y = height - radius - 1
+        
+        # Raquetes (face + correção quando a bola fica atrás, como no desktop)
+        epsilon = 5.0
+        left_edge = left_paddle.x + left_paddle.width
+        if (ball_y + radius >= left_paddle.y and ball_y - radius <= left_paddle.y + left_paddle.height and
+                left_paddle.x <= ball_x <= left_edge + radius * 2):
+            ball.bounce_paddle(left_paddle.y, left_paddle.height)
+            ball.force_direction_right()
+            ball.x = left_edge + radius + epsilon
+        right_edge = right_paddle.x
+        if (ball_y + radius >= right_paddle.y and ball_y - radius <= right_paddle.y + right_paddle.height and
+                right_edge - radius * 2 <= ball_x <= right_paddle.x + right_paddle.width):
+            ball.bounce_paddle(right_paddle.y, right_paddle.height)
+            ball.force_direction_left()
+            ball.x = right_edge - radius - epsilon
+        
+        # Pontuação
+        if ball_x < 0:
+            game['bot'].add_point()
+            ball.reset(width // 2, height // 2)
+        elif ball_x > width:
+            game['player'].add_point()
+            ball.reset(width // 2, height // 2)
+        
+        # Fim: primeiro a 3 pontos ou tempo limite (tempo simulado: independe de
+        # passos descartados pelo ticker e de ajustes no relógio do sistema)
+        player_score = game['player'].score
+        bot_score = game['bot'].score
+        if (player_score >= WINNING_SCORE or bot_score >= WINNING_SCORE or
+                game['steps'] * interval >= game['game_duration']):
+            if player_score > bot_score:
+                game['winner'] = 'player'
+            elif bot_score > player_score:
+                game['winner'] = 'bot'
+            else:
+                game['winner'] = 'draw'
+            game['game_running'] = False
+            return True
+        return False
+    
+    def shutdown(self):
+        """Encerra as threads de varredura e de simulação"""
+        self.__stop_event.set()
+        self.__games_running.set()  # acorda o ticker parado
+        for thread in (self.__reaper_thread, self.__ticker_thread):
+            if thread is not None:
+                thread.join()
+        self.__reaper_thread = None
+        self.__ticker_thread = None
+    
+    @property
+    def live_sessions(self) -> int:
+        """Retorna a quantidade de sessões em memória"""
+        return len(self.__active_games)
+    
+    def get_stats(self) -> dict:
+        """
+        Retorna os contadores das sessões
+        
+        Returns:
+            dict: Sessões vivas, limites e remoções por ociosidade/LRU
+        """
+        with self.__lock:
+            return {
+                'live_sessions': len(self.__active_games),
+                'max_sessions': self.__max_sessions,
+                'idle_ttl': self.__idle_ttl,
+                'evicted_idle': self.__evicted_idle,
+                'evicted_lru': self.__evicted_lru,
+                'running_games': sum(1 for game in self.__active_games.values() if game['game_running']),
+                'ticks': self.__ticks
+            }
+    
+    def get_ranking_payload(self) -> tuple:
+        """
+        Retorna o ranking serializado para a API, reaproveitado enquanto não mudar
+        
+        Returns:
+            tuple: (etag, corpo JSON em bytes)
+        """
+        score_manager = self.__score_manager
+        score_manager.refresh()
+        # Versão lida antes do ranking: no pior caso o corpo é mais novo que a etag
+        version = score_manager.version
+        cache = self.__ranking_cache
+        if cache is None or cache[0] != version:
+            body = json.dumps({'success': True, 'ranking': score_manager.get_ranking()}).encode('utf-8')
+            cache = (version, f"{self.__ranking_epoch}-{version}", body)
+            self.__ranking_cache = cache
+        return cache[1], cache[2]
     
     @property
     def score_manager(self) -> ScoreManager:
@@ -279,6 +632,42 @@ def get_game_state(game_id):
     
     return jsonify(state)
 
+@app.route('/api/game_stream/<game_id>')
+def stream_game_state(game_id):
+    """
+    Stream do estado do jogo (Server-Sent Events): um evento por mudança,
+    keep-alive periódico e retomada pelo cabeçalho Last-Event-ID
+    """
+    if not game_manager.get_game_state(game_id):
+        return jsonify({'error': 'Jogo não encontrado'}), 404
+    
+    # Reconexão do EventSource envia o último id recebido (o 'tick' do estado)
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        last_tick = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_tick = None
+    
+    def events():
+        tick = last_tick
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        while True:
+            if not game_manager.wait_for_update(game_id, tick, DEFAULT_HEARTBEAT):
+                yield ": keep-alive\n\n"
+                continue
+            # Sempre o estado mais recente: cliente lento pula passos em vez de acumular
+            state = game_manager.get_game_state(game_id)
+            if state is None:
+                yield "event: end\ndata: {}\n\n"
+                return
+            tick = state['tick']
+            yield f"id: {tick}\ndata: {json.dumps(state)}\n\n"
+    
+    response = Response(stream_with_context(events()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # sem buffer em proxy nginx
+    return response
+
 @app.route('/api/start_game/<game_id>', methods=['POST'])
 def start_game(game_id):
     """
@@ -292,17 +681,24 @@ def start_game(game_id):
 @app.route('/api/ranking')
 def get_ranking():
     """
-    API para obter ranking
+    API para obter ranking (ETag pela versão do ranking; If-None-Match responde 304)
     """
     try:
-        ranking = game_manager.score_manager.get_ranking()
-        return jsonify({
-            'success': True,
-            'ranking': ranking
-        })
+        etag, body = game_manager.get_ranking_payload()
+        response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'  # sempre revalida, sem baixar de novo
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/stats')
+def get_stats():
+    """
+    API com os contadores de sessões do servidor
+    """
+    return jsonify(game_manager.get_stats())
+
 @app.route('/api/paddle_move/<game_id>', methods=['POST'])
 def move_paddle(game_id):
     """
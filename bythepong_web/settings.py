@@ -75,6 +75,10 @@ if os.environ.get('USE_POSTGRES', 'false').lower() == 'true':
         }
     }
 
+# Exportação HTTP do histórico de partidas (api/export-sessions/): desligada por padrão;
+# quando ligada, só para usuários staff autenticados. O comando export_sessions não depende disso.
+EXPORT_SESSIONS_ENABLED = os.environ.get('EXPORT_SESSIONS_ENABLED', 'false').lower() == 'true'
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
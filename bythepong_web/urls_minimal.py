@@ -4,11 +4,29 @@ from django.shortcuts import render
 from django.views.decorators.csrf import csrf_exempt
 import json
 import random
-import time
+
+from game.clock import GameClock
+from game.input_log import InputLog
+from game.minimal_engine import create_game_state, update_game_state, create_planner
+from game.verification import MatchVerifier, ENGINE_MINIMAL
 
 # Estado global do jogo
 game_state = None
 
+# Relógio virtual da partida (um tick por update-game)
+game_clock = GameClock()
+
+# Previsão de trajetória do bot expert
+bot_planner = create_planner()
+
+# RNG da partida e log de entradas (semente + direções em run-length)
+game_rng = random.Random()
+game_log = None
+
+# Re-simulação do resultado no servidor antes de aceitá-lo
+match_verifier = MatchVerifier()
+VERIFICATION_TIMEOUT = 10
+
 def home(request):
     """Página inicial"""
     return render(request, 'game/home.html')
@@ -38,7 +56,7 @@ def ranking(request):
 @csrf_exempt
 def start_game(request):
     """API para iniciar jogo"""
-    global game_state
+    global game_state, game_log
     
     if request.method != 'POST':
         return HttpResponse('Method not allowed', status=405)
@@ -53,78 +71,15 @@ def start_game(request):
             return HttpResponse(json.dumps({'error': 'Nome obrigatório'}), 
                               content_type='application/json', status=400)
         
-        # Configurações baseadas na dificuldade - DIFERENÇAS EXTREMAS
-        difficulty_config = {
-            'fácil': {
-                'ball_speed': 3,        # BOLA MUITO LENTA
-                'ai_speed': 2,          # IA MUITO LENTA
-                'ai_reaction': 200,     # IA COM MUITO DELAY
-                'paddle_size': 150,     # RAQUETE GIGANTE
-                'player_speed': 12,     # JOGADOR SUPER RÁPIDO
-                'ai_accuracy': 0.5      # IA MUITO IMPRECISA
-            },
-            'normal': {
-                'ball_speed': 5,
-                'ai_speed': 4,
-                'ai_reaction': 80,
-                'paddle_size': 100,
-                'player_speed': 8,
-                'ai_accuracy': 0.75
-            },
-            'difícil': {
-                'ball_speed': 8,
-                'ai_speed': 8,
-                'ai_reaction': 20,
-                'paddle_size': 70,
-                'player_speed': 5,
-                'ai_accuracy': 0.9
-            },
-            'expert': {
-                'ball_speed': 12,       # BOLA ULTRA RÁPIDA
-                'ai_speed': 15,         # IA ULTRA RÁPIDA
-                'ai_reaction': 0,       # IA SEM DELAY
-                'paddle_size': 40,      # RAQUETE MINÚSCULA
-                'player_speed': 3,      # JOGADOR MUITO LENTO
-                'ai_accuracy': 0.99     # IA QUASE PERFEITA
-            }
-        }
-        
-        config = difficulty_config.get(difficulty, difficulty_config['normal'])
+        # Nova semente por partida: permite re-simular a partida na verificação
+        game_clock.reset()
+        bot_planner.invalidate()
+        game_seed = random.getrandbits(63)
+        game_rng.seed(game_seed)
+        game_log = InputLog(game_seed)
         
         # Criar estado do jogo com configurações de dificuldade
-        game_state = {
-            'canvas_width': 800,
-            'canvas_height': 600,
-            'theme': theme,
-            'left_paddle': {
-                'x': 50, 
-                'y': 300 - config['paddle_size'] // 2, 
-                'width': 15, 
-                'height': config['paddle_size']
-            },
-            'right_paddle': {
-                'x': 735, 
-                'y': 300 - config['paddle_size'] // 2, 
-                'width': 15, 
-                'height': config['paddle_size']
-            },
-            'ball': {
-                'x': 400, 
-                'y': 300, 
-                'radius': 10, 
-                'dx': config['ball_speed'], 
-                'dy': random.choice([-config['ball_speed']//2, config['ball_speed']//2])
-            },
-            'player_score': 0,
-            'bot_score': 0,
-            'game_over': False,
-            'winner': None,
-            'remaining_time': 120,
-            'difficulty': difficulty,
-            'config': config,
-            'start_time': time.time(),
-            'ai_last_move': 0  # Para controlar reação da IA
-        }
+        game_state = create_game_state(difficulty, theme, game_rng, game_clock.ticks)
         
         result = {
             'success': True,
@@ -155,154 +110,8 @@ def update_game(request):
         data = json.loads(request.body)
         direction = data.get('direction')
         
-        # Atualizar tempo
-        elapsed = time.time() - game_state['start_time']
-        game_state['remaining_time'] = max(0, 120 - int(elapsed))
-        
-        config = game_state['config']
-        
-        # Mover jogador com velocidade baseada na dificuldade
-        if direction == 'up':
-            game_state['left_paddle']['y'] = max(0, game_state['left_paddle']['y'] - config['player_speed'])
-        elif direction == 'down':
-            game_state['left_paddle']['y'] = min(600 - config['paddle_size'], game_state['left_paddle']['y'] + config['player_speed'])
-        
-        # IA DRAMATICAMENTE DIFERENTE por dificuldade
-        current_time = time.time() * 1000  # em milissegundos
-        if current_time - game_state['ai_last_move'] > config['ai_reaction']:
-            ball_y = game_state['ball']['y']
-            paddle_center = game_state['right_paddle']['y'] + config['paddle_size'] // 2
-            
-            if game_state['difficulty'] == 'fácil':
-                # FÁCIL: IA muito burra e lenta
-                if random.random() < 0.3:  # Só se move 30% das vezes
-                    if ball_y < paddle_center - 30:  # Margem grande
-                        game_state['right_paddle']['y'] = max(0, game_state['right_paddle']['y'] - config['ai_speed'])
-                    elif ball_y > paddle_center + 30:
-                        game_state['right_paddle']['y'] = min(600 - config['paddle_size'], game_state['right_paddle']['y'] + config['ai_speed'])
-                        
-            elif game_state['difficulty'] == 'normal':
-                # NORMAL: IA equilibrada
-                if random.random() < config['ai_accuracy']:
-                    if ball_y < paddle_center - 15:
-                        game_state['right_paddle']['y'] = max(0, game_state['right_paddle']['y'] - config['ai_speed'])
-                    elif ball_y > paddle_center + 15:
-                        game_state['right_paddle']['y'] = min(600 - config['paddle_size'], game_state['right_paddle']['y'] + config['ai_speed'])
-                        
-            elif game_state['difficulty'] == 'difícil':
-                # DIFÍCIL: IA rápida e precisa
-                if ball_y < paddle_center - 10:
-                    game_state['right_paddle']['y'] = max(0, game_state['right_paddle']['y'] - config['ai_speed'])
-                elif ball_y > paddle_center + 10:
-                    game_state['right_paddle']['y'] = min(600 - config['paddle_size'], game_state['right_paddle']['y'] + config['ai_speed'])
-                    
-            elif game_state['difficulty'] == 'expert':
-                # EXPERT: IA PERFEITA com previsão
-                # Prever onde a bola vai estar
-                ball_x = game_state['ball']['x']
-                ball_dx = game_state['ball']['dx']
-                if ball_dx > 0:  # Bola indo para direita
-                    # Calcular onde a bola vai estar quando chegar na raquete
-                    time_to_reach = (735 - ball_x) / ball_dx
-                    predicted_y = ball_y + (game_state['ball']['dy'] * time_to_reach)
-                    
-                    # Ajustar para margens do canvas
-                    if predicted_y < 0:
-                        predicted_y = -predicted_y
-                    elif predicted_y > 600:
-                        predicted_y = 1200 - predicted_y
-                    
-                    # IA vai para a posição predita
-                    if predicted_y < paddle_center - 5:
-                        game_state['right_paddle']['y'] = max(0, game_state['right_paddle']['y'] - config['ai_speed'])
-                    elif predicted_y > paddle_center + 5:
-                        game_state['right_paddle']['y'] = min(600 - config['paddle_size'], game_state['right_paddle']['y'] + config['ai_speed'])
-            
-            game_state['ai_last_move'] = current_time
-        
-        # Mover bola
-        game_state['ball']['x'] += game_state['ball']['dx']
-        game_state['ball']['y'] += game_state['ball']['dy']
-        
-        # Verificação de segurança: se a bola ficar presa, forçar movimento
-        if abs(game_state['ball']['dx']) < 0.1:
-            game_state['ball']['dx'] = config['ball_speed'] if game_state['ball']['dx'] >= 0 else -config['ball_speed']
-        
-        # Colisões com topo/fundo
-        if game_state['ball']['y'] <= 10 or game_state['ball']['y'] >= 590:
-            game_state['ball']['dy'] = -game_state['ball']['dy']
-        
-        # Colisão com raquete do jogador (esquerda) - CORRIGIDA
-        if (game_state['ball']['x'] - game_state['ball']['radius'] <= game_state['left_paddle']['x'] + game_state['left_paddle']['width'] and
-            game_state['ball']['x'] + game_state['ball']['radius'] >= game_state['left_paddle']['x'] and
-            game_state['ball']['y'] >= game_state['left_paddle']['y'] and 
-            game_state['ball']['y'] <= game_state['left_paddle']['y'] + config['paddle_size'] and
-            game_state['ball']['dx'] < 0):  # Só colide se estiver indo para a esquerda
-            
-            # Efeito de spin baseado na dificuldade
-            ball_center = game_state['ball']['y']
-            paddle_center = game_state['left_paddle']['y'] + config['paddle_size'] // 2
-            relative_intersect_y = (ball_center - paddle_center) / (config['paddle_size'] // 2)
-            
-            # Ajustar velocidade baseado na dificuldade
-            game_state['ball']['dx'] = abs(game_state['ball']['dx'])  # Mudar direção
-            game_state['ball']['dy'] = relative_intersect_y * config['ball_speed']
-            
-            # Garantir que a bola não fique presa
-            game_state['ball']['x'] = game_state['left_paddle']['x'] + game_state['left_paddle']['width'] + game_state['ball']['radius']
-            
-        # Colisão com raquete da IA (direita) - CORRIGIDA
-        if (game_state['ball']['x'] + game_state['ball']['radius'] >= game_state['right_paddle']['x'] and
-            game_state['ball']['x'] - game_state['ball']['radius'] <= game_state['right_paddle']['x'] + game_state['right_paddle']['width'] and
-            game_state['ball']['y'] >= game_state['right_paddle']['y'] and 
-            game_state['ball']['y'] <= game_state['right_paddle']['y'] + config['paddle_size'] and
-            game_state['ball']['dx'] > 0):  # Só colide se estiver indo para a direita
-            
-            # Efeito de spin baseado na dificuldade
-            ball_center = game_state['ball']['y']
-            paddle_center = game_state['right_paddle']['y'] + config['paddle_size'] // 2
-            relative_intersect_y = (ball_center - paddle_center) / (config['paddle_size'] // 2)
-            
-            # Ajustar velocidade baseado na dificuldade
-            game_state['ball']['dx'] = -abs(game_state['ball']['dx'])  # Mudar direção
-            game_state['ball']['dy'] = relative_intersect_y * config['ball_speed']
-            
-            # Garantir que a bola não fique presa
-            game_state['ball']['x'] = game_state['right_paddle']['x'] - game_state['ball']['radius']
-        
-        # Pontuação
-        if game_state['ball']['x'] < -50:  # Margem maior para evitar travamento
-            game_state['bot_score'] += 1
-            # Reset da bola com velocidade baseada na dificuldade
-            game_state['ball']['x'] = 400
-            game_state['ball']['y'] = 300
-            game_state['ball']['dx'] = random.choice([-config['ball_speed'], config['ball_speed']])
-            game_state['ball']['dy'] = random.choice([-config['ball_speed']//2, config['ball_speed']//2])
-        elif game_state['ball']['x'] > 850:  # Margem maior para evitar travamento
-            game_state['player_score'] += 1
-            # Reset da bola com velocidade baseada na dificuldade
-            game_state['ball']['x'] = 400
-            game_state['ball']['y'] = 300
-            game_state['ball']['dx'] = random.choice([-config['ball_speed'], config['ball_speed']])
-            game_state['ball']['dy'] = random.choice([-config['ball_speed']//2, config['ball_speed']//2])
-        
-        # Correção de emergência: se a bola ficar muito tempo atrás das raquetes
-        if (game_state['ball']['x'] < 0 or game_state['ball']['x'] > 800):
-            # Forçar reset da posição
-            game_state['ball']['x'] = 400
-            game_state['ball']['y'] = 300
-            game_state['ball']['dx'] = random.choice([-config['ball_speed'], config['ball_speed']])
-            game_state['ball']['dy'] = random.choice([-config['ball_speed']//2, config['ball_speed']//2])
-        
-        # Fim do jogo
-        if game_state['player_score'] >= 3 or game_state['bot_score'] >= 3 or game_state['remaining_time'] <= 0:
-            game_state['game_over'] = True
-            if game_state['player_score'] > game_state['bot_score']:
-                game_state['winner'] = 'player'
-            elif game_state['bot_score'] > game_state['player_score']:
-                game_state['winner'] = 'bot'
-            else:
-                game_state['winner'] = 'tie'
+        update_game_state(game_state, direction, game_clock, game_rng, bot_planner)
+        game_log.record(game_clock.ticks, direction)
         
         return HttpResponse(json.dumps({'success': True, 'game_state': game_state}), 
                           content_type='application/json')
@@ -324,6 +133,18 @@ def end_game(request):
                           content_type='application/json', status=400)
     
     try:
+        # Não confia no estado global: re-simula a partida a partir da semente e das entradas
+        try:
+            verification = match_verifier.verify({
+                'engine': ENGINE_MINIMAL,
+                'difficulty': game_state['difficulty'],
+                'input_log': game_log.to_bytes() if game_log else None,
+                'player_score': game_state['player_score'],
+                'bot_score': game_state['bot_score']
+            }, timeout=VERIFICATION_TIMEOUT)
+        except Exception as verify_error:
+            verification = {'verified': False, 'reason': str(verify_error)}
+        
         result = {
             'success': True,
             'final_score': {
@@ -331,7 +152,9 @@ def end_game(request):
                 'bot': game_state['bot_score']
             },
             'winner': game_state['winner'],
-            'won': game_state['winner'] == 'player'
+            'won': game_state['winner'] == 'player',
+            'verified': verification['verified'],
+            'verification_error': verification['reason']
         }
         
         game_state = None
@@ -0,0 +1,102 @@
+"""
+Classe FileLock - Trava exclusiva entre processos baseada em arquivo
+Implementa encapsulamento com atributos privados e métodos públicos
+"""
+
+import errno
+import os
+import threading
+import time
+
+# fcntl (POSIX) ou msvcrt (Windows): o que estiver disponível
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+class FileLock:
+    """
+    Trava exclusiva reentrante: entre processos via arquivo ``.lock`` e entre
+    threads do mesmo processo via RLock
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Caminho do arquivo de trava (criado se não existir)
+        """
+        self.__path = path
+        self.__thread_lock = threading.RLock()
+        self.__depth = 0
+        self.__handle = None
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def acquire(self):
+        """Adquire a trava (bloqueia até conseguir)"""
+        self.__thread_lock.acquire()
+        if self.__depth == 0:
+            try:
+                self.__handle = open(self.__path, 'a+b')
+                if fcntl is not None:
+                    fcntl.flock(self.__handle.fileno(), fcntl.LOCK_EX)
+                elif msvcrt is not None:
+                    self.__lock_windows()
+            except OSError:
+                if self.__handle is not None:
+                    self.__handle.close()
+                    self.__handle = None
+                self.__thread_lock.release()
+                raise
+        self.__depth += 1
+
+    def __lock_windows(self):
+        """
+        msvcrt.locking desiste após ~10 s (LK_LOCK): tenta de novo até conseguir,
+        com espera crescente, como o flock bloqueante do POSIX
+        """
+        delay = 0.01
+        while True:
+            self.__handle.seek(0)
+            try:
+                msvcrt.locking(self.__handle.fileno(), msvcrt.LK_NBLCK, 1)
+                return
+            except OSError as e:
+                if e.errno not in (errno.EACCES, errno.EDEADLK):
+                    raise
+            time.sleep(delay)
+            delay = min(delay * 2, 0.25)
+
+    def release(self):
+        """Libera a trava"""
+        self.__depth -= 1
+        if self.__depth == 0 and self.__handle is not None:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(self.__handle.fileno(), fcntl.LOCK_UN)
+                elif msvcrt is not None:
+                    self.__handle.seek(0)
+                    msvcrt.locking(self.__handle.fileno(), msvcrt.LK_UNLCK, 1)
+            finally:
+                self.__handle.close()
+                self.__handle = None
+        self.__thread_lock.release()
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def temp_path(path: str) -> str:
+    """Nome temporário exclusivo do processo/thread para gravação com os.replace"""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
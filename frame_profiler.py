@@ -0,0 +1,164 @@
+"""
+Classe FrameProfiler - Medição do tempo de cada fase do frame do jogo
+Implementa encapsulamento com atributos privados e métodos públicos
+"""
+
+import csv
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+# Fases medidas no loop do jogo, na ordem em que aparecem no overlay/CSV
+PHASES = ("input", "ai", "physics", "obstacles", "draw", "flip")
+
+
+class FrameProfiler:
+    def __init__(self, window: int = 120, phases: Tuple[str, ...] = PHASES):
+        """
+        Inicializa o profiler de frames
+
+        Args:
+            window (int): Quantidade de frames usada nas médias móveis
+            phases (Tuple[str, ...]): Nomes das fases medidas
+        """
+        if window <= 0:
+            raise ValueError("window deve ser positivo")
+        self.__phases = tuple(phases)
+        self.__phase_index = {phase: i for i, phase in enumerate(self.__phases)}
+        self.__window = deque(maxlen=window)
+        self.__totals = [0.0] * len(self.__phases)  # soma das fases na janela
+        self.__current = [0.0] * len(self.__phases)
+        self.__mark = 0.0
+        self.__frame_number = 0
+        self.__enabled = False
+        self.__recording = False
+        self.__samples: List[Tuple[float, ...]] = []
+
+    @property
+    def phases(self) -> Tuple[str, ...]:
+        """Retorna os nomes das fases medidas"""
+        return self.__phases
+
+    @property
+    def enabled(self) -> bool:
+        """True se as medições estão ativas (overlay visível ou gravação)"""
+        return self.__enabled or self.__recording
+
+    @property
+    def recording(self) -> bool:
+        """True se os frames estão sendo gravados para exportação"""
+        return self.__recording
+
+    @property
+    def sample_count(self) -> int:
+        """Retorna quantos frames foram gravados"""
+        return len(self.__samples)
+
+    def set_enabled(self, enabled: bool):
+        """Liga/desliga as medições para o overlay"""
+        self.__enabled = enabled
+        if not self.enabled:
+            self.reset()
+
+    def begin_frame(self):
+        """Inicia a medição de um novo frame"""
+        current = self.__current
+        for i in range(len(current)):
+            current[i] = 0.0
+        self.__mark = time.perf_counter()
+
+    def mark(self):
+        """Reinicia o cronômetro sem atribuir o tempo decorrido a nenhuma fase"""
+        self.__mark = time.perf_counter()
+
+    def lap(self, phase: str):
+        """
+        Atribui à fase o tempo decorrido desde a última marcação
+
+        Args:
+            phase (str): Nome da fase (acumula se chamada várias vezes no frame)
+        """
+        now = time.perf_counter()
+        self.__current[self.__phase_index[phase]] += now - self.__mark
+        self.__mark = now
+
+    def end_frame(self, physics_steps: int = 0):
+        """
+        Fecha o frame atual: atualiza as médias e grava a amostra se necessário
+
+        Args:
+            physics_steps (int): Passos de física executados no frame
+        """
+        sample = tuple(self.__current)
+        window = self.__window
+        totals = self.__totals
+        if len(window) == window.maxlen:
+            oldest = window[0]
+            for i, value in enumerate(oldest):
+                totals[i] -= value
+        window.append(sample)
+        for i, value in enumerate(sample):
+            totals[i] += value
+
+        self.__frame_number += 1
+        if self.__recording:
+            self.__samples.append((self.__frame_number, physics_steps) + sample)
+
+    def averages_ms(self) -> Dict[str, float]:
+        """
+        Retorna a média móvel de cada fase em milissegundos
+
+        Returns:
+            Dict[str, float]: fase -> milissegundos por frame
+        """
+        count = len(self.__window) or 1
+        return {phase: self.__totals[i] * 1000.0 / count for i, phase in enumerate(self.__phases)}
+
+    def frame_ms(self) -> float:
+        """Retorna a média móvel do tempo total medido por frame (ms)"""
+        count = len(self.__window) or 1
+        return sum(self.__totals) * 1000.0 / count
+
+    def worst_frame_ms(self) -> float:
+        """Retorna o pior frame da janela (ms)"""
+        if not self.__window:
+            return 0.0
+        return max(sum(sample) for sample in self.__window) * 1000.0
+
+    def reset(self):
+        """Descarta a janela de médias"""
+        self.__window.clear()
+        self.__totals = [0.0] * len(self.__phases)
+
+    def start_recording(self):
+        """Começa a gravar as amostras de cada frame"""
+        self.__samples = []
+        self.__recording = True
+
+    def stop_recording(self):
+        """Para a gravação (as amostras continuam disponíveis para exportação)"""
+        self.__recording = False
+        if not self.enabled:
+            self.reset()
+
+    def export_csv(self, path: Optional[str] = None) -> str:
+        """
+        Exporta as amostras gravadas em CSV (tempos em milissegundos)
+
+        Args:
+            path (Optional[str]): Caminho do arquivo (None gera um nome com data/hora)
+
+        Returns:
+            str: Caminho do arquivo gravado
+        """
+        if path is None:
+            path = time.strftime("frame_profile_%Y%m%d_%H%M%S.csv")
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame", "physics_steps") +
+                            tuple(f"{phase}_ms" for phase in self.__phases) + ("total_ms",))
+            for sample in self.__samples:
+                times = sample[2:]
+                writer.writerow(sample[:2] + tuple(f"{t * 1000.0:.4f}" for t in times) +
+                                (f"{sum(times) * 1000.0:.4f}",))
+        return path
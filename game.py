@@ -7,15 +7,21 @@ import pygame
 import sys
 import math
 import random
+import time
+import warnings
 from typing import Tuple, Optional
 from player import Player
 from ball import Ball
 from paddle import Paddle
 from score_manager import ScoreManager
 from responsive_utils import ResponsiveManager
+from text_cache import shared_text_cache
+from spatial_grid import SpatialGrid
+from frame_profiler import FrameProfiler
 
 class Game:
-    def __init__(self, width: int = None, height: int = None, difficulty: str = "normal"):
+    def __init__(self, width: int = None, height: int = None, difficulty: str = "normal",
+                 high_density_obstacles: bool = False):
         """
         Inicializa o jogo com dimensões da tela e dificuldade
         
@@ -23,6 +29,7 @@ class Game:
             width (int): Largura da tela (None para tela cheia)
             height (int): Altura da tela (None para tela cheia)
             difficulty (str): Nível de dificuldade ("fácil", "normal", "difícil", "expert")
+            high_density_obstacles (bool): Ativa o modo com centenas de obstáculos móveis
         """
         pygame.init()
         
@@ -31,11 +38,11 @@ class Game:
             info = pygame.display.Info()
             self.__width = info.current_w
             self.__height = info.current_h
-            self.__screen = pygame.display.set_mode((self.__width, self.__height), pygame.FULLSCREEN)
+            self.__screen = self.__set_display_mode((self.__width, self.__height), pygame.FULLSCREEN)
         else:
             self.__width = width
             self.__height = height
-            self.__screen = pygame.display.set_mode((width, height))
+            self.__screen = self.__set_display_mode((width, height))
         
         pygame.display.set_caption("ByThePong - Jogo Pong em Python")
         
@@ -43,6 +50,10 @@ class Game:
         self.__responsive = ResponsiveManager()
         self.__responsive.update_screen_size(self.__width, self.__height)
         
+        # Cache LRU de textos renderizados (descartado ao mudar a resolução)
+        self.__text_cache = shared_text_cache
+        self.__responsive.add_resize_listener(self.__text_cache.clear)
+        
         # Cores
         self.__BLACK = (0, 0, 0)
         self.__WHITE = (255, 255, 255)
@@ -101,16 +112,33 @@ class Game:
         )
         self.__score_manager = ScoreManager()
         
-        # Obstáculos (ativados para dificuldades elevadas)
+        # Obstáculos (ativados para dificuldades elevadas ou modo alta densidade)
         self.__obstacles = []  # lista de dicts: {rect: pygame.Rect, vx: int, vy: int}
-        if self.__difficulty_settings["obstacles_enabled"]:
-            self.__create_obstacles(self.__difficulty_settings["obstacles_count"], 
-                                    self.__difficulty_settings["obstacles_speed"])
+        self.__high_density_obstacles = high_density_obstacles
+        self.__dense_obstacles_count = 300
+        # Broad phase: grade uniforme atualizada incrementalmente em __update_obstacles
+        self.__obstacle_grid = SpatialGrid(max(16, self.__responsive.scale_width(64)))
+        # Retângulo da bola reutilizado a cada frame
+        self.__ball_rect = pygame.Rect(0, 0, 0, 0)
+        self.__spawn_obstacles()
+        
+        # Posições do passo de física anterior, usadas na interpolação do desenho
+        self.__previous_state = (self.__ball.x, self.__ball.y, self.__left_paddle.y, self.__right_paddle.y)
+        self.__previous_obstacles = []
         
         # Estado do jogo
         self.__game_running = False
         self.__clock = pygame.time.Clock()
-        self.__fps = 60
+        # Física em passo fixo; a renderização segue a taxa do monitor
+        self.__physics_rate = 60
+        self.__physics_dt = 1.0 / self.__physics_rate
+        self.__max_frame_time = 0.25  # limita o atraso acumulado (evita espiral de passos)
+        self.__accumulator = 0.0
+        self.__last_frame_time = None
+        self.__render_alpha = 1.0
+        # Limite da renderização quando o monitor não informa a taxa e não há vsync
+        self.__max_render_fps = 240
+        self.__fps = self.__detect_refresh_rate()
         self.__game_start_time = 0
         self.__game_duration = 120  # 2 minutos em segundos
         
@@ -124,6 +152,21 @@ class Game:
 
         # Área do botão de tela cheia (definida no draw)
         self.__fullscreen_button_rect = None
+        
+        # Renderização por retângulos sujos: fundo estático pré-desenhado,
+        # áreas do frame anterior e cache dos textos do HUD
+        self.__background = None
+        self.__background_key = None
+        self.__full_redraw = True
+        self.__previous_rects = []
+        self.__hud_items = {}  # chave -> (texto, surface, rect)
+        
+        # Profiler de frames: overlay (F3) e gravação em CSV (F4)
+        self.__profiler = FrameProfiler()
+        self.__show_profiler = False
+        self.__profiler_surface = None
+        self.__profiler_refresh_frames = 15  # o overlay é re-renderizado a cada N frames
+        self.__profiler_countdown = 0
     
     def __get_difficulty_settings(self) -> dict:
         """
@@ -239,10 +282,12 @@ class Game:
         )
         
         # Recria obstáculos a cada início
-        self.__obstacles.clear()
-        if self.__difficulty_settings["obstacles_enabled"]:
-            self.__create_obstacles(self.__difficulty_settings["obstacles_count"], 
-                                    self.__difficulty_settings["obstacles_speed"])
+        self.__spawn_obstacles()
+        
+        # Reinicia o acumulador de física (sem interpolar a partir da partida anterior)
+        self.__accumulator = 0.0
+        self.__last_frame_time = None
+        self.__snapshot_state()
     
     def stop_game(self):
         """Para o jogo"""
@@ -408,19 +453,20 @@ class Game:
     
     def __show_game_over_screen(self, winner: str):
         """Mostra a tela de fim de jogo"""
+        self.__full_redraw = True
         self.__screen.fill(self.__BLACK)
         
         # Título do fim de jogo
         if winner == "Jogador":
-            title_text = self.__font_large.render("VITÓRIA!", True, self.__GREEN)
+            title_text = self.__text_cache.render(self.__font_large, "VITÓRIA!", True, self.__GREEN)
         else:
-            title_text = self.__font_large.render("DERROTA!", True, self.__RED)
+            title_text = self.__text_cache.render(self.__font_large, "DERROTA!", True, self.__RED)
         
         title_rect = title_text.get_rect(center=(self.__width // 2, 150))
         self.__screen.blit(title_text, title_rect)
         
         # Placar final
-        score_text = self.__font_medium.render(f"Placar Final: {self.__player.score} x {self.__bot.score}", True, self.__WHITE)
+        score_text = self.__text_cache.render(self.__font_medium, f"Placar Final: {self.__player.score} x {self.__bot.score}", True, self.__WHITE)
         score_rect = score_text.get_rect(center=(self.__width // 2, 220))
         self.__screen.blit(score_text, score_rect)
         
@@ -432,7 +478,7 @@ class Game:
             message = f"Que pena {self.__player.name}! O Bot venceu!"
             color = self.__RED
         
-        message_text = self.__font_medium.render(message, True, color)
+        message_text = self.__text_cache.render(self.__font_medium, message, True, color)
         message_rect = message_text.get_rect(center=(self.__width // 2, 280))
         self.__screen.blit(message_text, message_rect)
         
@@ -442,7 +488,7 @@ class Game:
             "Pressione ESC para voltar ao menu"
         ]
         for i, instruction in enumerate(instructions):
-            text = self.__font_small.render(instruction, True, self.__GRAY)
+            text = self.__text_cache.render(self.__font_small, instruction, True, self.__GRAY)
             text_rect = text.get_rect(center=(self.__width // 2, 350 + i * 30))
             self.__screen.blit(text, text_rect)
         
@@ -463,88 +509,47 @@ class Game:
                         waiting = False
                         self.__game_running = False
     
-    def __draw(self):
-        """Desenha todos os elementos na tela"""
-        self.__screen.fill(self.__BLACK)
+    def __build_background(self):
+        """Pré-desenha os elementos estáticos (fundo, linha central, nomes, botão, instruções)"""
+        background = pygame.Surface((self.__width, self.__height)).convert()
+        background.fill(self.__BLACK)
         
         # Desenha linha central
-        pygame.draw.line(self.__screen, self.__GRAY, 
+        pygame.draw.line(background, self.__GRAY, 
                         (self.__width // 2, 0), (self.__width // 2, self.__height), 2)
         
-        # Desenha raquetes
-        pygame.draw.rect(self.__screen, self.__WHITE, self.__left_paddle.get_rect())
-        pygame.draw.rect(self.__screen, self.__WHITE, self.__right_paddle.get_rect())
-        
-        # Desenha obstáculos
-        if self.__obstacles:
-            self.__draw_obstacles()
-        
-        # Desenha bola
-        pygame.draw.circle(self.__screen, self.__WHITE, 
-                          (int(self.__ball.x), int(self.__ball.y)), self.__ball.radius)
-        
-        # Desenha placar com posicionamento responsivo
         margins = self.__responsive.margins
-        score_y = margins['large']
-        
-        # Pontuação do jogador (esquerda)
-        player_score_text = self.__font_large.render(str(self.__player.score), True, self.__GREEN)
-        player_score_x = self.__width // 2 - self.__responsive.scale_width(80)
-        self.__screen.blit(player_score_text, (player_score_x, score_y))
-        
-        # Separador do placar
-        separator_text = self.__font_large.render("x", True, self.__WHITE)
-        separator_x = self.__width // 2 - self.__responsive.scale_width(15)
-        self.__screen.blit(separator_text, (separator_x, score_y))
-        
-        # Pontuação do bot (direita)
-        bot_score_text = self.__font_large.render(str(self.__bot.score), True, self.__RED)
-        bot_score_x = self.__width // 2 + self.__responsive.scale_width(30)
-        self.__screen.blit(bot_score_text, (bot_score_x, score_y))
         
         # Desenha nomes e informações com posicionamento responsivo
         top_margin = margins['small']
         
         # Desenha nome do jogador
-        name_text = self.__font_medium.render(f"Jogador: {self.__player.name}", True, self.__GREEN)
-        self.__screen.blit(name_text, (margins['small'], top_margin))
+        name_text = self.__text_cache.render(self.__font_medium, f"Jogador: {self.__player.name}", True, self.__GREEN)
+        background.blit(name_text, (margins['small'], top_margin))
         
         # Desenha nome do bot
-        bot_name_text = self.__font_medium.render("Bot", True, self.__RED)
+        bot_name_text = self.__text_cache.render(self.__font_medium, "Bot", True, self.__RED)
         bot_name_width = bot_name_text.get_width()
-        self.__screen.blit(bot_name_text, (self.__width - bot_name_width - margins['small'], top_margin))
+        background.blit(bot_name_text, (self.__width - bot_name_width - margins['small'], top_margin))
         
         # Desenha dificuldade atual
-        difficulty_text = self.__font_small.render(f"Dificuldade: {self.__difficulty.title()}", True, self.__BLUE)
+        difficulty_text = self.__text_cache.render(self.__font_small, f"Dificuldade: {self.__difficulty.title()}", True, self.__BLUE)
         difficulty_y = top_margin + self.__responsive.scale_height(30)
-        self.__screen.blit(difficulty_text, (margins['small'], difficulty_y))
+        background.blit(difficulty_text, (margins['small'], difficulty_y))
         
         # Botão Tela Cheia (topo direito)
-        button_padding = self.__responsive.scale_width(10)
         button_w = self.__responsive.scale_width(150)
         button_h = self.__responsive.scale_height(36)
         button_x = self.__width - button_w - margins['small']
         button_y = margins['small']
         self.__fullscreen_button_rect = pygame.Rect(button_x, button_y, button_w, button_h)
-        pygame.draw.rect(self.__screen, self.__BUTTON_BG, self.__fullscreen_button_rect)
-        pygame.draw.rect(self.__screen, self.__BUTTON_BORDER, self.__fullscreen_button_rect, 2)
+        pygame.draw.rect(background, self.__BUTTON_BG, self.__fullscreen_button_rect)
+        pygame.draw.rect(background, self.__BUTTON_BORDER, self.__fullscreen_button_rect, 2)
         label = "Tela Cheia" if not (self.__screen.get_flags() & pygame.FULLSCREEN) else "Janela"
-        label_text = self.__font_small.render(label, True, self.__WHITE)
+        label_text = self.__text_cache.render(self.__font_small, label, True, self.__WHITE)
         label_rect = label_text.get_rect(center=self.__fullscreen_button_rect.center)
-        self.__screen.blit(label_text, label_rect)
+        background.blit(label_text, label_rect)
         
-        # Desenha tempo restante
-        if self.__game_running:
-            current_time = pygame.time.get_ticks() // 1000
-            elapsed_time = current_time - self.__game_start_time
-            remaining_time = max(0, self.__game_duration - elapsed_time)
-            minutes = remaining_time // 60
-            seconds = remaining_time % 60
-            time_text = self.__font_small.render(f"Tempo: {minutes:02d}:{seconds:02d}", True, self.__WHITE)
-            time_width = time_text.get_width()
-            time_y = difficulty_y
-            self.__screen.blit(time_text, (self.__width - time_width - margins['small'], time_y))
-    
         # Desenha instruções com posicionamento responsivo
         if not self.__game_running:
             instructions = [
@@ -556,26 +561,256 @@ class Game:
             instruction_start_y = self.__height - self.__responsive.scale_height(80)
             
             for i, instruction in enumerate(instructions):
-                text = self.__font_small.render(instruction, True, self.__GRAY)
+                text = self.__text_cache.render(self.__font_small, instruction, True, self.__GRAY)
                 y_pos = instruction_start_y + i * instruction_spacing
-                self.__screen.blit(text, (margins['small'], y_pos))
+                background.blit(text, (margins['small'], y_pos))
+        
+        self.__background = background
+        self.__background_key = (self.__width, self.__height, self.__game_running, self.__player.name)
+        self.__hud_items.clear()
+        self.__full_redraw = True
+    
+    def __hud_texts(self) -> list:
+        """Retorna os textos dinâmicos do HUD: (chave, texto, fonte, cor, posição)"""
+        margins = self.__responsive.margins
+        score_y = margins['large']
+        items = [
+            ("player_score", str(self.__player.score), self.__font_large, self.__GREEN,
+             (self.__width // 2 - self.__responsive.scale_width(80), score_y)),
+            ("separator", "x", self.__font_large, self.__WHITE,
+             (self.__width // 2 - self.__responsive.scale_width(15), score_y)),
+            ("bot_score", str(self.__bot.score), self.__font_large, self.__RED,
+             (self.__width // 2 + self.__responsive.scale_width(30), score_y)),
+        ]
+        
+        # Tempo restante (alinhado à direita, na linha da dificuldade)
+        if self.__game_running:
+            current_time = pygame.time.get_ticks() // 1000
+            elapsed_time = current_time - self.__game_start_time
+            remaining_time = max(0, self.__game_duration - elapsed_time)
+            minutes = remaining_time // 60
+            seconds = remaining_time % 60
+            time_y = margins['small'] + self.__responsive.scale_height(30)
+            items.append(("time", f"Tempo: {minutes:02d}:{seconds:02d}", self.__font_small, self.__WHITE,
+                          ("right", time_y)))
+        return items
+    
+    def __draw(self) -> Optional[list]:
+        """
+        Desenha o frame usando retângulos sujos
+        
+        Returns:
+            Optional[list]: Retângulos alterados, ou None quando a tela inteira foi redesenhada
+        """
+        screen = self.__screen
+        background_key = (self.__width, self.__height, self.__game_running, self.__player.name)
+        if self.__background is None or self.__background_key != background_key:
+            self.__build_background()
+        background = self.__background
+        
+        full_redraw = self.__full_redraw
+        if full_redraw:
+            screen.blit(background, (0, 0))
+            restored = []
+        else:
+            # Restaura o fundo onde ficaram os objetos do frame anterior
+            restored = self.__previous_rects
+            for rect in restored:
+                screen.blit(background, rect, rect)
+        update_rects = list(restored)
+        
+        # Remove do HUD itens que deixaram de existir (ex.: tempo ao parar o jogo)
+        hud_texts = self.__hud_texts()
+        active_keys = {item[0] for item in hud_texts}
+        for key in [k for k in self.__hud_items if k not in active_keys]:
+            old_rect = self.__hud_items.pop(key)[2]
+            if not full_redraw:
+                screen.blit(background, old_rect, old_rect)
+                update_rects.append(old_rect)
+        
+        # HUD: só re-renderiza quando o texto muda; apaga a área antiga
+        hud = []
+        for key, text, font, color, pos in hud_texts:
+            cached = self.__hud_items.get(key)
+            changed = cached is None or cached[0] != text
+            if changed:
+                surface = self.__text_cache.render(font, text, True, color)
+                if pos[0] == "right":
+                    pos = (self.__width - surface.get_width() - self.__responsive.margins['small'], pos[1])
+                rect = surface.get_rect(topleft=pos)
+                if cached is not None and not full_redraw:
+                    screen.blit(background, cached[2], cached[2])
+                    update_rects.append(cached[2])
+                self.__hud_items[key] = (text, surface, rect)
+            hud.append((changed, self.__hud_items[key]))
+        
+        # Objetos móveis: raquetes, obstáculos e bola, interpolados entre os dois
+        # últimos passos de física
+        alpha = self.__render_alpha
+        ball_x, ball_y, left_y, right_y = self.__previous_state
+        left_paddle = self.__left_paddle
+        right_paddle = self.__right_paddle
+        moving = [
+            pygame.draw.rect(screen, self.__WHITE,
+                             (left_paddle.x, round(left_y + (left_paddle.y - left_y) * alpha),
+                              left_paddle.width, left_paddle.height)),
+            pygame.draw.rect(screen, self.__WHITE,
+                             (right_paddle.x, round(right_y + (right_paddle.y - right_y) * alpha),
+                              right_paddle.width, right_paddle.height)),
+        ]
+        if self.__obstacles:
+            moving.extend(self.__draw_obstacles(alpha))
+        moving.append(pygame.draw.circle(screen, self.__WHITE, 
+                                         (int(ball_x + (self.__ball.x - ball_x) * alpha),
+                                          int(ball_y + (self.__ball.y - ball_y) * alpha)),
+                                         self.__ball.radius))
+        update_rects.extend(moving)
+        
+        # HUD por cima: redesenha o que mudou ou foi sobreposto por objetos/restauração
+        for changed, (_, surface, rect) in hud:
+            if full_redraw or changed or rect.collidelist(update_rects) != -1:
+                screen.blit(surface, rect)
+                update_rects.append(rect)
+        
+        # Overlay do profiler por último (restaurado no próximo frame como objeto móvel)
+        if self.__show_profiler:
+            overlay_rect = self.__draw_profiler_overlay()
+            moving.append(overlay_rect)
+            update_rects.append(overlay_rect)
+        
+        self.__previous_rects = moving
+        self.__full_redraw = False
+        if full_redraw:
+            return None
+        screen_rect = screen.get_rect()
+        return [rect.clip(screen_rect) for rect in update_rects]
+    
+    def __set_display_mode(self, size, flags: int = 0) -> pygame.Surface:
+        """
+        Cria a janela pedindo vsync (exige SCALED no pygame 2): com ele o flip
+        acompanha o monitor; sem suporte, cria a janela sem vsync
+        
+        Args:
+            size: (largura, altura)
+            flags (int): Flags do pygame (ex.: FULLSCREEN)
+            
+        Returns:
+            pygame.Surface: Superfície da tela
+        """
+        try:
+            # Sem renderizador acelerado o SDL avisa e o vsync não tem efeito
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                screen = pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+            self.__vsync = not caught
+        except pygame.error:
+            screen = pygame.display.set_mode(size, flags)
+            self.__vsync = False
+        return screen
+    
+    def __detect_refresh_rate(self) -> int:
+        """
+        Retorna o limite de quadros por segundo da renderização
+        
+        A taxa do monitor só pode ser lida no pygame-ce; sem ela a renderização
+        fica sem limite quando há vsync (o flip espera o monitor) ou limitada a
+        max_render_fps, nunca presa à taxa da física (60).
+        
+        Returns:
+            int: Quadros por segundo para clock.tick (0 = sem limite)
+        """
+        get_refresh_rate = getattr(pygame.display, "get_current_refresh_rate", None)
+        if get_refresh_rate is not None:
+            try:
+                rate = get_refresh_rate()
+            except pygame.error:
+                rate = 0
+            if rate > 0:
+                return rate
+        return 0 if self.__vsync else self.__max_render_fps
+    
+    def __snapshot_state(self):
+        """Guarda as posições atuais como estado anterior para a interpolação"""
+        self.__previous_state = (self.__ball.x, self.__ball.y, self.__left_paddle.y, self.__right_paddle.y)
+        previous_obstacles = self.__previous_obstacles
+        if len(previous_obstacles) != len(self.__obstacles):
+            previous_obstacles[:] = [obs["rect"].topleft for obs in self.__obstacles]
+        else:
+            for index, obs in enumerate(self.__obstacles):
+                previous_obstacles[index] = obs["rect"].topleft
+    
+    def __step_physics(self):
+        """Avança a simulação em um passo fixo de física"""
+        profiler = self.__profiler if self.__profiler.enabled else None
+        self.__snapshot_state()
+        self.__handle_input()
+        if profiler:
+            profiler.lap("input")
+        self.__update_ai()
+        if profiler:
+            profiler.lap("ai")
+        # Aceleração diferenciada por nível
+        acceleration_factor = self.__difficulty_settings["acceleration_factor"]
+        if acceleration_factor > 1.0:
+            self.__ball.accelerate(acceleration_factor)
+        self.__ball.move()
+        if profiler:
+            profiler.lap("physics")
+        if self.__obstacles:
+            self.__update_obstacles()
+            if profiler:
+                profiler.lap("obstacles")
+        self.__check_collisions()
+        if profiler:
+            profiler.lap("physics")
+        
+        # Bola recolocada no centro (ponto marcado): não interpola o salto
+        if self.__ball.prev_x == self.__ball.x and self.__ball.prev_y == self.__ball.y:
+            ball_x, ball_y = self.__ball.x, self.__ball.y
+            _, _, left_y, right_y = self.__previous_state
+            self.__previous_state = (ball_x, ball_y, left_y, right_y)
     
     def update(self):
-        """Atualiza o estado do jogo"""
+        """Atualiza o estado do jogo (física em passo fixo) e desenha um frame interpolado"""
+        profiler = self.__profiler if self.__profiler.enabled else None
+        if profiler:
+            profiler.begin_frame()
+        
+        now = time.perf_counter()
+        if self.__last_frame_time is None:
+            frame_time = 0.0
+        else:
+            # Máquinas lentas executam vários passos por frame (até o limite de atraso)
+            frame_time = min(now - self.__last_frame_time, self.__max_frame_time)
+        self.__last_frame_time = now
+        
+        steps = 0
         if self.__game_running:
-            self.__handle_input()
-            self.__update_ai()
-            # Aceleração diferenciada por nível
-            acceleration_factor = self.__difficulty_settings["acceleration_factor"]
-            if acceleration_factor > 1.0:
-                self.__ball.accelerate(acceleration_factor)
-            self.__ball.move()
-            if self.__obstacles:
-                self.__update_obstacles()
-            self.__check_collisions()
-        
-        self.__draw()
-        pygame.display.flip()
+            self.__accumulator += frame_time
+            dt = self.__physics_dt
+            while self.__accumulator >= dt and self.__game_running:
+                self.__accumulator -= dt
+                self.__step_physics()
+                steps += 1
+        
+        if self.__game_running:
+            self.__render_alpha = self.__accumulator / self.__physics_dt
+        else:
+            self.__accumulator = 0.0
+            self.__render_alpha = 1.0
+        
+        if profiler:
+            profiler.mark()
+        dirty_rects = self.__draw()
+        if profiler:
+            profiler.lap("draw")
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+        if profiler:
+            profiler.lap("flip")
+            profiler.end_frame(steps)
         self.__clock.tick(self.__fps)
     
     def handle_events(self) -> bool:
@@ -594,6 +829,10 @@ class Game:
                 elif event.key == pygame.K_F11:
                     # Alternar entre tela cheia e janela
                     self.__toggle_fullscreen()
+                elif event.key == pygame.K_F3:
+                    self.__toggle_profiler_overlay()
+                elif event.key == pygame.K_F4:
+                    self.__toggle_profiler_recording()
                 elif event.key == pygame.K_SPACE and not self.__game_running:
                     self.start_game()
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -606,7 +845,7 @@ class Game:
         """Alterna entre tela cheia e modo janela e atualiza responsividade"""
         if self.__screen.get_flags() & pygame.FULLSCREEN:
             # Sai da tela cheia
-            self.__screen = pygame.display.set_mode((800, 600))
+            self.__screen = self.__set_display_mode((800, 600))
             self.__width = 800
             self.__height = 600
         else:
@@ -614,13 +853,69 @@ class Game:
             info = pygame.display.Info()
             self.__width = info.current_w
             self.__height = info.current_h
-            self.__screen = pygame.display.set_mode((self.__width, self.__height), pygame.FULLSCREEN)
+            self.__screen = self.__set_display_mode((self.__width, self.__height), pygame.FULLSCREEN)
         
         # Atualiza responsividade e fontes após alternar
         self.__responsive.update_screen_size(self.__width, self.__height)
         self.__font_large = pygame.font.Font(None, self.__responsive.scale_font_size(74))
         self.__font_medium = pygame.font.Font(None, self.__responsive.scale_font_size(36))
         self.__font_small = pygame.font.Font(None, self.__responsive.scale_font_size(24))
+        
+        # Nova superfície de tela: fundo e HUD precisam ser refeitos
+        self.__background = None
+        self.__fps = self.__detect_refresh_rate()
+    
+    # ---------------------- Profiler ----------------------
+    def __toggle_profiler_overlay(self):
+        """Mostra/oculta o overlay com os tempos de cada fase do frame"""
+        self.__show_profiler = not self.__show_profiler
+        self.__profiler.set_enabled(self.__show_profiler)
+        self.__profiler_surface = None
+        self.__profiler_countdown = 0
+    
+    def __toggle_profiler_recording(self):
+        """Inicia a gravação dos frames ou encerra e exporta para CSV"""
+        if self.__profiler.recording:
+            self.__profiler.stop_recording()
+            try:
+                path = self.__profiler.export_csv()
+                print(f"Perfil de frames salvo em {path} ({self.__profiler.sample_count} frames)")
+            except OSError as e:
+                print(f"Erro ao salvar perfil de frames: {e}")
+        else:
+            self.__profiler.start_recording()
+            print("Gravando perfil de frames (F4 para parar e exportar)")
+    
+    def __render_profiler_overlay(self) -> pygame.Surface:
+        """Renderiza o painel com as médias móveis do profiler"""
+        profiler = self.__profiler
+        lines = [f"Frame: {profiler.frame_ms():.2f} ms (pior {profiler.worst_frame_ms():.2f} ms)"]
+        lines.extend(f"{phase}: {ms:.2f} ms" for phase, ms in profiler.averages_ms().items())
+        if profiler.recording:
+            lines.append(f"REC {profiler.sample_count} frames")
+        
+        # Valores mudam a todo momento: renderiza direto, sem passar pelo cache de textos
+        texts = [self.__font_small.render(line, True, self.__WHITE) for line in lines]
+        padding = self.__responsive.margins['small'] // 2 + 2
+        width = max(text.get_width() for text in texts) + padding * 2
+        height = sum(text.get_height() for text in texts) + padding * 2
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 180))
+        y = padding
+        for text in texts:
+            surface.blit(text, (padding, y))
+            y += text.get_height()
+        return surface.convert_alpha()
+    
+    def __draw_profiler_overlay(self) -> pygame.Rect:
+        """Desenha o overlay do profiler e retorna a área ocupada"""
+        if self.__profiler_surface is None or self.__profiler_countdown <= 0:
+            self.__profiler_surface = self.__render_profiler_overlay()
+            self.__profiler_countdown = self.__profiler_refresh_frames
+        self.__profiler_countdown -= 1
+        margins = self.__responsive.margins
+        position = (margins['small'], margins['small'] + self.__responsive.scale_height(60))
+        return self.__screen.blit(self.__profiler_surface, position)
     
     def quit(self):
         """Finaliza o jogo e limpa recursos"""
@@ -628,6 +923,36 @@ class Game:
         sys.exit()
 
     # ---------------------- Obstáculos ----------------------
+    def __spawn_obstacles(self):
+        """Recria os obstáculos conforme a dificuldade/modo e reindexa a grade"""
+        self.__obstacles.clear()
+        self.__obstacle_grid.clear()
+        if self.__high_density_obstacles:
+            self.__create_dense_obstacles(self.__dense_obstacles_count,
+                                          max(2, self.__difficulty_settings["obstacles_speed"] // 2))
+        elif self.__difficulty_settings["obstacles_enabled"]:
+            self.__create_obstacles(self.__difficulty_settings["obstacles_count"], 
+                                    self.__difficulty_settings["obstacles_speed"])
+        for index, obs in enumerate(self.__obstacles):
+            self.__obstacle_grid.insert(index, obs["rect"])
+    
+    def __obstacle_zone(self) -> Tuple[int, int]:
+        """Faixa horizontal onde obstáculos podem circular (longe das raquetes)"""
+        return self.__width // 5, self.__width - self.__width // 5
+    
+    def __create_dense_obstacles(self, count: int, speed: int):
+        """Cria muitos obstáculos pequenos espalhados pela faixa central da arena"""
+        width = max(4, self.__responsive.scale_width(12))
+        height = max(4, self.__responsive.scale_height(24))
+        zone_left, zone_right = self.__obstacle_zone()
+        for _ in range(count):
+            x = random.randint(zone_left, max(zone_left, zone_right - width))
+            y = random.randint(0, max(0, self.__height - height))
+            rect = pygame.Rect(x, y, width, height)
+            vx = random.choice([-1, 0, 1]) * random.randint(1, speed)
+            vy = random.choice([-1, 1]) * random.randint(1, speed)
+            self.__obstacles.append({"rect": rect, "vx": vx, "vy": vy})
+    
     def __create_obstacles(self, count: int, speed: int):
         """Cria obstáculos retangulares móveis no centro da arena"""
         width = self.__responsive.scale_width(20)
@@ -644,8 +969,10 @@ class Game:
             self.__obstacles.append({"rect": rect, "vx": vx, "vy": vy})
     
     def __update_obstacles(self):
-        """Atualiza a posição dos obstáculos e rebate nas bordas"""
-        for obs in self.__obstacles:
+        """Atualiza a posição dos obstáculos, rebate nas bordas e atualiza a grade"""
+        grid = self.__obstacle_grid
+        zone_left, zone_right = self.__obstacle_zone()
+        for index, obs in enumerate(self.__obstacles):
             rect = obs["rect"]
             rect.x += obs["vx"]
             rect.y += obs["vy"]
@@ -654,16 +981,41 @@ class Game:
                 # leve aleatoriedade
                 if random.random() < 0.2:
                     obs["vy"] += 1 if obs["vy"] > 0 else -1
+            if obs["vx"] and (rect.left <= zone_left or rect.right >= zone_right):
+                obs["vx"] = -obs["vx"]
+            grid.update(index, rect)
     
-    def __draw_obstacles(self):
-        for obs in self.__obstacles:
-            pygame.draw.rect(self.__screen, self.__OBSTACLE, obs["rect"])
+    def __draw_obstacles(self, alpha: float = 1.0) -> list:
+        """
+        Desenha os obstáculos interpolados e retorna as áreas alteradas
+        
+        Args:
+            alpha (float): Fração do passo de física entre o estado anterior e o atual
+        """
+        screen = self.__screen
+        color = self.__OBSTACLE
+        previous = self.__previous_obstacles
+        if alpha >= 1.0 or len(previous) != len(self.__obstacles):
+            return [pygame.draw.rect(screen, color, obs["rect"]) for obs in self.__obstacles]
+        rects = []
+        for (prev_x, prev_y), obs in zip(previous, self.__obstacles):
+            rect = obs["rect"]
+            rects.append(pygame.draw.rect(screen, color,
+                                          (round(prev_x + (rect.x - prev_x) * alpha),
+                                           round(prev_y + (rect.y - prev_y) * alpha),
+                                           rect.width, rect.height)))
+        return rects
     
     def __check_obstacle_collisions(self):
         """Detecta colisões da bola com obstáculos e ajusta direção/velocidade"""
-        bx, by, bw, bh = self.__ball.get_rect()
-        ball_rect = pygame.Rect(bx, by, bw, bh)
-        for obs in self.__obstacles:
+        ball_rect = self.__ball_rect
+        ball_rect.update(self.__ball.get_rect())
+        candidates = self.__obstacle_grid.query(ball_rect)
+        if not candidates:
+            return
+        # Mantém a ordem original da lista para o primeiro obstáculo atingido
+        for index in sorted(candidates):
+            obs = self.__obstacles[index]
             rect = obs["rect"]
             if ball_rect.colliderect(rect):
                 # Decide eixo do rebote pela menor penetração
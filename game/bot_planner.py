@@ -0,0 +1,114 @@
+"""
+Planejador de trajetória para a IA do bot
+Calcula onde a bola cruza o plano da raquete, com quantos rebotes forem
+necessários, e reutiliza a previsão enquanto a trajetória não muda
+"""
+
+from typing import Optional
+
+
+class BotPlanner:
+    """Planejador de trajetória com cache e encapsulamento
+
+    Os rebotes nas paredes são tratados "desdobrando" o campo: a bola segue
+    uma reta num espaço espelhado e a posição real é obtida dobrando a
+    coordenada y de volta para o intervalo [top, bottom]. Assim a previsão
+    custa O(1) independentemente do número de rebotes, e só é refeita quando
+    a bola sai da reta prevista (rebote na raquete, reset, mudança de
+    velocidade).
+    """
+
+    def __init__(self, top: float, bottom: float, target_x: float):
+        """
+        Args:
+            top (float): Menor y possível para o centro da bola
+            bottom (float): Maior y possível para o centro da bola
+            target_x (float): Coordenada x do plano da raquete do bot
+        """
+        self.__top = top
+        self.__bottom = bottom
+        self.__period = 2 * (bottom - top)
+        self.__target_x = target_x
+
+        # Trajetória em cache (no espaço desdobrado)
+        self.__origin_x = None
+        self.__origin_u = 0.0
+        self.__slope = 0.0
+        self.__tolerance = 0.0
+        self.__predicted_y = None
+
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def target_x(self) -> float:
+        return self.__target_x
+
+    @property
+    def hits(self) -> int:
+        """Quantidade de previsões atendidas pelo cache"""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Quantidade de previsões recalculadas"""
+        return self.__misses
+
+    def set_target_x(self, target_x: float):
+        """Altera o plano da raquete e descarta o cache"""
+        self.__target_x = target_x
+        self.invalidate()
+
+    def invalidate(self):
+        """Descarta a trajetória em cache (ex.: após reset da bola)"""
+        self.__origin_x = None
+        self.__predicted_y = None
+
+    def __fold(self, u: float) -> float:
+        """Converte uma coordenada desdobrada para y real no campo"""
+        if self.__period <= 0:
+            return self.__top
+        t = (u - self.__top) % self.__period
+        if t > self.__period / 2:
+            t = self.__period - t
+        return self.__top + t
+
+    def __is_on_cached_path(self, x: float, y: float, dx: float, dy: float) -> bool:
+        """Verifica se a bola ainda está sobre a trajetória em cache"""
+        if self.__origin_x is None:
+            return False
+        # Rebote na parede só inverte o sinal da inclinação
+        slope = dy / dx
+        if abs(slope - self.__slope) > 1e-9 and abs(slope + self.__slope) > 1e-9:
+            return False
+        expected_y = self.__fold(self.__origin_u + self.__slope * (x - self.__origin_x))
+        return abs(expected_y - y) <= self.__tolerance
+
+    def predict(self, x: float, y: float, dx: float, dy: float) -> Optional[float]:
+        """
+        Retorna o y em que a bola cruzará o plano da raquete
+
+        Args:
+            x (float): Posição X atual da bola
+            y (float): Posição Y atual da bola
+            dx (float): Velocidade horizontal
+            dy (float): Velocidade vertical
+
+        Returns:
+            Optional[float]: y previsto, ou None se a bola está se afastando
+        """
+        if dx == 0 or (self.__target_x - x) * dx <= 0:
+            return None
+
+        if self.__is_on_cached_path(x, y, dx, dy):
+            self.__hits += 1
+            return self.__predicted_y
+
+        self.__misses += 1
+        self.__origin_x = x
+        self.__origin_u = y
+        self.__slope = dy / dx
+        # Margem para o arredondamento/clamp que o motor aplica nas paredes
+        self.__tolerance = abs(dy) + 1.0
+        self.__predicted_y = self.__fold(y + self.__slope * (self.__target_x - x))
+        return self.__predicted_y
@@ -0,0 +1,81 @@
+"""
+Relógio virtual do jogo baseado em ticks
+Substitui chamadas ao relógio do sistema dentro dos motores de jogo
+"""
+
+from typing import Dict, Any
+
+
+class GameClock:
+    """Relógio virtual baseado em ticks com encapsulamento
+
+    Cada chamada a ``tick()`` avança o tempo em ``1 / tick_rate`` segundos.
+    Como o tempo não depende do relógio do sistema, partidas podem ser
+    pausadas, retomadas ou re-simuladas na velocidade da CPU.
+    """
+
+    def __init__(self, tick_rate: int = 60):
+        if tick_rate <= 0:
+            raise ValueError("tick_rate deve ser positivo")
+        self.__tick_rate = tick_rate
+        self.__ticks = 0
+        self.__paused = False
+
+    @property
+    def tick_rate(self) -> int:
+        return self.__tick_rate
+
+    @property
+    def ticks(self) -> int:
+        return self.__ticks
+
+    @property
+    def paused(self) -> bool:
+        return self.__paused
+
+    @property
+    def elapsed(self) -> float:
+        """Tempo virtual decorrido em segundos"""
+        return self.__ticks / self.__tick_rate
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Tempo virtual decorrido em milissegundos"""
+        return self.__ticks * 1000 / self.__tick_rate
+
+    def tick(self, steps: int = 1) -> int:
+        """Avança o relógio (ignorado enquanto pausado)"""
+        if not self.__paused:
+            self.__ticks += steps
+        return self.__ticks
+
+    def pause(self):
+        """Pausa o relógio"""
+        self.__paused = True
+
+    def resume(self):
+        """Retoma o relógio"""
+        self.__paused = False
+
+    def fast_forward(self, seconds: float) -> int:
+        """Avança o relógio em ``seconds`` segundos virtuais, mesmo pausado"""
+        if seconds > 0:
+            self.__ticks += int(round(seconds * self.__tick_rate))
+        return self.__ticks
+
+    def seconds_since(self, tick: int) -> float:
+        """Segundos virtuais decorridos desde um tick de referência"""
+        return (self.__ticks - tick) / self.__tick_rate
+
+    def reset(self):
+        """Zera o relógio e remove a pausa"""
+        self.__ticks = 0
+        self.__paused = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para dicionário"""
+        return {
+            'tick_rate': self.__tick_rate,
+            'ticks': self.__ticks,
+            'paused': self.__paused
+        }
@@ -1,17 +1,22 @@
 import random
-import time
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
+
+from .clock import GameClock
+from .bot_planner import BotPlanner
+from .multi_ball import BallArray
+from .input_log import InputLog
 
 class Ball:
     """Classe para a bola do jogo com encapsulamento"""
     
-    def __init__(self, x: int, y: int, radius: int = 10):
+    def __init__(self, x: int, y: int, radius: int = 10, rng: Optional[random.Random] = None):
         self.__x = x
         self.__y = y
         self.__radius = radius
         self.__dx = 0
         self.__dy = 0
         self.__speed = 5
+        self.__rng = rng if rng is not None else random.Random()
     
     @property
     def x(self) -> int:
@@ -60,8 +65,8 @@ class Ball:
         """Reseta a bola para o centro"""
         self.__x = center_x
         self.__y = center_y
-        self.__dx = random.choice([-self.__speed, self.__speed])
-        self.__dy = random.choice([-self.__speed, self.__speed])
+        self.__dx = self.__rng.choice([-self.__speed, self.__speed])
+        self.__dy = self.__rng.choice([-self.__speed, self.__speed])
     
     def to_dict(self) -> Dict[str, Any]:
         """Converte para dicionário"""
@@ -123,13 +128,21 @@ class Paddle:
 class Game:
     """Classe principal do jogo com encapsulamento"""
     
-    def __init__(self, width: int = 800, height: int = 600, difficulty: str = 'normal'):
+    def __init__(self, width: int = 800, height: int = 600, difficulty: str = 'normal',
+                 clock: Optional[GameClock] = None, ball_count: int = 1,
+                 seed: Optional[int] = None):
         self.__width = width
         self.__height = height
         self.__difficulty = difficulty
         self.__player_score = 0
         self.__bot_score = 0
-        self.__game_start_time = None
+        # Relógio virtual: um tick por update (60 ticks/s por padrão)
+        self.__clock = clock if clock is not None else GameClock()
+        self.__game_start_tick = None
+        # RNG próprio da partida: mesma semente + mesmas entradas = mesmo resultado
+        self.__seed = seed if seed is not None else random.getrandbits(63)
+        self.__rng = random.Random(self.__seed)
+        self.__input_log = InputLog(self.__seed)
         self.__game_duration = 120  # 2 minutos
         self.__game_over = False
         self.__winner = None
@@ -138,7 +151,7 @@ class Game:
         self.__difficulty_settings = self.__get_difficulty_settings()
         
         # Inicializar objetos do jogo
-        self.__ball = Ball(width // 2, height // 2)
+        self.__ball = Ball(width // 2, height // 2, rng=self.__rng)
         # Ajuste de tamanho de raquete por dificuldade
         if difficulty == 'expert':
             left_w, left_h = 10, self.__ball.radius * 2   # jogador pequeno
@@ -158,6 +171,20 @@ class Game:
             self.__difficulty_settings['ball_speed'],
             self.__difficulty_settings['ball_speed']
         )
+        
+        # Previsão de trajetória em cache para o bot expert
+        self.__bot_planner = BotPlanner(
+            self.__ball.radius,
+            height - self.__ball.radius,
+            self.__right_paddle.x - self.__ball.radius
+        )
+        
+        # Modo multi-bola: todas as bolas em arrays contíguos, atualizadas em lote
+        self.__balls = None
+        if ball_count > 1:
+            self.__balls = BallArray(ball_count, self.__ball.radius,
+                                     self.__difficulty_settings['ball_speed'], rng=self.__rng)
+            self.__balls.reset_all(width // 2, height // 2)
     
     def __get_difficulty_settings(self) -> Dict[str, int]:
         """Retorna configurações baseadas na dificuldade"""
@@ -197,20 +224,46 @@ class Game:
     def difficulty(self) -> str:
         return self.__difficulty
     
+    @property
+    def clock(self) -> GameClock:
+        return self.__clock
+    
+    @property
+    def seed(self) -> int:
+        return self.__seed
+    
+    @property
+    def input_log(self) -> InputLog:
+        return self.__input_log
+    
+    @property
+    def ball_count(self) -> int:
+        return self.__balls.count if self.__balls else 1
+    
     def start_game(self):
         """Inicia o jogo"""
-        self.__game_start_time = time.time()
+        self.__game_start_tick = self.__clock.ticks
+        self.__input_log = InputLog(self.__seed)
         self.__game_over = False
         self.__winner = None
         self.__player_score = 0
         self.__bot_score = 0
         self.__ball.reset(self.__width // 2, self.__height // 2)
+        self.__bot_planner.invalidate()
+        if self.__balls:
+            self.__balls.reset_all(self.__width // 2, self.__height // 2)
     
     def update(self, player_direction: str = None):
         """Atualiza o estado do jogo"""
         if self.__game_over:
             return
         
+        # Avançar relógio virtual
+        self.__clock.tick()
+        
+        # Registrar entrada (run-length, custo O(1) por tick)
+        self.__input_log.record(self.__clock.ticks, player_direction)
+        
         # Mover jogador
         if player_direction == 'up':
             self.__left_paddle.move_up()
@@ -220,14 +273,22 @@ class Game:
         # IA do bot
         self.__update_bot()
         
-        # Mover bola
-        self.__ball.move()
-        
-        # Verificar colisões
-        self.__check_collisions()
-        
-        # Verificar pontuação
-        self.__check_scoring()
+        if self.__balls:
+            # Multi-bola: movimento, colisões e pontuação em um único passo em lote
+            player_points, bot_points = self.__balls.step(
+                self.__width, self.__height, self.__left_paddle, self.__right_paddle
+            )
+            self.__player_score += player_points
+            self.__bot_score += bot_points
+        else:
+            # Mover bola
+            self.__ball.move()
+            
+            # Verificar colisões
+            self.__check_collisions()
+            
+            # Verificar pontuação
+            self.__check_scoring()
         
         # Verificar fim do jogo
         self.__check_game_over()
@@ -235,7 +296,20 @@ class Game:
     def __update_bot(self):
         """Atualiza a IA do bot"""
         bot_center = self.__right_paddle.y + self.__right_paddle.height // 2
-        ball_y = self.__ball.y
+        ball_x, ball_y, ball_dx, ball_dy = self.__ball.x, self.__ball.y, self.__ball.dx, self.__ball.dy
+        
+        # Multi-bola: acompanha a bola mais próxima vindo em direção ao bot
+        if self.__balls:
+            incoming = self.__balls.nearest_incoming(self.__right_paddle.x)
+            if incoming is None:
+                return
+            ball_x, ball_y, ball_dx, ball_dy = incoming
+        
+        # Expert: mira no ponto previsto de chegada da bola
+        if self.__difficulty == 'expert':
+            predicted_y = self.__bot_planner.predict(ball_x, ball_y, ball_dx, ball_dy)
+            if predicted_y is not None:
+                ball_y = predicted_y
         
         if ball_y < bot_center - 10:
             self.__right_paddle.move_up()
@@ -286,11 +360,13 @@ class Game:
         if self.__ball.x - self.__ball.radius <= 0:
             self.__bot_score += 1
             self.__ball.reset(self.__width // 2, self.__height // 2)
+            self.__bot_planner.invalidate()
         
         # Ponto do jogador (bola passou pela direita)
         elif self.__ball.x + self.__ball.radius >= self.__width:
             self.__player_score += 1
             self.__ball.reset(self.__width // 2, self.__height // 2)
+            self.__bot_planner.invalidate()
     
     def __check_game_over(self):
         """Verifica condições de fim de jogo"""
@@ -303,7 +379,8 @@ class Game:
             self.__winner = 'bot'
         
         # Tempo limite (2 minutos)
-        elif self.__game_start_time and time.time() - self.__game_start_time >= self.__game_duration:
+        elif (self.__game_start_tick is not None and
+              self.__clock.seconds_since(self.__game_start_tick) >= self.__game_duration):
             self.__game_over = True
             if self.__player_score > self.__bot_score:
                 self.__winner = 'player'
@@ -314,15 +391,16 @@ class Game:
     
     def get_remaining_time(self) -> int:
         """Retorna tempo restante em segundos"""
-        if not self.__game_start_time:
+        if self.__game_start_tick is None:
             return self.__game_duration
         
-        elapsed = time.time() - self.__game_start_time
+        elapsed = self.__clock.seconds_since(self.__game_start_tick)
         remaining = max(0, self.__game_duration - elapsed)
         return int(remaining)
     
     def to_dict(self) -> Dict[str, Any]:
         """Converte estado do jogo para dicionário"""
+        balls = self.__balls.to_list() if self.__balls else [self.__ball.to_dict()]
         return {
             'width': self.__width,
             'height': self.__height,
@@ -332,7 +410,8 @@ class Game:
             'winner': self.__winner,
             'difficulty': self.__difficulty,
             'remaining_time': self.get_remaining_time(),
-            'ball': self.__ball.to_dict(),
+            'ball': balls[0],
+            'balls': balls,
             'left_paddle': self.__left_paddle.to_dict(),
             'right_paddle': self.__right_paddle.to_dict()
         }
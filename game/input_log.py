@@ -0,0 +1,169 @@
+"""
+Registro compacto das entradas de uma partida
+Guarda a semente do RNG e os pares (tick, direção) codificados em
+run-length, permitindo replay e auditoria do resultado
+"""
+
+import struct
+from typing import Iterator, List, Optional, Tuple
+
+# Códigos das direções (2 bits)
+DIRECTION_CODES = {None: 0, 'up': 1, 'down': 2}
+CODE_DIRECTIONS = {code: direction for direction, code in DIRECTION_CODES.items()}
+
+LOG_VERSION = 1
+_HEADER = struct.Struct('>BQI')  # versão, semente, tick inicial
+
+
+def _write_varint(out: bytearray, value: int):
+    """Escreve um inteiro não negativo em formato varint (7 bits por byte)"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Lê um varint e retorna (valor, nova posição)"""
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Log de entradas truncado")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+class InputLog:
+    """Log de entradas codificado em run-length com encapsulamento
+
+    Cada sequência de ticks consecutivos com a mesma direção vira uma única
+    "run" de 2 a 3 bytes: ``varint(gap)`` + ``varint(tamanho << 2 | código)``.
+    Uma partida de 2 minutos costuma caber em algumas centenas de bytes.
+    """
+
+    def __init__(self, seed: int = 0, max_runs: int = 2048):
+        """
+        Args:
+            seed (int): Semente do RNG da partida
+            max_runs (int): Limite de runs; acima dele o log é marcado como truncado
+        """
+        self.__seed = seed
+        self.__max_runs = max_runs
+        self.__start_tick: Optional[int] = None
+        self.__runs: List[List[int]] = []  # [gap, código, tamanho]
+        self.__last_tick: Optional[int] = None
+        self.__truncated = False
+
+    @property
+    def seed(self) -> int:
+        return self.__seed
+
+    @property
+    def start_tick(self) -> int:
+        return self.__start_tick or 0
+
+    @property
+    def run_count(self) -> int:
+        return len(self.__runs)
+
+    @property
+    def tick_count(self) -> int:
+        return sum(run[2] for run in self.__runs)
+
+    @property
+    def truncated(self) -> bool:
+        """True se a partida gerou mais runs do que o limite permitido"""
+        return self.__truncated
+
+    def record(self, tick: int, direction: Optional[str]):
+        """
+        Registra a direção aplicada em um tick
+
+        Args:
+            tick (int): Tick do relógio da partida
+            direction (Optional[str]): 'up', 'down' ou None
+        """
+        code = DIRECTION_CODES.get(direction, 0)
+        if self.__start_tick is None:
+            self.__start_tick = tick
+            self.__last_tick = tick - 1
+
+        runs = self.__runs
+        gap = tick - self.__last_tick - 1
+        if runs and gap == 0 and runs[-1][1] == code:
+            runs[-1][2] += 1
+        elif len(runs) >= self.__max_runs:
+            self.__truncated = True
+            return
+        else:
+            runs.append([max(0, gap), code, 1])
+        self.__last_tick = tick
+
+    def __iter__(self) -> Iterator[Tuple[int, Optional[str]]]:
+        """Expande o log em pares (tick, direção), um por tick registrado"""
+        tick = self.start_tick - 1
+        for gap, code, length in self.__runs:
+            tick += gap
+            direction = CODE_DIRECTIONS[code]
+            for _ in range(length):
+                tick += 1
+                yield tick, direction
+
+    def directions(self) -> Iterator[Optional[str]]:
+        """Expande o log apenas nas direções, na ordem dos updates"""
+        for _, code, length in self.__runs:
+            direction = CODE_DIRECTIONS[code]
+            for _ in range(length):
+                yield direction
+
+    def to_bytes(self) -> bytes:
+        """Serializa o log em formato binário compacto"""
+        flags = 1 if self.__truncated else 0
+        out = bytearray(_HEADER.pack(LOG_VERSION, self.__seed & 0xFFFFFFFFFFFFFFFF, self.start_tick))
+        out.append(flags)
+        for gap, code, length in self.__runs:
+            _write_varint(out, gap)
+            _write_varint(out, (length << 2) | code)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'InputLog':
+        """
+        Reconstrói um log a partir de bytes
+
+        Args:
+            data (bytes): Log gerado por ``to_bytes()``
+
+        Returns:
+            InputLog: Log reconstruído
+        """
+        data = bytes(data)
+        if len(data) < _HEADER.size + 1:
+            raise ValueError("Log de entradas inválido")
+        version, seed, start_tick = _HEADER.unpack_from(data, 0)
+        if version != LOG_VERSION:
+            raise ValueError(f"Versão de log não suportada: {version}")
+        pos = _HEADER.size
+        flags = data[pos]
+        pos += 1
+
+        log = cls(seed)
+        log.__start_tick = start_tick
+        log.__truncated = bool(flags & 1)
+        tick = start_tick - 1
+        while pos < len(data):
+            gap, pos = _read_varint(data, pos)
+            packed, pos = _read_varint(data, pos)
+            code, length = packed & 0x3, packed >> 2
+            if code not in CODE_DIRECTIONS or length <= 0:
+                raise ValueError("Log de entradas corrompido")
+            log.__runs.append([gap, code, length])
+            tick += gap + length
+        log.__last_tick = tick
+        log.__max_runs = max(log.__max_runs, len(log.__runs))
+        return log
@@ -0,0 +1,160 @@
+"""
+Leitura incremental de arquivos JSON grandes com memória constante
+Percorre os registros de players.json/ranking.json (e dos seus journals)
+sem carregar o arquivo inteiro, informando a posição em bytes após cada
+registro para que uma importação interrompida possa ser retomada
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+CHUNK_SIZE = 64 * 1024
+
+# Estado para retomar a leitura: (posição em bytes, pilha de contêineres abertos)
+StreamState = Tuple[int, List[str]]
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\r\n]*')
+
+
+class _Reader:
+    """Buffer de texto sobre um arquivo binário que acompanha a posição em bytes"""
+
+    def __init__(self, f, offset: int):
+        f.seek(offset)
+        self.__file = f
+        self.__decoder = codecs.getincrementaldecoder('utf-8')()
+        self.__buffer = ''
+        self.__position = 0
+        self.__offset = offset
+        self.__eof = False
+
+    @property
+    def offset(self) -> int:
+        """Posição em bytes logo após o último trecho consumido"""
+        return self.__offset
+
+    def __fill(self) -> bool:
+        """Descarta o trecho consumido e lê o próximo bloco (False no fim do arquivo)"""
+        if self.__eof:
+            return False
+        chunk = self.__file.read(CHUNK_SIZE)
+        self.__eof = not chunk
+        self.__buffer = self.__buffer[self.__position:] + self.__decoder.decode(chunk, final=self.__eof)
+        self.__position = 0
+        return not self.__eof
+
+    def __advance(self, end: int):
+        self.__offset += len(self.__buffer[self.__position:end].encode('utf-8'))
+        self.__position = end
+
+    def peek(self) -> str:
+        """Próximo caractere que não é espaço ('' no fim do arquivo)"""
+        while True:
+            self.__advance(_WHITESPACE.match(self.__buffer, self.__position).end())
+            if self.__position < len(self.__buffer):
+                return self.__buffer[self.__position]
+            if not self.__fill():
+                return ''
+
+    def take(self) -> str:
+        """Consome e retorna o próximo caractere que não é espaço"""
+        char = self.peek()
+        if char:
+            self.__advance(self.__position + 1)
+        return char
+
+    def value(self) -> Any:
+        """Decodifica o próximo valor JSON completo"""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.__buffer, self.__position)
+            except json.JSONDecodeError:
+                if self.__fill():
+                    continue  # valor continua no próximo bloco
+                raise
+            if end == len(self.__buffer) and self.__fill():
+                continue  # um número pode continuar no próximo bloco
+            self.__advance(end)
+            return value
+
+
+def iter_json_records(path: str, state: Optional[StreamState] = None) -> Iterator[Tuple[Dict, StreamState]]:
+    """
+    Percorre os registros (objetos) de um snapshot JSON
+
+    Aceita os formatos usados pelo jogo: lista de registros (ranking.json),
+    {"players": [...]} e o antigo {nome: registro}.
+
+    Args:
+        path (str): Arquivo JSON
+        state (Optional[StreamState]): Estado retornado junto de um registro (retoma após ele)
+
+    Yields:
+        Tuple[Dict, StreamState]: (registro, estado para retomar após ele)
+    """
+    offset, stack = state if state else (0, [])
+    stack = list(stack)
+    with open(path, 'rb') as f:
+        reader = _Reader(f, offset)
+        first = not stack
+        if first:
+            char = reader.take()
+            if not char:
+                return  # arquivo vazio
+            if char not in '[{':
+                raise ValueError(f"Formato JSON inesperado em {path}")
+            stack.append('array' if char == '[' else 'object')
+
+        while stack:
+            kind = stack[-1]
+            char = reader.peek()
+            if char == (']' if kind == 'array' else '}'):
+                reader.take()
+                stack.pop()
+                first = False
+                continue
+            if not first and reader.take() != ',':
+                raise ValueError(f"JSON inválido em {path} (byte {reader.offset})")
+            first = False
+            if kind == 'object':
+                reader.value()  # chave
+                if reader.take() != ':':
+                    raise ValueError(f"JSON inválido em {path} (byte {reader.offset})")
+                if len(stack) == 1 and reader.peek() == '[':
+                    # {"players": [...]}: percorre a lista elemento a elemento
+                    reader.take()
+                    stack.append('array')
+                    first = True
+                    continue
+            record = reader.value()
+            if isinstance(record, dict):
+                yield record, (reader.offset, list(stack))
+
+
+def iter_journal_records(path: str, offset: int = 0) -> Iterator[Tuple[Dict, int]]:
+    """
+    Percorre as gravações ("put") de um journal append-only
+
+    Args:
+        path (str): Arquivo .journal
+        offset (int): Posição em bytes a partir da qual ler
+
+    Yields:
+        Tuple[Dict, int]: (registro gravado, posição após a linha)
+    """
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # linha ainda sendo gravada
+            offset += len(line)
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # linha corrompida (queda durante a escrita)
+            if entry.get("op") == "put" and isinstance(entry.get("value"), dict):
+                yield entry["value"], offset
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from game.session_export import (DEFAULT_CHUNK_SIZE, DIFFICULTIES, FORMAT_CSV, FORMATS,
+                                 export_rows, iter_export, parse_bound)
+
+
+class Command(BaseCommand):
+    """Exporta o histórico de partidas em CSV ou JSON por linha sem carregá-lo na memória"""
+
+    help = 'Exporta GameSession (com o nome do jogador) em CSV/NDJSON, lendo o banco em blocos'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=FORMATS, default=FORMAT_CSV,
+                            help='Formato da saída')
+        parser.add_argument('--output', default='-',
+                            help='Arquivo de saída ("-" = saída padrão)')
+        parser.add_argument('--since', default=None,
+                            help='Partidas a partir de (AAAA-MM-DD ou data/hora ISO)')
+        parser.add_argument('--until', default=None,
+                            help='Partidas até (exclusivo; uma data inclui o dia inteiro)')
+        parser.add_argument('--difficulty', choices=DIFFICULTIES, default=None,
+                            help='Apenas uma dificuldade')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                            help='Linhas lidas do banco por vez')
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size deve ser positivo')
+        try:
+            rows = export_rows(since=parse_bound(options['since']),
+                               until=parse_bound(options['until'], end=True),
+                               difficulty=options['difficulty'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        chunks = iter_export(rows, options['format'], options['chunk_size'])
+        if options['output'] == '-':
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
+            return
+
+        written = 0
+        with open(options['output'], 'w', encoding='utf-8', newline='') as f:
+            for chunk in chunks:
+                f.write(chunk)
+                written += len(chunk)
+        self.stderr.write(self.style.SUCCESS(
+            f'Exportação gravada em {options["output"]} ({written} caracteres)'
+        ))
@@ -0,0 +1,169 @@
+import random
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from game.models import GameSession, Player
+
+# Proporção das partidas por dificuldade
+DIFFICULTY_WEIGHTS = {'fácil': 0.35, 'normal': 0.35, 'difícil': 0.2, 'expert': 0.1}
+# Chance de o jogador médio fazer cada ponto e duração média de um ponto (s)
+POINT_WIN_CHANCE = {'fácil': 0.62, 'normal': 0.5, 'difícil': 0.4, 'expert': 0.3}
+POINT_SECONDS = {'fácil': 14.0, 'normal': 17.0, 'difícil': 21.0, 'expert': 25.0}
+# Regras do jogo web (game_logic): primeiro a 3 pontos ou 2 minutos
+WINNING_SCORE = 3
+GAME_DURATION = 120
+# Situação da verificação: (verified, peso). Sem pendentes (None): as partidas geradas
+# não têm log de entradas e o verify_sessions rejeitaria todas
+VERIFIED_WEIGHTS = ((True, 0.97), (False, 0.03))
+
+SESSION_COLUMNS = ('player_id', 'difficulty', 'player_score', 'bot_score', 'game_duration',
+                   'won', 'created_at', 'verified')
+
+
+def simulate_match(rng: random.Random, chance: float, point_seconds: float):
+    """
+    Simula uma partida ponto a ponto
+
+    Returns:
+        Tuple[int, int, int]: (pontos do jogador, pontos do bot, duração em segundos)
+    """
+    player_score = bot_score = 0
+    elapsed = 0.0
+    while player_score < WINNING_SCORE and bot_score < WINNING_SCORE:
+        elapsed += rng.expovariate(1.0 / point_seconds)
+        if elapsed >= GAME_DURATION:
+            return player_score, bot_score, GAME_DURATION
+        if rng.random() < chance:
+            player_score += 1
+        else:
+            bot_score += 1
+    return player_score, bot_score, int(elapsed)
+
+
+class Command(BaseCommand):
+    """Gera jogadores e partidas sintéticos para testar ranking e persistência em escala"""
+
+    help = ('Gera Player e GameSession sintéticos (ex.: --players 100000 --sessions 10000000) '
+            'com distribuições realistas, em inserções em lote')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--players', type=int, default=10000,
+                            help='Jogadores gerados')
+        parser.add_argument('--sessions', type=int, default=100000,
+                            help='Partidas geradas')
+        parser.add_argument('--batch-size', type=int, default=10000,
+                            help='Linhas inseridas por transação')
+        parser.add_argument('--days', type=int, default=365,
+                            help='Período coberto pelas datas geradas (dias até hoje)')
+        parser.add_argument('--prefix', default='synthetic_',
+                            help='Prefixo dos nomes gerados (identifica o conjunto)')
+        parser.add_argument('--seed', type=int, default=None,
+                            help='Semente do gerador (mesma semente = mesmo conjunto)')
+        parser.add_argument('--clear', action='store_true',
+                            help='Remove antes o conjunto gerado com o mesmo prefixo')
+
+    def handle(self, *args, **options):
+        player_count = options['players']
+        session_count = options['sessions']
+        batch_size = options['batch_size']
+        prefix = options['prefix']
+        if player_count < 1 or session_count < 0 or batch_size < 1 or options['days'] < 1:
+            raise CommandError('Quantidades, --batch-size e --days devem ser positivos')
+        if not prefix or len(prefix) + len(str(player_count - 1)) > Player._meta.get_field('name').max_length:
+            raise CommandError('Prefixo vazio ou longo demais para o nome do jogador')
+
+        existing = Player.objects.filter(name__startswith=prefix)
+        if existing.exists():
+            if not options['clear']:
+                raise CommandError(f'Já existem jogadores com o prefixo "{prefix}" (use --clear)')
+            # Sem sinais nem dependentes: as partidas saem em um único DELETE
+            GameSession.objects.filter(player__name__startswith=prefix).delete()
+            existing.delete()
+            self.stdout.write(f'Conjunto anterior "{prefix}" removido')
+
+        rng = random.Random(options['seed'])
+        now = timezone.now()
+        period = timedelta(days=options['days'])
+
+        # Jogadores: habilidade ~ normal, atividade ~ lognormal (poucos jogam muito)
+        width = len(str(player_count - 1))
+        skills = [max(-3.0, min(3.0, rng.gauss(0.0, 1.0))) for _ in range(player_count)]
+        created = [now - period * rng.random() for _ in range(player_count)]
+        Player.objects.bulk_create(
+            (Player(name=f'{prefix}{index:0{width}d}', created_at=created[index])
+             for index in range(player_count)),
+            batch_size=batch_size)
+        ids = [0] * player_count
+        for name, player_id in Player.objects.filter(name__startswith=prefix).values_list('name', 'id').iterator():
+            ids[int(name[len(prefix):])] = player_id
+        self.stdout.write(f'{player_count} jogadores criados')
+
+        cumulative = []
+        total = 0.0
+        for _ in range(player_count):
+            total += rng.lognormvariate(0.0, 1.2)
+            cumulative.append(total)
+        difficulties = list(DIFFICULTY_WEIGHTS)
+        difficulty_weights = list(DIFFICULTY_WEIGHTS.values())
+        verified_values = [value for value, _ in VERIFIED_WEIGHTS]
+        verified_weights = [weight for _, weight in VERIFIED_WEIGHTS]
+
+        # Estatísticas agregadas (só partidas verificadas contam, como na view end_game)
+        games = [0] * player_count
+        wins = [0] * player_count
+        best = [0] * player_count
+
+        # INSERT direto em vez de GameSession.objects.bulk_create: o preparo de cada
+        # objeto pelo ORM deixava a geração ~4x mais lenta (200 mil partidas: 28 s x 7 s),
+        # o que pesa nos 10 milhões de partidas para os quais o comando existe
+        quote = connection.ops.quote_name
+        insert = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            quote(GameSession._meta.db_table),
+            ', '.join(quote(column) for column in SESSION_COLUMNS),
+            ', '.join(['%s'] * len(SESSION_COLUMNS)))
+        adapt_datetime = connection.ops.adapt_datetimefield_value
+
+        generated = 0
+        next_report = max(1, session_count // 10)
+        while generated < session_count:
+            size = min(batch_size, session_count - generated)
+            players = rng.choices(range(player_count), cum_weights=cumulative, k=size)
+            levels = rng.choices(difficulties, weights=difficulty_weights, k=size)
+            statuses = rng.choices(verified_values, weights=verified_weights, k=size)
+            rows = []
+            for index, difficulty, verified in zip(players, levels, statuses):
+                chance = max(0.05, min(0.95, POINT_WIN_CHANCE[difficulty] + 0.08 * skills[index]))
+                player_score, bot_score, duration = simulate_match(rng, chance, POINT_SECONDS[difficulty])
+                won = player_score > bot_score
+                started = created[index] + (now - created[index]) * rng.random()
+                rows.append((ids[index], difficulty, player_score, bot_score, duration, won,
+                             adapt_datetime(started), verified))
+                if verified:
+                    games[index] += 1
+                    wins[index] += won
+                    if player_score > best[index]:
+                        best[index] = player_score
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.executemany(insert, rows)
+            generated += size
+            if generated >= next_report or generated == session_count:
+                self.stdout.write(f'{generated}/{session_count} partidas')
+                next_report += max(1, session_count // 10)
+
+        # UPDATE direto pelo mesmo motivo: bulk_update monta um CASE por campo e, com
+        # 50 mil jogadores, levava 30 s a mais que o executemany
+        update = 'UPDATE {} SET {} = %s, {} = %s, {} = %s WHERE {} = %s'.format(
+            quote(Player._meta.db_table), quote('total_games'), quote('total_wins'),
+            quote('best_score'), quote('id'))
+        stats = [(games[index], wins[index], best[index], ids[index])
+                 for index in range(player_count) if games[index]]
+        for start in range(0, len(stats), batch_size):
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.executemany(update, stats[start:start + batch_size])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Conjunto "{prefix}" gerado: {player_count} jogadores, {session_count} partidas'
+        ))
@@ -0,0 +1,219 @@
+import json
+import os
+from typing import Dict, Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from game.json_stream import iter_json_records, iter_journal_records
+from game.models import Player
+
+# Campos acumulados do desktop: a importação só aumenta (nunca desfaz progresso da web)
+COUNTER_FIELDS = ('total_games', 'total_wins', 'best_score')
+NAME_MAX_LENGTH = Player._meta.get_field('name').max_length
+
+
+def _to_int(value) -> int:
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _normalize(record: Dict) -> Optional[Tuple[str, Dict]]:
+    """Converte um registro do players.json/ranking.json em (nome, campos do Player)"""
+    name = str(record.get('name') or '').strip()
+    if not name or len(name) > NAME_MAX_LENGTH:
+        return None
+    fields = {
+        'total_games': _to_int(record.get('total_games')),
+        'total_wins': _to_int(record.get('total_wins')),
+        'best_score': _to_int(record.get('best_score', record.get('score'))),
+        'created_at': None,
+    }
+    created_at = record.get('created_at')
+    if isinstance(created_at, str):
+        try:
+            created_at = parse_datetime(created_at)
+        except ValueError:
+            created_at = None
+        if created_at is not None:
+            if settings.USE_TZ and timezone.is_naive(created_at):
+                created_at = timezone.make_aware(created_at)
+            fields['created_at'] = created_at
+    return name, fields
+
+
+def _merge(target, fields: Dict) -> bool:
+    """Aplica os campos importados (maiores contadores, criação mais antiga); True se mudou"""
+    changed = False
+    for field in COUNTER_FIELDS:
+        if fields[field] > getattr(target, field):
+            setattr(target, field, fields[field])
+            changed = True
+    created_at = fields['created_at']
+    if created_at is not None and created_at < target.created_at:
+        target.created_at = created_at
+        changed = True
+    return changed
+
+
+class _PendingPlayer:
+    """Campos acumulados de um nome dentro do lote atual"""
+
+    def __init__(self, fields: Dict):
+        self.total_games = fields['total_games']
+        self.total_wins = fields['total_wins']
+        self.best_score = fields['best_score']
+        self.created_at = fields['created_at'] or timezone.now()
+
+
+class Command(BaseCommand):
+    """Importa o histórico do jogo desktop (players.json e ranking.json) para o banco"""
+
+    help = ('Importa players.json e ranking.json (snapshots + journals) para game.Player em lotes, '
+            'com memória constante; retomável e idempotente')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--players', default=str(settings.BASE_DIR / 'players.json'),
+                            help='Arquivo de jogadores do jogo desktop')
+        parser.add_argument('--ranking', default=str(settings.BASE_DIR / 'ranking.json'),
+                            help='Arquivo de ranking do jogo desktop')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Registros gravados por transação')
+        parser.add_argument('--state-file', default=None,
+                            help='Arquivo de progresso (padrão: .history_import.json ao lado do players)')
+        parser.add_argument('--restart', action='store_true',
+                            help='Ignora o progresso salvo e reimporta tudo')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size deve ser positivo')
+        state_file = options['state_file'] or os.path.join(
+            os.path.dirname(os.path.abspath(options['players'])), '.history_import.json')
+        self.__state_file = state_file
+        self.__progress = {} if options['restart'] else self.__load_progress()
+        self.__batch_size = batch_size
+
+        totals = {'read': 0, 'created': 0, 'updated': 0, 'skipped': 0}
+        for snapshot in (options['players'], options['ranking']):
+            # Snapshot primeiro, depois os journals na ordem em que foram gravados
+            for path, kind in ((snapshot, 'snapshot'), (snapshot + '.journal.old', 'journal'),
+                               (snapshot + '.journal', 'journal')):
+                if not os.path.exists(path):
+                    continue
+                counts = self.__import_source(path, kind)
+                for key, value in counts.items():
+                    totals[key] += value
+                self.stdout.write(
+                    f'{path}: {counts["read"]} registros, {counts["created"]} novos, '
+                    f'{counts["updated"]} atualizados, {counts["skipped"]} ignorados'
+                )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Importação concluída: {totals["created"]} jogadores criados, '
+            f'{totals["updated"]} atualizados ({totals["read"]} registros lidos)'
+        ))
+
+    # ---------------------- Progresso ----------------------
+    def __load_progress(self) -> Dict:
+        try:
+            with open(self.__state_file, 'r', encoding='utf-8') as f:
+                progress = json.load(f)
+            return progress if isinstance(progress, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def __save_progress(self):
+        """Grava o progresso de forma atômica (só depois do commit do lote)"""
+        temp = f'{self.__state_file}.{os.getpid()}.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(self.__progress, f)
+        os.replace(temp, self.__state_file)
+
+    def __resume_state(self, path: str, kind: str):
+        """
+        Posição salva para o arquivo, se ele ainda for o mesmo
+
+        Snapshots precisam estar intactos; journals só crescem, então basta
+        ser o mesmo arquivo (inode) com tamanho suficiente.
+        """
+        saved = self.__progress.get(os.path.abspath(path))
+        if not saved:
+            return None
+        st = os.stat(path)
+        if kind == 'snapshot':
+            if saved.get('stamp') != [st.st_ino, st.st_size, st.st_mtime_ns]:
+                return None
+        elif saved.get('stamp', [None])[0] != st.st_ino or saved.get('offset', 0) > st.st_size:
+            return None
+        return saved.get('state')
+
+    # ---------------------- Importação ----------------------
+    def __records(self, path: str, kind: str, state) -> Iterator[Tuple[Dict, object]]:
+        if kind == 'snapshot':
+            return iter_json_records(path, state)
+        return iter_journal_records(path, state or 0)
+
+    def __import_source(self, path: str, kind: str) -> Dict[str, int]:
+        counts = {'read': 0, 'created': 0, 'updated': 0, 'skipped': 0}
+        st = os.stat(path)
+        stamp = [st.st_ino, st.st_size, st.st_mtime_ns]
+        key = os.path.abspath(path)
+        batch: Dict[str, _PendingPlayer] = {}
+        last_state = None
+
+        for record, state in self.__records(path, kind, self.__resume_state(path, kind)):
+            counts['read'] += 1
+            last_state = state
+            normalized = _normalize(record)
+            if normalized is None:
+                counts['skipped'] += 1
+            else:
+                name, fields = normalized
+                pending = batch.get(name)
+                if pending is None:
+                    batch[name] = _PendingPlayer(fields)
+                else:
+                    _merge(pending, fields)
+            if counts['read'] % self.__batch_size == 0:
+                self.__flush(batch, counts)
+                self.__checkpoint(key, stamp, state)
+                batch = {}
+
+        if batch:
+            self.__flush(batch, counts)
+        if last_state is not None:
+            self.__checkpoint(key, stamp, last_state)
+        return counts
+
+    def __checkpoint(self, key: str, stamp, state):
+        offset = state[0] if isinstance(state, (list, tuple)) else state
+        self.__progress[key] = {'stamp': stamp, 'state': state, 'offset': offset}
+        self.__save_progress()
+
+    def __flush(self, batch: Dict[str, _PendingPlayer], counts: Dict[str, int]):
+        """Grava um lote: uma consulta para os existentes, bulk_create + bulk_update"""
+        with transaction.atomic():
+            existing = {player.name: player for player in Player.objects.filter(name__in=list(batch))}
+            to_create = []
+            to_update = []
+            for name, pending in batch.items():
+                fields = {field: getattr(pending, field) for field in COUNTER_FIELDS}
+                fields['created_at'] = pending.created_at
+                player = existing.get(name)
+                if player is None:
+                    to_create.append(Player(name=name, **fields))
+                elif _merge(player, fields):
+                    to_update.append(player)
+            # ignore_conflicts: outro processo pode ter criado o mesmo nome nesse meio tempo
+            Player.objects.bulk_create(to_create, batch_size=self.__batch_size, ignore_conflicts=True)
+            if to_update:
+                Player.objects.bulk_update(to_update, list(COUNTER_FIELDS) + ['created_at'],
+                                           batch_size=self.__batch_size)
+        counts['created'] += len(to_create)
+        counts['updated'] += len(to_update)
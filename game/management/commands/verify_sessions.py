@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from game.models import GameSession
+from game.verification import MatchVerifier, ENGINE_FULL
+
+
+class Command(BaseCommand):
+    """Verifica partidas pendentes por re-simulação e promove as válidas ao ranking"""
+
+    help = 'Re-simula partidas pendentes (verified=None) em um pool de processos'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Partidas carregadas e verificadas por lote')
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Processos do pool (padrão: núcleos da CPU)')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        verifier = MatchVerifier(max_workers=options['workers'])
+        promoted = rejected = 0
+
+        try:
+            while True:
+                sessions = list(
+                    GameSession.objects.select_related('player')
+                    .filter(verified__isnull=True)
+                    .order_by('id')[:batch_size]
+                )
+                if not sessions:
+                    break
+
+                records = [{
+                    'id': session.id,
+                    'engine': ENGINE_FULL,
+                    'difficulty': session.difficulty,
+                    'input_log': bytes(session.input_log) if session.input_log else None,
+                    'player_score': session.player_score,
+                    'bot_score': session.bot_score
+                } for session in sessions]
+                results = verifier.verify_many(records)
+
+                with transaction.atomic():
+                    for session, result in zip(sessions, results):
+                        session.verified = result['verified']
+                        session.save(update_fields=['verified'])
+                        if result['verified']:
+                            session.player.add_game_result(session.player_score, session.won)
+                            promoted += 1
+                        else:
+                            rejected += 1
+        finally:
+            verifier.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Partidas verificadas: {promoted} promovidas, {rejected} rejeitadas'
+        ))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamesession',
+            name='rng_seed',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='gamesession',
+            name='input_log',
+            field=models.BinaryField(blank=True, editable=False, null=True),
+        ),
+    ]
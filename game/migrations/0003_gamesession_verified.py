@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-19 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0002_gamesession_input_log'),
+    ]
+
+    operations = [
+        # Partidas anteriores à verificação já estavam no ranking: ficam como verificadas
+        migrations.AddField(
+            model_name='gamesession',
+            name='verified',
+            field=models.BooleanField(default=True, null=True),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='gamesession',
+            name='verified',
+            field=models.BooleanField(default=None, null=True),
+        ),
+    ]
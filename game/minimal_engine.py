@@ -0,0 +1,256 @@
+"""
+Motor do jogo usado pelo modo mínimo (bythepong_web.urls_minimal)
+Funções puras sobre o dicionário de estado, sem dependência do Django,
+para que a mesma simulação rode nas views e na verificação de partidas
+"""
+
+import random
+from typing import Any, Dict, Optional
+
+from .clock import GameClock
+from .bot_planner import BotPlanner
+
+# Configurações baseadas na dificuldade - DIFERENÇAS EXTREMAS
+DIFFICULTY_CONFIG = {
+    'fácil': {
+        'ball_speed': 3,        # BOLA MUITO LENTA
+        'ai_speed': 2,          # IA MUITO LENTA
+        'ai_reaction': 200,     # IA COM MUITO DELAY
+        'paddle_size': 150,     # RAQUETE GIGANTE
+        'player_speed': 12,     # JOGADOR SUPER RÁPIDO
+        'ai_accuracy': 0.5      # IA MUITO IMPRECISA
+    },
+    'normal': {
+        'ball_speed': 5,
+        'ai_speed': 4,
+        'ai_reaction': 80,
+        'paddle_size': 100,
+        'player_speed': 8,
+        'ai_accuracy': 0.75
+    },
+    'difícil': {
+        'ball_speed': 8,
+        'ai_speed': 8,
+        'ai_reaction': 20,
+        'paddle_size': 70,
+        'player_speed': 5,
+        'ai_accuracy': 0.9
+    },
+    'expert': {
+        'ball_speed': 12,       # BOLA ULTRA RÁPIDA
+        'ai_speed': 15,         # IA ULTRA RÁPIDA
+        'ai_reaction': 0,       # IA SEM DELAY
+        'paddle_size': 40,      # RAQUETE MINÚSCULA
+        'player_speed': 3,      # JOGADOR MUITO LENTO
+        'ai_accuracy': 0.99     # IA QUASE PERFEITA
+    }
+}
+
+
+def create_planner() -> BotPlanner:
+    """Previsão de trajetória do bot expert (bola entre y=10 e y=590, raquete em x=735)"""
+    return BotPlanner(10, 590, 735 - 10)
+
+
+def create_game_state(difficulty: str, theme: str, rng: random.Random,
+                      start_tick: int = 0) -> Dict[str, Any]:
+    """
+    Cria o estado inicial de uma partida
+
+    Args:
+        difficulty (str): Nível de dificuldade
+        theme (str): Tema visual escolhido no cliente
+        rng (random.Random): Gerador da partida
+        start_tick (int): Tick do relógio no início da partida
+
+    Returns:
+        Dict[str, Any]: Estado serializável em JSON
+    """
+    config = DIFFICULTY_CONFIG.get(difficulty, DIFFICULTY_CONFIG['normal'])
+    
+    # Criar estado do jogo com configurações de dificuldade
+    return {
+        'canvas_width': 800,
+        'canvas_height': 600,
+        'theme': theme,
+        'left_paddle': {
+            'x': 50, 
+            'y': 300 - config['paddle_size'] // 2, 
+            'width': 15, 
+            'height': config['paddle_size']
+        },
+        'right_paddle': {
+            'x': 735, 
+            'y': 300 - config['paddle_size'] // 2, 
+            'width': 15, 
+            'height': config['paddle_size']
+        },
+        'ball': {
+            'x': 400, 
+            'y': 300, 
+            'radius': 10, 
+            'dx': config['ball_speed'], 
+            'dy': rng.choice([-config['ball_speed']//2, config['ball_speed']//2])
+        },
+        'player_score': 0,
+        'bot_score': 0,
+        'game_over': False,
+        'winner': None,
+        'remaining_time': 120,
+        'difficulty': difficulty,
+        'config': config,
+        'start_tick': start_tick,
+        'ai_last_move': 0  # Para controlar reação da IA (ms virtuais)
+    }
+
+
+def update_game_state(game_state: Dict[str, Any], direction: Optional[str], clock: GameClock,
+                      rng: random.Random, planner: BotPlanner):
+    """
+    Avança a partida em um tick
+
+    Args:
+        game_state (Dict[str, Any]): Estado criado por create_game_state (alterado no lugar)
+        direction (Optional[str]): 'up', 'down' ou None
+        clock (GameClock): Relógio virtual da partida
+        rng (random.Random): Gerador da partida
+        planner (BotPlanner): Previsão de trajetória do bot expert
+    """
+    # Atualizar tempo (relógio virtual)
+    clock.tick()
+    elapsed = clock.seconds_since(game_state['start_tick'])
+    game_state['remaining_time'] = max(0, 120 - int(elapsed))
+    
+    config = game_state['config']
+    
+    # Mover jogador com velocidade baseada na dificuldade
+    if direction == 'up':
+        game_state['left_paddle']['y'] = max(0, game_state['left_paddle']['y'] - config['player_speed'])
+    elif direction == 'down':
+        game_state['left_paddle']['y'] = min(600 - config['paddle_size'], game_state['left_paddle']['y'] + config['player_speed'])
+    
+    # IA DRAMATICAMENTE DIFERENTE por dificuldade
+    current_time = clock.elapsed_ms  # em milissegundos virtuais
+    if current_time - game_state['ai_last_move'] > config['ai_reaction']:
+        ball_y = game_state['ball']['y']
+        paddle_center = game_state['right_paddle']['y'] + config['paddle_size'] // 2
+        
+        if game_state['difficulty'] == 'fácil':
+            # FÁCIL: IA muito burra e lenta
+            if rng.random() < 0.3:  # Só se move 30% das vezes
+                if ball_y < paddle_center - 30:  # Margem grande
+                    game_state['right_paddle']['y'] = max(0, game_state['right_paddle']['y'] - config['ai_speed'])
+                elif ball_y > paddle_center + 30:
+                    game_state['right_paddle']['y'] = min(600 - config['paddle_size'], game_state['right_paddle']['y'] + config['ai_speed'])
+                    
+        elif game_state['difficulty'] == 'normal':
+            # NORMAL: IA equilibrada
+            if rng.random() < config['ai_accuracy']:
+                if ball_y < paddle_center - 15:
+                    game_state['right_paddle']['y'] = max(0, game_state['right_paddle']['y'] - config['ai_speed'])
+                elif ball_y > paddle_center + 15:
+                    game_state['right_paddle']['y'] = min(600 - config['paddle_size'], game_state['right_paddle']['y'] + config['ai_speed'])
+                    
+        elif game_state['difficulty'] == 'difícil':
+            # DIFÍCIL: IA rápida e precisa
+            if ball_y < paddle_center - 10:
+                game_state['right_paddle']['y'] = max(0, game_state['right_paddle']['y'] - config['ai_speed'])
+            elif ball_y > paddle_center + 10:
+                game_state['right_paddle']['y'] = min(600 - config['paddle_size'], game_state['right_paddle']['y'] + config['ai_speed'])
+                
+        elif game_state['difficulty'] == 'expert':
+            # EXPERT: IA PERFEITA com previsão (trajetória completa em cache)
+            ball = game_state['ball']
+            predicted_y = planner.predict(ball['x'], ball['y'], ball['dx'], ball['dy'])
+            if predicted_y is not None:  # Bola indo para direita
+                # IA vai para a posição predita
+                if predicted_y < paddle_center - 5:
+                    game_state['right_paddle']['y'] = max(0, game_state['right_paddle']['y'] - config['ai_speed'])
+                elif predicted_y > paddle_center + 5:
+                    game_state['right_paddle']['y'] = min(600 - config['paddle_size'], game_state['right_paddle']['y'] + config['ai_speed'])
+        
+        game_state['ai_last_move'] = current_time
+    
+    # Mover bola
+    game_state['ball']['x'] += game_state['ball']['dx']
+    game_state['ball']['y'] += game_state['ball']['dy']
+    
+    # Verificação de segurança: se a bola ficar presa, forçar movimento
+    if abs(game_state['ball']['dx']) < 0.1:
+        game_state['ball']['dx'] = config['ball_speed'] if game_state['ball']['dx'] >= 0 else -config['ball_speed']
+    
+    # Colisões com topo/fundo
+    if game_state['ball']['y'] <= 10 or game_state['ball']['y'] >= 590:
+        game_state['ball']['dy'] = -game_state['ball']['dy']
+    
+    # Colisão com raquete do jogador (esquerda) - CORRIGIDA
+    if (game_state['ball']['x'] - game_state['ball']['radius'] <= game_state['left_paddle']['x'] + game_state['left_paddle']['width'] and
+        game_state['ball']['x'] + game_state['ball']['radius'] >= game_state['left_paddle']['x'] and
+        game_state['ball']['y'] >= game_state['left_paddle']['y'] and 
+        game_state['ball']['y'] <= game_state['left_paddle']['y'] + config['paddle_size'] and
+        game_state['ball']['dx'] < 0):  # Só colide se estiver indo para a esquerda
+        
+        # Efeito de spin baseado na dificuldade
+        ball_center = game_state['ball']['y']
+        paddle_center = game_state['left_paddle']['y'] + config['paddle_size'] // 2
+        relative_intersect_y = (ball_center - paddle_center) / (config['paddle_size'] // 2)
+        
+        # Ajustar velocidade baseado na dificuldade
+        game_state['ball']['dx'] = abs(game_state['ball']['dx'])  # Mudar direção
+        game_state['ball']['dy'] = relative_intersect_y * config['ball_speed']
+        
+        # Garantir que a bola não fique presa
+        game_state['ball']['x'] = game_state['left_paddle']['x'] + game_state['left_paddle']['width'] + game_state['ball']['radius']
+        
+    # Colisão com raquete da IA (direita) - CORRIGIDA
+    if (game_state['ball']['x'] + game_state['ball']['radius'] >= game_state['right_paddle']['x'] and
+        game_state['ball']['x'] - game_state['ball']['radius'] <= game_state['right_paddle']['x'] + game_state['right_paddle']['width'] and
+        game_state['ball']['y'] >= game_state['right_paddle']['y'] and 
+        game_state['ball']['y'] <= game_state['right_paddle']['y'] + config['paddle_size'] and
+        game_state['ball']['dx'] > 0):  # Só colide se estiver indo para a direita
+        
+        # Efeito de spin baseado na dificuldade
+        ball_center = game_state['ball']['y']
+        paddle_center = game_state['right_paddle']['y'] + config['paddle_size'] // 2
+        relative_intersect_y = (ball_center - paddle_center) / (config['paddle_size'] // 2)
+        
+        # Ajustar velocidade baseado na dificuldade
+        game_state['ball']['dx'] = -abs(game_state['ball']['dx'])  # Mudar direção
+        game_state['ball']['dy'] = relative_intersect_y * config['ball_speed']
+        
+        # Garantir que a bola não fique presa
+        game_state['ball']['x'] = game_state['right_paddle']['x'] - game_state['ball']['radius']
+    
+    # Pontuação
+    if game_state['ball']['x'] < -50:  # Margem maior para evitar travamento
+        game_state['bot_score'] += 1
+        # Reset da bola com velocidade baseada na dificuldade
+        game_state['ball']['x'] = 400
+        game_state['ball']['y'] = 300
+        game_state['ball']['dx'] = rng.choice([-config['ball_speed'], config['ball_speed']])
+        game_state['ball']['dy'] = rng.choice([-config['ball_speed']//2, config['ball_speed']//2])
+    elif game_state['ball']['x'] > 850:  # Margem maior para evitar travamento
+        game_state['player_score'] += 1
+        # Reset da bola com velocidade baseada na dificuldade
+        game_state['ball']['x'] = 400
+        game_state['ball']['y'] = 300
+        game_state['ball']['dx'] = rng.choice([-config['ball_speed'], config['ball_speed']])
+        game_state['ball']['dy'] = rng.choice([-config['ball_speed']//2, config['ball_speed']//2])
+    
+    # Correção de emergência: se a bola ficar muito tempo atrás das raquetes
+    if (game_state['ball']['x'] < 0 or game_state['ball']['x'] > 800):
+        # Forçar reset da posição
+        game_state['ball']['x'] = 400
+        game_state['ball']['y'] = 300
+        game_state['ball']['dx'] = rng.choice([-config['ball_speed'], config['ball_speed']])
+        game_state['ball']['dy'] = rng.choice([-config['ball_speed']//2, config['ball_speed']//2])
+    
+    # Fim do jogo
+    if game_state['player_score'] >= 3 or game_state['bot_score'] >= 3 or game_state['remaining_time'] <= 0:
+        game_state['game_over'] = True
+        if game_state['player_score'] > game_state['bot_score']:
+            game_state['winner'] = 'player'
+        elif game_state['bot_score'] > game_state['player_score']:
+            game_state['winner'] = 'bot'
+        else:
+            game_state['winner'] = 'tie'
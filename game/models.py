@@ -42,6 +42,11 @@ class GameSession(models.Model):
     game_duration = models.IntegerField(default=0)  # em segundos
     won = models.BooleanField(default=False)
     created_at = models.DateTimeField(default=timezone.now)
+    # Replay/auditoria: semente do RNG e entradas em run-length (ver game.input_log)
+    rng_seed = models.BigIntegerField(null=True, blank=True)
+    input_log = models.BinaryField(null=True, blank=True, editable=False)
+    # Resultado da re-simulação: None = pendente, True = verificada, False = rejeitada
+    verified = models.BooleanField(null=True, default=None)
     
     def __str__(self):
         return f"{self.player.name} - {self.difficulty} - {self.player_score}x{self.bot_score}"
@@ -0,0 +1,259 @@
+"""
+Modo multi-bola do motor de jogo
+Todas as bolas de uma partida ficam em arrays contíguos (estrutura de arrays)
+e são movidas/colididas em lote, sem uma chamada de método por bola
+"""
+
+import random
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+# numpy é opcional (requirements_extras.txt): vetoriza as operações em lote; sem ele usa o laço sobre array
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+class BallArray:
+    """Conjunto de bolas armazenado em arrays contíguos com encapsulamento"""
+
+    def __init__(self, count: int, radius: int = 10, speed: int = 5, use_numpy: Optional[bool] = None,
+                 rng: Optional[random.Random] = None):
+        """
+        Args:
+            count (int): Quantidade de bolas
+            radius (int): Raio (igual para todas as bolas)
+            speed (int): Velocidade de cada componente no reset
+            use_numpy (Optional[bool]): Força/desativa numpy (None = automático)
+            rng (Optional[random.Random]): Gerador usado nos resets
+        """
+        if count <= 0:
+            raise ValueError("count deve ser positivo")
+        self.__count = count
+        self.__radius = radius
+        self.__speed = speed
+        self.__rng = rng if rng is not None else random.Random()
+        self.__use_numpy = NUMPY_AVAILABLE if use_numpy is None else (use_numpy and NUMPY_AVAILABLE)
+
+        if self.__use_numpy:
+            # Linhas x/y de uma matriz 2 x count: um único "+=" move todas as bolas
+            self.__position = np.zeros((2, count), dtype=np.float64)
+            self.__velocity = np.zeros((2, count), dtype=np.float64)
+            self.__x, self.__y = self.__position
+            self.__dx, self.__dy = self.__velocity
+        else:
+            self.__x = array('d', bytes(8 * count))
+            self.__y = array('d', bytes(8 * count))
+            self.__dx = array('d', bytes(8 * count))
+            self.__dy = array('d', bytes(8 * count))
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    @property
+    def radius(self) -> int:
+        return self.__radius
+
+    @property
+    def uses_numpy(self) -> bool:
+        return self.__use_numpy
+
+    def set_velocity_all(self, dx: float, dy: float):
+        """Define a mesma velocidade para todas as bolas"""
+        for i in range(self.__count):
+            self.__dx[i] = dx
+            self.__dy[i] = dy
+
+    def __reset_one(self, i: int, center_x: int, center_y: int):
+        speed = self.__speed
+        self.__x[i] = center_x
+        self.__y[i] = center_y
+        self.__dx[i] = self.__rng.choice([-speed, speed])
+        self.__dy[i] = self.__rng.choice([-speed, speed])
+
+    def reset_all(self, center_x: int, center_y: int):
+        """Reseta todas as bolas para o centro com direções aleatórias"""
+        for i in range(self.__count):
+            self.__reset_one(i, center_x, center_y)
+
+    def step(self, width: int, height: int, left_paddle, right_paddle) -> Tuple[int, int]:
+        """
+        Avança um tick para todas as bolas: movimento, paredes, raquetes e pontuação
+
+        Args:
+            width (int): Largura do campo
+            height (int): Altura do campo
+            left_paddle: Raquete do jogador (x, y, width, height)
+            right_paddle: Raquete do bot (x, y, width, height)
+
+        Returns:
+            Tuple[int, int]: (pontos do jogador, pontos do bot) neste tick
+        """
+        lp = (left_paddle.x, left_paddle.y, left_paddle.width, left_paddle.height)
+        rp = (right_paddle.x, right_paddle.y, right_paddle.width, right_paddle.height)
+        if self.__use_numpy:
+            player_hits, bot_hits = self.__step_numpy(width, height, lp, rp)
+        else:
+            player_hits, bot_hits = self.__step_python(width, height, lp, rp)
+
+        center_x, center_y = width // 2, height // 2
+        for i in player_hits:
+            self.__reset_one(i, center_x, center_y)
+        for i in bot_hits:
+            self.__reset_one(i, center_x, center_y)
+        return len(player_hits), len(bot_hits)
+
+    def __step_numpy(self, width, height, lp, rp) -> Tuple[List[int], List[int]]:
+        """
+        Passo vetorizado (numpy)
+
+        O custo fixo de cada operação numpy domina com poucas bolas: os limites
+        (mínimo/máximo de x e y) decidem quais colisões precisam ser calculadas.
+        """
+        x, y, dx, dy, r = self.__x, self.__y, self.__dx, self.__dy, self.__radius
+        position = self.__position
+        position += self.__velocity
+        (min_x, min_y), (max_x, max_y) = position.min(axis=1).tolist(), position.max(axis=1).tolist()
+
+        # Paredes superior/inferior
+        if min_y <= r or max_y >= height - r:
+            wall = (y <= r) | (y >= height - r)
+            np.clip(y, r, height - r, out=y)
+            np.negative(dy, out=dy, where=wall)
+
+        # Raquete esquerda (jogador)
+        lx, ly, lw, lh = lp
+        left_face = lx + lw
+        if min_x <= left_face + r:
+            left_hit = ((dx < 0) & (x - r <= left_face) & (x - r >= lx) &
+                        (y >= ly) & (y <= ly + lh))
+            x[left_hit] = left_face + r
+            np.negative(dx, out=dx, where=left_hit)
+
+        # Raquete direita (bot)
+        rx, ry, rw, rh = rp
+        if max_x >= rx - r:
+            right_hit = ((dx > 0) & (x + r >= rx) & (x + r <= rx + rw) &
+                         (y >= ry) & (y <= ry + rh))
+            x[right_hit] = rx - r
+            np.negative(dx, out=dx, where=right_hit)
+
+        # Pontuação (as raquetes só empurram bolas para dentro: os limites continuam válidos)
+        if min_x > r and max_x < width - r:
+            return [], []
+        bot_point = x - r <= 0
+        player_point = (x + r >= width) & ~bot_point
+        return np.flatnonzero(player_point).tolist(), np.flatnonzero(bot_point).tolist()
+
+    def __step_python(self, width, height, lp, rp) -> Tuple[List[int], List[int]]:
+        """Passo em lote sem numpy: um único laço sobre os arrays"""
+        xs, ys, dxs, dys, r = self.__x, self.__y, self.__dx, self.__dy, self.__radius
+        lx, ly, lw, lh = lp
+        rx, ry, rw, rh = rp
+        left_face, right_face = lx + lw, rx + rw
+        low, high = r, height - r
+        player_hits: List[int] = []
+        bot_hits: List[int] = []
+
+        for i in range(self.__count):
+            dx = dxs[i]
+            x = xs[i] + dx
+            y = ys[i] + dys[i]
+
+            if y <= low:
+                y = low
+                dys[i] = -dys[i]
+            elif y >= high:
+                y = high
+                dys[i] = -dys[i]
+
+            if dx < 0 and lx <= x - r <= left_face and ly <= y <= ly + lh:
+                x = left_face + r
+                dx = -dx
+            elif dx > 0 and rx <= x + r <= right_face and ry <= y <= ry + rh:
+                x = rx - r
+                dx = -dx
+
+            xs[i] = x
+            ys[i] = y
+            dxs[i] = dx
+
+            if x - r <= 0:
+                bot_hits.append(i)
+            elif x + r >= width:
+                player_hits.append(i)
+
+        return player_hits, bot_hits
+
+    def nearest_incoming(self, target_x: float) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Retorna (x, y, dx, dy) da bola mais próxima indo em direção a target_x
+
+        Args:
+            target_x (float): Plano da raquete observada
+
+        Returns:
+            Optional[Tuple]: Estado da bola ou None se nenhuma se aproxima
+        """
+        best = None
+        best_distance = None
+        xs, dxs = self.__x, self.__dx
+        for i in range(self.__count):
+            distance = (target_x - xs[i])
+            if distance * dxs[i] <= 0:
+                continue
+            distance = abs(distance)
+            if best_distance is None or distance < best_distance:
+                best_distance = distance
+                best = i
+        if best is None:
+            return None
+        return (float(self.__x[best]), float(self.__y[best]),
+                float(self.__dx[best]), float(self.__dy[best]))
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Converte todas as bolas para lista de dicionários"""
+        r = self.__radius
+        return [
+            {'x': float(self.__x[i]), 'y': float(self.__y[i]), 'radius': r,
+             'dx': float(self.__dx[i]), 'dy': float(self.__dy[i])}
+            for i in range(self.__count)
+        ]
+
+
+def benchmark(ball_counts=(1, 50), ticks: int = 2000) -> Dict[int, float]:
+    """
+    Mede o custo médio por tick (em microssegundos) para cada quantidade de bolas
+
+    Args:
+        ball_counts: Quantidades de bolas a medir
+        ticks (int): Ticks simulados por medição
+
+    Returns:
+        Dict[int, float]: quantidade de bolas -> microssegundos por tick
+    """
+    import time
+    from .game_logic import Paddle
+
+    left = Paddle(50, 250)
+    right = Paddle(735, 250)
+    results = {}
+    for count in ball_counts:
+        balls = BallArray(count)
+        balls.reset_all(400, 300)
+        start = time.perf_counter()
+        for _ in range(ticks):
+            balls.step(800, 600, left, right)
+        results[count] = (time.perf_counter() - start) * 1e6 / ticks
+    return results
+
+
+if __name__ == '__main__':
+    backend = 'numpy' if NUMPY_AVAILABLE else 'array (python puro)'
+    print(f"Backend: {backend}")
+    for count, micros in benchmark().items():
+        print(f"{count:>4} bolas: {micros:8.2f} us/tick")
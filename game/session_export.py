@@ -0,0 +1,148 @@
+"""
+Exportação incremental do histórico de partidas (GameSession)
+Lê o banco em blocos (cursor do servidor quando o banco suporta) e gera CSV
+ou JSON por linha sob demanda: o uso de memória não depende do tamanho da tabela
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, time, timedelta
+from typing import Iterator, Optional
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import GameSession
+
+FORMAT_CSV = 'csv'
+FORMAT_NDJSON = 'ndjson'
+FORMATS = (FORMAT_CSV, FORMAT_NDJSON)
+CONTENT_TYPES = {
+    FORMAT_CSV: 'text/csv; charset=utf-8',
+    FORMAT_NDJSON: 'application/x-ndjson; charset=utf-8',
+}
+
+# Linhas lidas do banco (e gravadas na saída) por vez
+DEFAULT_CHUNK_SIZE = 2000
+
+# Colunas exportadas: (nome na saída, campo consultado)
+COLUMNS = (
+    ('id', 'id'),
+    ('player', 'player__name'),
+    ('difficulty', 'difficulty'),
+    ('player_score', 'player_score'),
+    ('bot_score', 'bot_score'),
+    ('game_duration', 'game_duration'),
+    ('won', 'won'),
+    ('verified', 'verified'),
+    ('created_at', 'created_at'),
+)
+DIFFICULTIES = tuple(value for value, _ in GameSession._meta.get_field('difficulty').choices)
+
+
+def parse_bound(value: Optional[str], end: bool = False) -> Optional[datetime]:
+    """
+    Converte o limite de um filtro de data
+
+    Args:
+        value (Optional[str]): Data (AAAA-MM-DD) ou data/hora ISO
+        end (bool): True para o limite final (exclusivo; uma data inclui o dia inteiro)
+
+    Returns:
+        Optional[datetime]: Instante correspondente ou None se vazio
+
+    Raises:
+        ValueError: Se o valor não for uma data válida
+    """
+    if not value:
+        return None
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f"Data inválida: {value}")
+        if end:
+            day += timedelta(days=1)
+        moment = datetime.combine(day, time.min)
+    if settings.USE_TZ and timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def export_rows(since: Optional[datetime] = None, until: Optional[datetime] = None,
+                difficulty: Optional[str] = None):
+    """
+    Consulta das partidas exportadas (com o nome do jogador via JOIN), em ordem de id
+
+    Raises:
+        ValueError: Se a dificuldade não existir
+    """
+    rows = GameSession.objects.order_by('id')
+    if since is not None:
+        rows = rows.filter(created_at__gte=since)
+    if until is not None:
+        rows = rows.filter(created_at__lt=until)
+    if difficulty:
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Dificuldade inválida: {difficulty} (use {', '.join(DIFFICULTIES)})")
+        rows = rows.filter(difficulty=difficulty)
+    return rows.values_list(*(field for _, field in COLUMNS))
+
+
+def _format_datetime(value: datetime) -> str:
+    if settings.USE_TZ and timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.isoformat()
+
+
+def iter_export(rows, export_format: str = FORMAT_CSV,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Prepara a exportação em pedaços de texto, um por bloco de linhas lidas
+
+    Args:
+        rows: Consulta retornada por export_rows
+        export_format (str): "csv" ou "ndjson"
+        chunk_size (int): Linhas lidas do banco por vez
+
+    Returns:
+        Iterator[str]: Trechos da saída (cabeçalho + um bloco de linhas cada)
+
+    Raises:
+        ValueError: Se o formato não existir (antes de começar a gerar)
+    """
+    if export_format not in FORMATS:
+        raise ValueError(f"Formato inválido: {export_format} (use {', '.join(FORMATS)})")
+    return _generate_export(rows, export_format, chunk_size)
+
+
+def _generate_export(rows, export_format: str, chunk_size: int) -> Iterator[str]:
+    names = [name for name, _ in COLUMNS]
+    created_at_column = names.index('created_at')
+    buffer = io.StringIO()
+    writer = None
+    if export_format == FORMAT_CSV:
+        writer = csv.writer(buffer)
+        writer.writerow(names)
+
+    pending = 0
+    for row in rows.iterator(chunk_size=chunk_size):
+        row = list(row)
+        row[created_at_column] = _format_datetime(row[created_at_column])
+        if writer is not None:
+            writer.writerow(['' if value is None else value for value in row])
+        else:
+            buffer.write(json.dumps(dict(zip(names, row)), ensure_ascii=False))
+            buffer.write('\n')
+        pending += 1
+        if pending >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    remaining = buffer.getvalue()
+    if remaining:
+        yield remaining
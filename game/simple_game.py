@@ -1,11 +1,13 @@
 import random
-import time
+
+from .clock import GameClock
 
 class SimpleGame:
     """Versão simplificada do jogo para funcionar na Vercel"""
     
-    def __init__(self, difficulty='normal'):
+    def __init__(self, difficulty='normal', clock=None):
         self.difficulty = difficulty
+        self.clock = clock if clock is not None else GameClock()
         self.canvas_width = 800
         self.canvas_height = 600
         self.ball_radius = 10
@@ -53,11 +55,11 @@ class SimpleGame:
         self.game_over = False
         self.winner = None
         self.remaining_time = 120  # 2 minutos
-        self.start_time = time.time()
+        self.start_tick = self.clock.ticks
         
     def start_game(self):
         """Inicia o jogo"""
-        self.start_time = time.time()
+        self.start_tick = self.clock.ticks
         self.game_over = False
         self.winner = None
         
@@ -66,8 +68,9 @@ class SimpleGame:
         if self.game_over:
             return
             
-        # Atualizar tempo
-        elapsed = time.time() - self.start_time
+        # Atualizar tempo (relógio virtual, um tick por update)
+        self.clock.tick()
+        elapsed = self.clock.seconds_since(self.start_tick)
         self.remaining_time = max(0, 120 - int(elapsed))
         
         # Mover raquete do jogador
@@ -15,4 +15,5 @@ urlpatterns = [
     path('api/update-game/', views.update_game, name='update_game'),
     path('api/end-game/', views.end_game, name='end_game'),
     path('ranking/', views.ranking, name='ranking'),
+    path('api/export-sessions/', views.export_sessions, name='export_sessions'),
 ]
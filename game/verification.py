@@ -0,0 +1,144 @@
+"""
+Verificação de partidas por re-simulação
+Reexecuta partidas terminadas a partir da semente e do log de entradas,
+sem renderização e sem relógio real, em um pool de processos
+"""
+
+import random
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from .clock import GameClock
+from .input_log import InputLog
+
+# Motores suportados
+ENGINE_FULL = 'full'        # game.game_logic.Game (views.py)
+ENGINE_MINIMAL = 'minimal'  # game.minimal_engine (urls_minimal.py)
+
+
+def _replay_full(difficulty: str, log: InputLog) -> Dict[str, Any]:
+    from .game_logic import Game
+
+    game = Game(difficulty=difficulty, seed=log.seed)
+    game.start_game()
+    for direction in log.directions():
+        game.update(direction)
+    return {
+        'player_score': game.player_score,
+        'bot_score': game.bot_score,
+        'winner': game.winner
+    }
+
+
+def _replay_minimal(difficulty: str, log: InputLog) -> Dict[str, Any]:
+    from .minimal_engine import create_game_state, update_game_state, create_planner
+
+    clock = GameClock()
+    rng = random.Random(log.seed)
+    planner = create_planner()
+    state = create_game_state(difficulty, 'classic', rng, clock.ticks)
+    for direction in log.directions():
+        update_game_state(state, direction, clock, rng, planner)
+    return {
+        'player_score': state['player_score'],
+        'bot_score': state['bot_score'],
+        'winner': state['winner']
+    }
+
+
+def replay_match(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Re-simula uma partida e compara com o resultado informado
+
+    Args:
+        record (Dict[str, Any]): Partida com as chaves 'engine', 'difficulty',
+            'input_log' (bytes), 'player_score' e 'bot_score'; 'id' é opcional
+            e apenas repassado no resultado
+
+    Returns:
+        Dict[str, Any]: {'id', 'verified', 'reason', 'player_score', 'bot_score', 'winner'}
+    """
+    result = {
+        'id': record.get('id'),
+        'verified': False,
+        'reason': None,
+        'player_score': None,
+        'bot_score': None,
+        'winner': None
+    }
+    raw_log = record.get('input_log')
+    if not raw_log:
+        result['reason'] = 'sem log de entradas'
+        return result
+
+    try:
+        log = InputLog.from_bytes(raw_log)
+    except ValueError as e:
+        result['reason'] = str(e)
+        return result
+    if log.truncated:
+        result['reason'] = 'log truncado'
+        return result
+
+    engine = record.get('engine', ENGINE_FULL)
+    if engine == ENGINE_FULL:
+        replayed = _replay_full(record.get('difficulty', 'normal'), log)
+    elif engine == ENGINE_MINIMAL:
+        replayed = _replay_minimal(record.get('difficulty', 'normal'), log)
+    else:
+        result['reason'] = f"motor desconhecido: {engine}"
+        return result
+
+    result.update(replayed)
+    if (replayed['player_score'] == record.get('player_score') and
+            replayed['bot_score'] == record.get('bot_score')):
+        result['verified'] = True
+    else:
+        result['reason'] = 'placar divergente'
+    return result
+
+
+class MatchVerifier:
+    """Verificador de partidas com pool de processos e encapsulamento"""
+
+    def __init__(self, max_workers: Optional[int] = None, chunksize: int = 32):
+        """
+        Args:
+            max_workers (Optional[int]): Processos do pool (None = núcleos da CPU)
+            chunksize (int): Partidas enviadas por lote a cada processo
+        """
+        self.__max_workers = max_workers
+        self.__chunksize = max(1, chunksize)
+        self.__executor: Optional[ProcessPoolExecutor] = None
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        """Cria o pool sob demanda"""
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(max_workers=self.__max_workers)
+        return self.__executor
+
+    def submit(self, record: Dict[str, Any]) -> Future:
+        """Agenda a verificação de uma partida"""
+        return self.__get_executor().submit(replay_match, record)
+
+    def verify(self, record: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Verifica uma partida e aguarda o resultado"""
+        return self.submit(record).result(timeout=timeout)
+
+    def verify_many(self, records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Verifica várias partidas em paralelo
+
+        Args:
+            records: Partidas no formato aceito por replay_match
+
+        Returns:
+            List[Dict[str, Any]]: Resultados na mesma ordem das partidas
+        """
+        return list(self.__get_executor().map(replay_match, records, chunksize=self.__chunksize))
+
+    def shutdown(self, wait: bool = True):
+        """Encerra o pool de processos"""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=wait)
+            self.__executor = None
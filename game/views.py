@@ -1,5 +1,5 @@
 from django.shortcuts import render, redirect
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.conf import settings
@@ -30,6 +30,26 @@ except Exception as e:
     print(f"Simple game não disponível: {e}")
     SIMPLE_GAME_AVAILABLE = False
 
+# Verificação de partidas por re-simulação (pool de processos criado sob demanda)
+try:
+    from .verification import MatchVerifier, ENGINE_FULL
+    match_verifier = MatchVerifier()
+    VERIFICATION_AVAILABLE = True
+except Exception as e:
+    print(f"Verificação de partidas não disponível: {e}")
+    VERIFICATION_AVAILABLE = False
+
+# Exportação do histórico de partidas em blocos (CSV / JSON por linha)
+try:
+    from .session_export import CONTENT_TYPES, FORMAT_CSV, export_rows, iter_export, parse_bound
+    EXPORT_AVAILABLE = True
+except Exception as e:
+    print(f"Exportação de partidas não disponível: {e}")
+    EXPORT_AVAILABLE = False
+
+# Tempo máximo (s) esperando a verificação; depois disso a partida fica pendente
+VERIFICATION_TIMEOUT = 10
+
 # Instância global do jogo (em produção, usar Redis ou banco)
 current_game = None
 
@@ -137,6 +157,8 @@ def end_game(request):
         print(f"⚙️  Dificuldade: {difficulty}")
         print(f"💾 Banco disponível: {DB_AVAILABLE}")
         
+        verified = None
+        
         # Salvar no banco de dados se disponível
         if DB_AVAILABLE:
             try:
@@ -151,22 +173,58 @@ def end_game(request):
                 else:
                     print(f"📝 Jogador existente: {player_name}")
                 
+                # Log de entradas para replay/auditoria (apenas no motor completo)
+                input_log = getattr(current_game, 'input_log', None)
+                input_log_bytes = input_log.to_bytes() if input_log else None
+                
+                # Re-simula a partida; só resultados verificados entram no ranking
+                # (False só quando a re-simulação discorda; sem verificação fica pendente)
+                verified = False
+                if input_log_bytes and not VERIFICATION_AVAILABLE:
+                    verified = None
+                    print("⏳ Verificação indisponível: partida pendente para o comando verify_sessions")
+                elif input_log_bytes:
+                    try:
+                        verification = match_verifier.verify({
+                            'engine': ENGINE_FULL,
+                            'difficulty': difficulty,
+                            'input_log': input_log_bytes,
+                            'player_score': player_score,
+                            'bot_score': bot_score
+                        }, timeout=VERIFICATION_TIMEOUT)
+                        verified = verification['verified']
+                        if not verified:
+                            print(f"🚫 Partida não verificada: {verification['reason']}")
+                    except Exception as verify_error:
+                        # Fica pendente para o comando verify_sessions
+                        verified = None
+                        print(f"⏳ Verificação adiada: {verify_error}")
+                else:
+                    print("🚫 Partida sem log de entradas: não será promovida ao ranking")
+                
                 # Atualizar estatísticas do jogador
-                player.add_game_result(player_score, won)
-                print(f"📈 Estatísticas atualizadas - Total jogos: {player.total_games}, Vitórias: {player.total_wins}, Melhor: {player.best_score}")
+                if verified:
+                    player.add_game_result(player_score, won)
+                    print(f"📈 Estatísticas atualizadas - Total jogos: {player.total_games}, Vitórias: {player.total_wins}, Melhor: {player.best_score}")
                 
                 # Criar sessão de jogo
                 game_duration = 120 - current_game.get_remaining_time()
+                
                 game_session = GameSession.objects.create(
                     player=player,
                     difficulty=difficulty,
                     player_score=player_score,
                     bot_score=bot_score,
                     game_duration=game_duration,
-                    won=won
+                    won=won,
+                    rng_seed=input_log.seed if input_log else None,
+                    input_log=input_log_bytes,
+                    verified=verified
                 )
                 
                 print(f"✅ Sessão de jogo salva: ID {game_session.id}")
+                if input_log:
+                    print(f"🎞️  Log de entradas: {len(game_session.input_log)} bytes ({input_log.run_count} runs)")
                 print(f"✅ Partida salva: {player_name} - {difficulty} - {player_score}x{bot_score} - {'Vitória' if won else 'Derrota'}")
                 print(f"{'='*60}\n")
                 
@@ -184,7 +242,8 @@ def end_game(request):
             },
             'winner': current_game.winner,
             'won': won,
-            'saved': DB_AVAILABLE
+            'saved': DB_AVAILABLE,
+            'verified': verified
         }
         
         # Limpar jogo atual
@@ -219,16 +278,18 @@ def ranking(request):
         players_list = list(players)
         players_list.sort(key=lambda p: p.win_rate, reverse=True)
         
-        recent_games = GameSession.objects.select_related('player').order_by('-created_at')[:10]
+        # Só partidas verificadas: pendentes e rejeitadas não aparecem nem entram nas contagens
+        verified_games = GameSession.objects.filter(verified=True)
+        recent_games = verified_games.select_related('player').order_by('-created_at')[:10]
         
         # Estatísticas por dificuldade
-        easy_games = GameSession.objects.filter(difficulty='fácil').count()
-        normal_games = GameSession.objects.filter(difficulty='normal').count()
-        hard_games = GameSession.objects.filter(difficulty='difícil').count()
-        expert_games = GameSession.objects.filter(difficulty='expert').count()
+        easy_games = verified_games.filter(difficulty='fácil').count()
+        normal_games = verified_games.filter(difficulty='normal').count()
+        hard_games = verified_games.filter(difficulty='difícil').count()
+        expert_games = verified_games.filter(difficulty='expert').count()
         
         # Total de partidas
-        total_games = GameSession.objects.count()
+        total_games = verified_games.count()
         
         context = {
             'players': players_list,
@@ -255,3 +316,31 @@ def ranking(request):
             'db_error': str(e)
         }
         return render(request, 'game/ranking.html', context)
+
+
+@require_http_methods(["GET"])
+def export_sessions(request):
+    """
+    Exporta o histórico de partidas (?format=csv|ndjson&since=&until=&difficulty=) em streaming
+    Restrito a staff e desligado por padrão (settings.EXPORT_SESSIONS_ENABLED)
+    """
+    if not getattr(settings, 'EXPORT_SESSIONS_ENABLED', False):
+        return JsonResponse({'error': 'Exportação desativada (use o comando export_sessions)'}, status=404)
+    if not request.user.is_authenticated or not request.user.is_staff:
+        return JsonResponse({'error': 'Acesso restrito a administradores'}, status=403)
+    if not DB_AVAILABLE or not EXPORT_AVAILABLE:
+        return JsonResponse({'error': 'Banco de dados não disponível'}, status=503)
+    
+    export_format = request.GET.get('format', FORMAT_CSV)
+    try:
+        rows = export_rows(since=parse_bound(request.GET.get('since')),
+                           until=parse_bound(request.GET.get('until'), end=True),
+                           difficulty=request.GET.get('difficulty'))
+        chunks = iter_export(rows, export_format)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    # Cada bloco lido do banco vai direto para a resposta
+    response = StreamingHttpResponse(chunks, content_type=CONTENT_TYPES.get(export_format))
+    response['Content-Disposition'] = f'attachment; filename="partidas.{export_format}"'
+    return response
@@ -253,3 +253,9 @@ def end_game(request):
 
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
+
+
+@require_http_methods(["GET"])
+def export_sessions(request):
+    """Exportação do histórico: indisponível sem banco de dados"""
+    return JsonResponse({'error': 'Banco de dados não disponível'}, status=503)
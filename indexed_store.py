@@ -0,0 +1,561 @@
+"""
+Classe IndexedStore - Armazenamento de registros com índice nome -> posição no arquivo
+Implementa encapsulamento com atributos privados e métodos públicos
+
+O snapshot é o mesmo JSON do modo tradicional (``{"players": [...]}``), mas
+gravado com um registro por linha. O arquivo ``<snapshot>.idx`` guarda, para
+cada chave, a posição e o tamanho do registro (e um campo de resumo, como o
+best_score), permitindo ler só os registros usados através de um mmap.
+As alterações usam o mesmo journal append-only do JournalStore, inclusive a
+trava ``<snapshot>.lock`` e a leitura incremental das alterações de outros
+processos.
+"""
+
+import json
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from file_lock import FileLock, temp_path
+from journal_store import _file_stamp
+
+INDEX_VERSION = 2
+
+# Entrada do índice: (fonte, posição, tamanho, resumo)
+Entry = Tuple[int, int, int, Any]
+
+
+class IndexedStore:
+    def __init__(self, snapshot_path: str, decode: Callable[[Any], Dict[str, Any]],
+                 list_key: str = "players", summary_field: str = "best_score",
+                 compact_threshold: int = 256, background: bool = True):
+        """
+        Inicializa o armazenamento (o índice só é lido no primeiro acesso)
+
+        Args:
+            snapshot_path (str): Arquivo JSON de snapshot (ex.: players.json)
+            decode (Callable): Converte um snapshot em formato antigo no dicionário de registros
+            list_key (str): Chave da lista de registros no snapshot
+            summary_field (str): Campo do registro mantido no índice
+            compact_threshold (int): Registros no journal que disparam a compactação
+            background (bool): Compacta em uma thread separada
+        """
+        self.__snapshot_path = snapshot_path
+        self.__index_path = snapshot_path + ".idx"
+        self.__journal_path = snapshot_path + ".journal"
+        self.__rotated_path = snapshot_path + ".journal.old"
+        self.__decode = decode
+        self.__list_key = list_key
+        self.__summary_field = summary_field
+        self.__compact_threshold = max(1, compact_threshold)
+        self.__background = background
+
+        self.__lock = threading.RLock()
+        self.__file_lock = FileLock(snapshot_path + ".lock")
+        self.__index: Optional[Dict[str, Entry]] = None
+        self.__cache: Dict[str, Any] = {}  # registros já lidos
+        self.__sources: Dict[int, Dict[str, Any]] = {}  # id -> {kind, path, reader}
+        self.__next_source = 0
+        self.__snapshot_source: Optional[int] = None
+        self.__journal_source: Optional[int] = None
+        self.__journal_writer = None
+        self.__journal_size = 0
+        self.__journal_records = 0
+        self.__compaction_thread: Optional[threading.Thread] = None
+        # Estado dos arquivos já aplicado ao índice
+        self.__snapshot_stamp = None
+        self.__rotated_stamp = None
+        self.__journal_inode = None
+
+    # ---------------------- Fontes (arquivos) ----------------------
+    def __add_source(self, kind: str, path: str) -> int:
+        source_id = self.__next_source
+        self.__next_source += 1
+        self.__sources[source_id] = {"kind": kind, "path": path, "reader": None}
+        return source_id
+
+    def __open_reader(self, source_id: int) -> bool:
+        """
+        Abre a fonte já na carga: outro processo pode trocar o arquivo pelo
+        mesmo nome depois, mas o descritor aberto continua no conteúdo indexado
+
+        Returns:
+            bool: True se o arquivo existe
+        """
+        source = self.__sources[source_id]
+        if source["reader"] is not None:
+            return True
+        try:
+            with open(source["path"], 'rb') as f:
+                if source["kind"] == "snapshot":
+                    source["reader"] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    return True
+        except (OSError, ValueError):
+            return False
+        try:
+            source["reader"] = open(source["path"], 'rb')
+        except OSError:
+            return False
+        if source_id == self.__journal_source:
+            self.__journal_inode = os.fstat(source["reader"].fileno()).st_ino
+        return True
+
+    def __close_source(self, source_id: int):
+        source = self.__sources.pop(source_id, None)
+        if source is not None and source["reader"] is not None:
+            source["reader"].close()
+
+    def __read_bytes(self, source_id: int, offset: int, length: int) -> bytes:
+        """Lê um trecho de uma fonte (snapshot via mmap, journals via arquivo)"""
+        source = self.__sources[source_id]
+        if source["reader"] is None:
+            self.__open_reader(source_id)
+        reader = source["reader"]
+        if source["kind"] == "snapshot":
+            return reader[offset:offset + length]
+        reader.seek(offset)
+        return reader.read(length)
+
+    def __read_record(self, entry: Entry) -> Any:
+        source_id, offset, length, _ = entry
+        data = json.loads(self.__read_bytes(source_id, offset, length))
+        if self.__sources[source_id]["kind"] == "snapshot":
+            return data
+        return data["value"]
+
+    # ---------------------- Carga do índice ----------------------
+    def __ensure_loaded(self):
+        """Carrega o índice e reaplica os journals no primeiro acesso"""
+        if self.__index is not None:
+            return
+        # Sob a trava de arquivo: snapshot, .idx e journals lidos num estado consistente
+        with self.__lock, self.__file_lock:
+            if self.__index is not None:
+                return
+            index: Dict[str, Entry] = {}
+            self.__snapshot_source = None
+            if os.path.exists(self.__snapshot_path):
+                if not self.__index_is_current():
+                    self.__rebuild_snapshot()
+                self.__snapshot_source = self.__add_source("snapshot", self.__snapshot_path)
+                if self.__open_reader(self.__snapshot_source):
+                    index = self.__read_index(self.__snapshot_source)
+            self.__snapshot_stamp = _file_stamp(self.__snapshot_path)
+            self.__index = index
+            self.__cache.clear()
+            self.__rotated_stamp = _file_stamp(self.__rotated_path)
+            if self.__rotated_stamp is not None:
+                rotated_source = self.__add_source("journal", self.__rotated_path)
+                if self.__open_reader(rotated_source):
+                    self.__scan_journal(rotated_source, 0)
+            self.__journal_source = self.__add_source("journal", self.__journal_path)
+            self.__journal_inode = None
+            self.__journal_records, self.__journal_size = 0, 0
+            if self.__open_reader(self.__journal_source):
+                self.__journal_records, self.__journal_size = self.__scan_journal(self.__journal_source, 0)
+
+    def __reset(self):
+        """Descarta índice e arquivos abertos (recarregados no próximo acesso)"""
+        if self.__journal_writer is not None:
+            self.__journal_writer.close()
+            self.__journal_writer = None
+        for source_id in list(self.__sources):
+            self.__close_source(source_id)
+        self.__index = None
+        self.__cache.clear()
+
+    def refresh(self) -> bool:
+        """
+        Acompanha alterações feitas por outros processos
+
+        Se só o journal cresceu, indexa apenas as linhas novas; se houve
+        compactação (snapshot ou journal trocados), recarrega o índice.
+
+        Returns:
+            bool: True se algo mudou
+        """
+        if self.__index is None:
+            return False  # ainda não carregado: a carga já lê o estado atual
+        with self.__lock:
+            journal_stamp = _file_stamp(self.__journal_path)
+            journal_inode = journal_stamp[0] if journal_stamp else None
+            if (_file_stamp(self.__snapshot_path) != self.__snapshot_stamp or
+                    _file_stamp(self.__rotated_path) != self.__rotated_stamp or
+                    (journal_inode != self.__journal_inode and
+                     (self.__journal_inode is not None or self.__journal_size))):
+                self.__reset()
+                self.__ensure_loaded()
+                return True
+            if journal_stamp is None or journal_stamp[2] <= self.__journal_size:
+                return False
+            if not self.__open_reader(self.__journal_source):
+                return False
+            count, self.__journal_size = self.__scan_journal(self.__journal_source, self.__journal_size)
+            self.__journal_records += count
+            return count > 0
+
+    @contextmanager
+    def transaction(self):
+        """
+        Trava os arquivos e sincroniza com outros processos (ler-alterar-gravar seguro)
+
+        Yields:
+            bool: True se o estado em memória foi atualizado ao entrar
+        """
+        self.__ensure_loaded()
+        with self.__lock, self.__file_lock:
+            yield self.refresh()
+
+    def __index_is_current(self) -> bool:
+        """True se o .idx corresponde ao snapshot atual"""
+        try:
+            snapshot_stat = os.stat(self.__snapshot_path)
+            index_stat = os.stat(self.__index_path)
+            with open(self.__index_path, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline())
+        except (OSError, json.JSONDecodeError):
+            return False
+        return (header.get("version") == INDEX_VERSION and
+                header.get("snapshot_size") == snapshot_stat.st_size and
+                index_stat.st_mtime_ns >= snapshot_stat.st_mtime_ns)
+
+    def __read_index(self, source_id: int) -> Dict[str, Entry]:
+        """Lê o .idx: cabeçalho + objeto JSON chave -> [posição, tamanho, resumo]"""
+        with open(self.__index_path, 'r', encoding='utf-8') as f:
+            f.readline()  # cabeçalho
+            positions = json.loads(f.readline() or "{}")
+        return {key: (source_id, offset, length, summary)
+                for key, (offset, length, summary) in positions.items()}
+
+    def __scan_journal(self, source_id: int, offset: int) -> Tuple[int, int]:
+        """
+        Reaplica um journal sobre o índice guardando a posição de cada registro
+
+        Args:
+            source_id (int): Fonte (journal já aberto)
+            offset (int): Posição a partir da qual ler
+
+        Returns:
+            Tuple[int, int]: (registros aplicados, posição após a última linha completa)
+        """
+        count = 0
+        index = self.__index
+        cache = self.__cache
+        reader = self.__sources[source_id]["reader"]
+        reader.seek(offset)
+        for line in reader:
+            if not line.endswith(b"\n"):
+                break  # linha ainda sendo gravada por outro processo
+            line_offset = offset
+            offset += len(line)
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # linha corrompida (queda durante a escrita)
+            op = record.get("op")
+            if op == "put":
+                key = record["key"]
+                index.pop(key, None)
+                cache.pop(key, None)
+                index[key] = (source_id, line_offset, len(line),
+                              record["value"].get(self.__summary_field))
+            elif op == "del":
+                index.pop(record["key"], None)
+                cache.pop(record["key"], None)
+            elif op == "clear":
+                index.clear()
+                cache.clear()
+            count += 1
+        return count, offset
+
+    def __rebuild_snapshot(self):
+        """Converte um snapshot sem índice válido (ex.: gravado com indent) para o formato indexado"""
+        try:
+            with open(self.__snapshot_path, 'r', encoding='utf-8') as f:
+                records = self.__decode(json.load(f))
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError):
+            records = {}
+        lines = ((key, json.dumps(value, ensure_ascii=False).encode('utf-8'),
+                  value.get(self.__summary_field)) for key, value in records.items())
+        temps = self.__temp_paths()
+        self.__write_temp_files(lines, *temps)
+        self.__install_temp_files(*temps)
+
+    def __temp_paths(self) -> Tuple[str, str]:
+        """Temporários exclusivos deste processo/thread para snapshot e .idx"""
+        return temp_path(self.__snapshot_path), temp_path(self.__index_path)
+
+    def __write_temp_files(self, lines, snapshot_temp: str, index_temp: str) -> Dict[str, Tuple[int, int, Any]]:
+        """
+        Grava snapshot (um registro por linha) e .idx em arquivos temporários
+
+        Args:
+            lines: Iterável de (chave, bytes do registro, resumo)
+            snapshot_temp (str): Temporário do snapshot
+            index_temp (str): Temporário do .idx
+
+        Returns:
+            Dict[str, Tuple[int, int, Any]]: chave -> (posição, tamanho, resumo)
+        """
+        positions: Dict[str, Tuple[int, int, Any]] = {}
+        with open(snapshot_temp, 'wb') as data_file:
+            header = ('{"%s": [\n' % self.__list_key).encode('utf-8')
+            data_file.write(header)
+            offset = len(header)
+            first = True
+            for key, raw, summary in lines:
+                if not first:
+                    data_file.write(b",\n")
+                    offset += 2
+                first = False
+                data_file.write(raw)
+                positions[key] = (offset, len(raw), summary)
+                offset += len(raw)
+            data_file.write(b"\n]}\n")
+            snapshot_size = offset + 4
+        with open(index_temp, 'w', encoding='utf-8') as index_file:
+            index_file.write(json.dumps({"version": INDEX_VERSION, "snapshot_size": snapshot_size}) + "\n")
+            json.dump(positions, index_file, ensure_ascii=False, separators=(',', ':'))
+            index_file.write("\n")
+        return positions
+
+    def __install_temp_files(self, snapshot_temp: str, index_temp: str):
+        """Troca snapshot e .idx pelos temporários (snapshot primeiro: se cair no meio,
+        o .idx antigo fica mais velho que o snapshot e é descartado na próxima carga)"""
+        os.replace(snapshot_temp, self.__snapshot_path)
+        os.replace(index_temp, self.__index_path)
+
+    @staticmethod
+    def __discard_temp_files(*paths: str):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    # ---------------------- Leitura ----------------------
+    def get(self, key: str, default: Any = None) -> Any:
+        cached = self.__cache.get(key)
+        if cached is not None:
+            return cached
+        self.__ensure_loaded()
+        with self.__lock:
+            entry = self.__index.get(key)
+            if entry is None:
+                return default
+            value = self.__cache[key] = self.__read_record(entry)
+            return value
+
+    def __contains__(self, key: str) -> bool:
+        self.__ensure_loaded()
+        return key in self.__index
+
+    def __len__(self) -> int:
+        self.__ensure_loaded()
+        return len(self.__index)
+
+    def __iter__(self) -> Iterator[str]:
+        self.__ensure_loaded()
+        return iter(list(self.__index))
+
+    def values(self):
+        """Lê todos os registros (sob demanda, um a um)"""
+        return [self.get(key) for key in self]
+
+    def items(self):
+        return [(key, self.get(key)) for key in self]
+
+    def summaries(self) -> Iterator[Tuple[str, Any]]:
+        """Pares (chave, resumo) lidos só do índice, sem abrir os registros"""
+        self.__ensure_loaded()
+        return iter([(key, entry[3]) for key, entry in self.__index.items()])
+
+    # ---------------------- Escrita ----------------------
+    def __append(self, record: Dict[str, Any]) -> Tuple[int, int]:
+        """Acrescenta um registro ao journal e retorna (posição, tamanho)"""
+        raw = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+        if self.__journal_writer is None:
+            self.__journal_writer = open(self.__journal_path, 'ab')
+            self.__open_reader(self.__journal_source)
+        offset = self.__journal_size
+        self.__journal_writer.write(raw)
+        self.__journal_writer.flush()
+        self.__journal_size += len(raw)
+        self.__journal_records += 1
+        return offset, len(raw)
+
+    def __after_write(self):
+        if self.__journal_records >= self.__compact_threshold:
+            self.compact(wait=not self.__background)
+
+    def put(self, key: str, value: Any):
+        """Grava (ou substitui) o registro de uma chave"""
+        with self.transaction():
+            try:
+                offset, length = self.__append({"op": "put", "key": key, "value": value})
+            except OSError as e:
+                print(f"Erro ao gravar journal {self.__journal_path}: {e}")
+                return
+            self.__index.pop(key, None)
+            self.__index[key] = (self.__journal_source, offset, length, value.get(self.__summary_field))
+            self.__cache[key] = value
+            self.__after_write()
+
+    def delete(self, key: str):
+        """Remove uma chave (sem efeito se não existir)"""
+        with self.transaction():
+            if key not in self.__index:
+                return
+            try:
+                self.__append({"op": "del", "key": key})
+            except OSError as e:
+                print(f"Erro ao gravar journal {self.__journal_path}: {e}")
+                return
+            self.__index.pop(key, None)
+            self.__cache.pop(key, None)
+            self.__after_write()
+
+    def clear(self):
+        """Remove todas as chaves"""
+        with self.transaction():
+            try:
+                self.__append({"op": "clear"})
+            except OSError as e:
+                print(f"Erro ao gravar journal {self.__journal_path}: {e}")
+                return
+            self.__index.clear()
+            self.__cache.clear()
+            self.__after_write()
+
+    # ---------------------- Compactação ----------------------
+    def compact(self, wait: bool = False):
+        """
+        Rotaciona o journal e regrava snapshot + índice com o estado atual
+
+        Args:
+            wait (bool): Aguarda o fim da gravação
+        """
+        thread = self.__compaction_thread
+        if thread is not None and thread.is_alive():
+            if not wait:
+                return
+            thread.join()
+
+        with self.transaction():
+            if not os.path.exists(self.__rotated_path) and self.__journal_records:
+                # Fecha o journal atual e passa a lê-lo pelo nome rotacionado
+                if self.__journal_writer is not None:
+                    self.__journal_writer.close()
+                    self.__journal_writer = None
+                try:
+                    os.replace(self.__journal_path, self.__rotated_path)
+                except OSError as e:
+                    print(f"Erro ao rotacionar journal {self.__journal_path}: {e}")
+                    return
+                self.__sources[self.__journal_source]["path"] = self.__rotated_path
+                self.__rotated_stamp = _file_stamp(self.__rotated_path)
+                self.__journal_source = self.__add_source("journal", self.__journal_path)
+                self.__journal_inode = None
+                self.__journal_size = 0
+                self.__journal_records = 0
+            elif not os.path.exists(self.__rotated_path):
+                return  # nada a compactar
+            frozen = dict(self.__index)
+            # Arquivos próprios da compactação, abertos enquanto os nomes ainda
+            # apontam para o conteúdo indexado (o journal atual só cresce: as
+            # posições já indexadas continuam válidas)
+            handles = {}
+            try:
+                for source_id, source in self.__sources.items():
+                    if self.__open_reader(source_id):
+                        handles[source_id] = (source["kind"], open(source["path"], 'rb'))
+            except OSError as e:
+                print(f"Erro ao compactar {self.__snapshot_path}: {e}")
+                for _, handle in handles.values():
+                    handle.close()
+                return
+            stamps = (self.__snapshot_stamp, self.__rotated_stamp)
+
+        if self.__background and not wait:
+            self.__compaction_thread = threading.Thread(
+                target=self.__compact_frozen, args=(frozen, handles, stamps), daemon=True)
+            self.__compaction_thread.start()
+        else:
+            self.__compact_frozen(frozen, handles, stamps)
+
+    def __compact_frozen(self, frozen: Dict[str, Entry], handles: Dict[int, Tuple[str, Any]], stamps):
+        """Grava o novo snapshot a partir de uma cópia do índice e troca as fontes antigas"""
+
+        def read(entry: Entry) -> bytes:
+            # Fontes congeladas não mudam mais: lidas com arquivos próprios, sem trava
+            source_id, offset, length, _ = entry
+            kind, handle = handles[source_id]
+            handle.seek(offset)
+            raw = handle.read(length)
+            if kind == "snapshot":
+                return raw
+            value = json.loads(raw)["value"]
+            return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+        temps = self.__temp_paths()
+        try:
+            positions = self.__write_temp_files(
+                ((key, read(entry), entry[3]) for key, entry in frozen.items()), *temps)
+        except OSError as e:
+            print(f"Erro ao compactar {self.__snapshot_path}: {e}")
+            self.__discard_temp_files(*temps)
+            return
+        finally:
+            for _, handle in handles.values():
+                handle.close()
+
+        snapshot_stamp, rotated_stamp = stamps
+        with self.__lock, self.__file_lock:
+            if self.__index is None or _file_stamp(self.__snapshot_path) != snapshot_stamp:
+                # Outro processo já instalou um snapshot mais novo
+                self.__discard_temp_files(*temps)
+                return
+            retired = [source_id for source_id in handles if source_id != self.__journal_source]
+            # Fecha o mmap do snapshot antigo antes da troca (necessário no Windows)
+            for source_id in retired:
+                source = self.__sources.get(source_id)
+                if source is not None and source["reader"] is not None:
+                    source["reader"].close()
+                    source["reader"] = None
+            try:
+                self.__install_temp_files(*temps)
+            except OSError as e:
+                print(f"Erro ao compactar {self.__snapshot_path}: {e}")
+                self.__discard_temp_files(*temps)
+                return
+            new_source = self.__add_source("snapshot", self.__snapshot_path)
+            self.__open_reader(new_source)
+            index = self.__index
+            for key, (offset, length, summary) in positions.items():
+                # Só troca quem não foi alterado durante a compactação
+                if index.get(key) is frozen[key]:
+                    index[key] = (new_source, offset, length, summary)
+            for source_id in retired:
+                self.__close_source(source_id)
+            self.__snapshot_source = new_source
+            self.__snapshot_stamp = _file_stamp(self.__snapshot_path)
+            if rotated_stamp is not None and _file_stamp(self.__rotated_path) == rotated_stamp:
+                try:
+                    os.remove(self.__rotated_path)
+                    self.__rotated_stamp = None
+                except OSError:
+                    pass
+
+    def close(self):
+        """Aguarda a compactação pendente e fecha os arquivos"""
+        thread = self.__compaction_thread
+        if thread is not None:
+            thread.join()
+        with self.__lock:
+            if self.__journal_writer is not None:
+                self.__journal_writer.close()
+                self.__journal_writer = None
+            for source_id in list(self.__sources):
+                self.__close_source(source_id)
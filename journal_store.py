@@ -0,0 +1,312 @@
+"""
+Classe JournalStore - Dicionário persistente com journal append-only e compactação
+Implementa encapsulamento com atributos privados e métodos públicos
+
+Cada alteração vira uma linha JSON acrescentada ao arquivo ``<snapshot>.journal``.
+De tempos em tempos o journal é rotacionado e compactado em segundo plano no
+arquivo de snapshot (o mesmo JSON usado antes do journal existir).
+
+Vários processos podem compartilhar os mesmos arquivos: as escritas acontecem
+sob a trava ``<snapshot>.lock`` e cada processo acompanha as alterações dos
+outros lendo apenas o trecho novo do journal.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from file_lock import FileLock, temp_path
+
+Decoder = Callable[[Any], Dict[str, Any]]
+Encoder = Callable[[Dict[str, Any]], Any]
+
+
+def _file_stamp(path: str):
+    """Identidade + versão de um arquivo: (inode, mtime, tamanho) ou None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class JournalStore:
+    def __init__(self, snapshot_path: str, decode: Optional[Decoder] = None,
+                 encode: Optional[Encoder] = None, compact_threshold: int = 256,
+                 background: bool = True):
+        """
+        Inicializa o armazenamento e carrega snapshot + journal
+
+        Args:
+            snapshot_path (str): Arquivo JSON de snapshot (ex.: players.json)
+            decode (Optional[Decoder]): Converte o JSON do snapshot no dicionário interno
+            encode (Optional[Encoder]): Converte o dicionário interno no JSON do snapshot
+            compact_threshold (int): Registros no journal que disparam a compactação
+            background (bool): Compacta em uma thread separada
+        """
+        self.__snapshot_path = snapshot_path
+        self.__journal_path = snapshot_path + ".journal"
+        self.__rotated_path = snapshot_path + ".journal.old"
+        self.__decode = decode or (lambda data: dict(data) if isinstance(data, dict) else {})
+        self.__encode = encode or (lambda data: data)
+        self.__compact_threshold = max(1, compact_threshold)
+        self.__background = background
+        self.__file_lock = FileLock(snapshot_path + ".lock")
+        self.__data: Dict[str, Any] = {}
+        self.__journal_records = 0
+        self.__journal_file = None
+        self.__compaction_thread: Optional[threading.Thread] = None
+        # Estado dos arquivos já aplicado em memória
+        self.__snapshot_stamp = None
+        self.__rotated_stamp = None
+        self.__journal_inode = None
+        self.__journal_offset = 0
+        self.__load()
+
+    # ---------------------- Leitura ----------------------
+    def __load(self):
+        """Carrega o snapshot e reaplica os journals pendentes"""
+        self.__close_journal()
+        data: Dict[str, Any] = {}
+        self.__snapshot_stamp = _file_stamp(self.__snapshot_path)
+        if self.__snapshot_stamp is not None:
+            try:
+                with open(self.__snapshot_path, 'r', encoding='utf-8') as f:
+                    data = self.__decode(json.load(f))
+            except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError):
+                data = {}
+        self.__data = data
+        self.__rotated_stamp = _file_stamp(self.__rotated_path)
+        if self.__rotated_stamp is not None:
+            self.__replay(self.__rotated_path, 0)
+        journal_stamp = _file_stamp(self.__journal_path)
+        self.__journal_inode = journal_stamp[0] if journal_stamp else None
+        self.__journal_records, self.__journal_offset = self.__replay(self.__journal_path, 0)
+
+    def __replay(self, path: str, offset: int):
+        """
+        Reaplica um journal a partir de uma posição (só linhas completas)
+
+        Returns:
+            Tuple[int, int]: (registros aplicados, posição após a última linha completa)
+        """
+        count = 0
+        try:
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # linha ainda sendo gravada por outro processo
+                    offset += len(line)
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # linha corrompida (queda durante a escrita)
+                    self.__apply(record)
+                    count += 1
+        except OSError:
+            pass
+        return count, offset
+
+    def __apply(self, record: Dict[str, Any]):
+        """Aplica um registro do journal ao dicionário em memória"""
+        op = record.get("op")
+        if op == "put":
+            # Reinsere no fim: a ordem do dicionário é a ordem da última alteração
+            self.__data.pop(record["key"], None)
+            self.__data[record["key"]] = record["value"]
+        elif op == "del":
+            self.__data.pop(record["key"], None)
+        elif op == "clear":
+            self.__data.clear()
+
+    def refresh(self) -> bool:
+        """
+        Acompanha alterações feitas por outros processos
+
+        Se só o journal cresceu, aplica apenas as linhas novas; se houve
+        compactação (snapshot ou journal trocados), recarrega tudo.
+
+        Returns:
+            bool: True se algo mudou
+        """
+        snapshot_stamp = _file_stamp(self.__snapshot_path)
+        rotated_stamp = _file_stamp(self.__rotated_path)
+        journal_stamp = _file_stamp(self.__journal_path)
+        journal_inode = journal_stamp[0] if journal_stamp else None
+        if (snapshot_stamp != self.__snapshot_stamp or rotated_stamp != self.__rotated_stamp or
+                (journal_inode != self.__journal_inode and
+                 (self.__journal_inode is not None or self.__journal_offset))):
+            self.__load()
+            return True
+        if journal_stamp is None or journal_stamp[2] <= self.__journal_offset:
+            return False
+        self.__journal_inode = journal_inode  # journal criado depois da carga
+        count, self.__journal_offset = self.__replay(self.__journal_path, self.__journal_offset)
+        self.__journal_records += count
+        return count > 0
+
+    @contextmanager
+    def transaction(self):
+        """
+        Trava os arquivos e sincroniza com outros processos (ler-alterar-gravar seguro)
+
+        Yields:
+            bool: True se o estado em memória foi atualizado ao entrar
+        """
+        with self.__file_lock:
+            yield self.refresh()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.__data.get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__data
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__data)
+
+    def values(self):
+        return self.__data.values()
+
+    def items(self):
+        return self.__data.items()
+
+    # ---------------------- Escrita ----------------------
+    def __write(self, record: Dict[str, Any]):
+        """Aplica e acrescenta um registro ao journal (uma única escrita sequencial)"""
+        raw = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+        with self.__file_lock:
+            self.refresh()
+            try:
+                if self.__journal_file is None:
+                    self.__journal_file = open(self.__journal_path, 'ab')
+                    self.__journal_inode = os.fstat(self.__journal_file.fileno()).st_ino
+                self.__journal_file.write(raw)
+                self.__journal_file.flush()
+            except OSError as e:
+                print(f"Erro ao gravar journal {self.__journal_path}: {e}")
+                return
+            self.__apply(record)
+            self.__journal_offset += len(raw)
+            self.__journal_records += 1
+            if self.__journal_records >= self.__compact_threshold:
+                self.compact(wait=not self.__background)
+
+    def put(self, key: str, value: Any):
+        """
+        Grava (ou substitui) o valor de uma chave
+
+        Args:
+            key (str): Chave
+            value (Any): Valor serializável em JSON
+        """
+        self.__write({"op": "put", "key": key, "value": value})
+
+    def delete(self, key: str):
+        """Remove uma chave (sem efeito se não existir)"""
+        if key in self.__data:
+            self.__write({"op": "del", "key": key})
+
+    def clear(self):
+        """Remove todas as chaves"""
+        self.__write({"op": "clear"})
+
+    # ---------------------- Compactação ----------------------
+    def __close_journal(self):
+        if self.__journal_file is not None:
+            try:
+                self.__journal_file.close()
+            except OSError:
+                pass
+            self.__journal_file = None
+
+    def compact(self, wait: bool = False):
+        """
+        Rotaciona o journal e grava um novo snapshot com o estado atual
+
+        Args:
+            wait (bool): Aguarda o fim da gravação do snapshot
+        """
+        thread = self.__compaction_thread
+        if thread is not None and thread.is_alive():
+            if not wait:
+                return  # compactação anterior ainda em andamento
+            thread.join()
+
+        with self.__file_lock:
+            self.refresh()
+            if os.path.exists(self.__rotated_path):
+                # Rotação anterior (deste ou de outro processo) ainda não concluída:
+                # grava o estado atual, que já a inclui
+                self.__write_snapshot(self.__copy_data(), self.__snapshot_stamp, self.__rotated_stamp)
+                return
+            if not os.path.exists(self.__journal_path):
+                return
+
+            # Rotação: novas escritas vão para um journal novo enquanto o antigo é compactado
+            self.__close_journal()
+            try:
+                os.replace(self.__journal_path, self.__rotated_path)
+            except OSError as e:
+                print(f"Erro ao rotacionar journal {self.__journal_path}: {e}")
+                return
+            self.__rotated_stamp = _file_stamp(self.__rotated_path)
+            self.__journal_inode = None
+            self.__journal_offset = 0
+            self.__journal_records = 0
+            data = self.__copy_data()
+            stamps = (self.__snapshot_stamp, self.__rotated_stamp)
+
+        if self.__background and not wait:
+            self.__compaction_thread = threading.Thread(
+                target=self.__write_snapshot, args=(data,) + stamps, daemon=True)
+            self.__compaction_thread.start()
+        else:
+            self.__write_snapshot(data, *stamps)
+
+    def __copy_data(self) -> Dict[str, Any]:
+        """Cópia do estado usada pela compactação (valores planos são copiados)"""
+        return {key: dict(value) if isinstance(value, dict) else value
+                for key, value in self.__data.items()}
+
+    def __write_snapshot(self, data: Dict[str, Any], snapshot_stamp, rotated_stamp):
+        """
+        Grava o snapshot de forma atômica e descarta o journal rotacionado
+
+        Args:
+            data (Dict[str, Any]): Estado congelado no momento da rotação
+            snapshot_stamp: Snapshot sobre o qual ``data`` foi montado
+            rotated_stamp: Journal rotacionado incluído em ``data``
+        """
+        temp = temp_path(self.__snapshot_path)
+        try:
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump(self.__encode(data), f, ensure_ascii=False, indent=2)
+            with self.__file_lock:
+                if _file_stamp(self.__snapshot_path) != snapshot_stamp:
+                    # Outro processo já instalou um snapshot mais novo
+                    os.remove(temp)
+                    return
+                os.replace(temp, self.__snapshot_path)
+                # O conteúdo novo já está em memória: evita recarga desnecessária
+                self.__snapshot_stamp = _file_stamp(self.__snapshot_path)
+                if rotated_stamp is not None and _file_stamp(self.__rotated_path) == rotated_stamp:
+                    os.remove(self.__rotated_path)
+                    self.__rotated_stamp = None
+        except OSError as e:
+            print(f"Erro ao compactar {self.__snapshot_path}: {e}")
+            if os.path.exists(temp):
+                os.remove(temp)
+
+    def close(self):
+        """Aguarda a compactação pendente e fecha o journal"""
+        thread = self.__compaction_thread
+        if thread is not None:
+            thread.join()
+        self.__close_journal()
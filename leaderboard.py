@@ -0,0 +1,123 @@
+"""
+Classe Leaderboard - Índice ordenado de pontuações mantido incrementalmente
+Implementa encapsulamento com atributos privados e métodos públicos
+"""
+
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+# sortedcontainers (requirements): inserções/remoções em O(log n); sem ele, lista ordenada
+try:
+    from sortedcontainers import SortedList
+    SORTEDCONTAINERS_AVAILABLE = True
+except ImportError:
+    SortedList = None
+    SORTEDCONTAINERS_AVAILABLE = False
+
+
+class Leaderboard:
+    """
+    Ranking ordenado por pontuação (maior primeiro)
+
+    Em caso de empate fica na frente quem foi atualizado antes, o mesmo critério
+    da ordenação estável usada no ranking original.
+    """
+
+    def __init__(self, items: Iterable[Tuple[Hashable, int]] = ()):
+        """
+        Inicializa o índice
+
+        Args:
+            items: Pares (chave, pontuação) já na ordem de desempate
+        """
+        self.__use_sorted_list = SORTEDCONTAINERS_AVAILABLE
+        self.__order = SortedList() if self.__use_sorted_list else []
+        self.__entries: Dict[Hashable, Tuple[int, int, Hashable]] = {}
+        self.__sequence = 0
+        # Chave repetida: a última ocorrência substitui a anterior no dicionário
+        for key, score in items:
+            self.__entries[key] = (-score, self.__sequence, key)
+            self.__sequence += 1
+        entries = sorted(self.__entries.values())
+        if self.__use_sorted_list:
+            self.__order.update(entries)
+        else:
+            self.__order = entries
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__entries
+
+    def update(self, key: Hashable, score: int):
+        """
+        Insere ou atualiza a pontuação de uma chave (vai para o fim dos empates)
+
+        Args:
+            key (Hashable): Identificador (ex.: nome em minúsculas)
+            score (int): Nova pontuação
+        """
+        old = self.__entries.get(key)
+        if old is not None:
+            self.__discard(old)
+        entry = (-score, self.__sequence, key)
+        self.__sequence += 1
+        self.__entries[key] = entry
+        if self.__use_sorted_list:
+            self.__order.add(entry)
+        else:
+            insort(self.__order, entry)
+
+    def remove(self, key: Hashable):
+        """Remove uma chave (sem efeito se não existir)"""
+        old = self.__entries.pop(key, None)
+        if old is not None:
+            self.__discard(old)
+
+    def __discard(self, entry: Tuple[int, int, Hashable]):
+        if self.__use_sorted_list:
+            self.__order.remove(entry)
+        else:
+            del self.__order[bisect_left(self.__order, entry)]
+
+    def clear(self):
+        """Remove todas as chaves"""
+        self.__entries.clear()
+        self.__order.clear()
+
+    def score(self, key: Hashable) -> Optional[int]:
+        """Retorna a pontuação de uma chave ou None"""
+        entry = self.__entries.get(key)
+        return -entry[0] if entry is not None else None
+
+    def rank(self, key: Hashable) -> Optional[int]:
+        """
+        Retorna a posição (1 = primeiro) de uma chave
+
+        Args:
+            key (Hashable): Identificador
+
+        Returns:
+            Optional[int]: Posição ou None se a chave não estiver no índice
+        """
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        if self.__use_sorted_list:
+            return self.__order.bisect_left(entry) + 1
+        return bisect_left(self.__order, entry) + 1
+
+    def top(self, limit: Optional[int] = None) -> List[Tuple[Hashable, int]]:
+        """
+        Retorna as primeiras posições
+
+        Args:
+            limit (Optional[int]): Quantidade de posições (None = todas)
+
+        Returns:
+            List[Tuple[Hashable, int]]: Pares (chave, pontuação) em ordem
+        """
+        entries = self.__order if limit is None else islice(self.__order, max(0, limit))
+        return [(key, -negative_score) for negative_score, _, key in entries]
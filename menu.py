@@ -9,6 +9,10 @@ from typing import Optional, Callable
 from score_manager import ScoreManager
 from player_registry import PlayerRegistry
 from responsive_utils import ResponsiveManager
+from text_cache import shared_text_cache
+
+# Intervalo mínimo (ms) entre verificações do ranking em disco enquanto a tela está aberta
+RANKING_REFRESH_INTERVAL = 1000
 
 class Menu:
     def __init__(self, width: int = None, height: int = None):
@@ -38,6 +42,10 @@ class Menu:
         self.__responsive = ResponsiveManager()
         self.__responsive.update_screen_size(self.__width, self.__height)
         
+        # Cache LRU de textos renderizados (descartado ao mudar a resolução)
+        self.__text_cache = shared_text_cache
+        self.__responsive.add_resize_listener(self.__text_cache.clear)
+        
         # Cores
         self.__BLACK = (0, 0, 0)
         self.__WHITE = (255, 255, 255)
@@ -48,6 +56,7 @@ class Menu:
         self.__LIGHT_BLUE = (100, 150, 255)
         self.__DARK_BLUE = (0, 50, 150)
         self.__GOLD = (255, 215, 0)
+        self.__COLORKEY = (255, 0, 255)  # Transparência das superfícies pré-renderizadas
         
         # Fontes responsivas
         self.__font_title = pygame.font.Font(None, self.__responsive.scale_font_size(72))
@@ -68,6 +77,17 @@ class Menu:
         # Gerenciador de pontuação
         self.__score_manager = ScoreManager()
         
+        # Quadro do ranking pré-renderizado (refeito quando a versão do ranking muda)
+        self.__ranking_board = None
+        self.__ranking_board_key = None
+        self.__ranking_refreshed_at = None  # None = verificar no próximo quadro
+        
+        # Fundo e botões pré-renderizados (refeitos quando a resolução muda)
+        self.__background_surface = None
+        self.__background_size = None
+        self.__button_surfaces = {}
+        self.__responsive.add_resize_listener(self.__clear_surface_cache)
+        
         # Gerenciador de registro de jogadores
         self.__player_registry = PlayerRegistry()
         
@@ -90,11 +110,11 @@ class Menu:
     def __draw_title(self):
         """Desenha o título do jogo com efeitos visuais"""
         # Efeito de gradiente no título
-        title_text = self.__font_title.render("ByThePong", True, self.__BLUE)
+        title_text = self.__text_cache.render(self.__font_title, "ByThePong", True, self.__BLUE)
         title_rect = title_text.get_rect(center=(self.__width // 2, 100))
         
         # Sombra do título
-        shadow_text = self.__font_title.render("ByThePong", True, (0, 0, 0))
+        shadow_text = self.__text_cache.render(self.__font_title, "ByThePong", True, (0, 0, 0))
         shadow_rect = shadow_text.get_rect(center=(self.__width // 2 + 3, 103))
         self.__screen.blit(shadow_text, shadow_rect)
         
@@ -105,15 +125,49 @@ class Menu:
         pygame.draw.line(self.__screen, self.__BLUE, 
                         (self.__width // 2 - 150, 130), (self.__width // 2 + 150, 130), 3)
         
-        subtitle_text = self.__font_medium.render("Jogo Pong em Python", True, self.__GRAY)
+        subtitle_text = self.__text_cache.render(self.__font_medium, "Jogo Pong em Python", True, self.__GRAY)
         subtitle_rect = subtitle_text.get_rect(center=(self.__width // 2, 150))
         self.__screen.blit(subtitle_text, subtitle_rect)
     
+    def __clear_surface_cache(self):
+        """Descarta o fundo e os botões pré-renderizados (mudança de resolução)"""
+        self.__background_surface = None
+        self.__background_size = None
+        self.__button_surfaces.clear()
+    
+    def __create_keyed_surface(self, width: int, height: int) -> pygame.Surface:
+        """
+        Cria uma superfície no formato da tela com cor de transparência (colorkey)
+        
+        Args:
+            width (int): Largura da superfície
+            height (int): Altura da superfície
+            
+        Returns:
+            pygame.Surface: Superfície preenchida com a cor transparente
+        """
+        surface = pygame.Surface((width, height)).convert()
+        surface.fill(self.__COLORKEY)
+        surface.set_colorkey(self.__COLORKEY, pygame.RLEACCEL)
+        return surface
+    
     def __draw_gradient_button(self, rect, color1, color2, text, text_color):
-        """Desenha um botão com gradiente e efeitos visuais"""
+        """Desenha um botão com gradiente e efeitos visuais (a partir do cache)"""
+        key = (rect.width, rect.height, tuple(color1), tuple(color2), text, tuple(text_color))
+        surface = self.__button_surfaces.get(key)
+        if surface is None:
+            surface = self.__render_gradient_button(rect.width, rect.height, color1, color2, text, text_color)
+            self.__button_surfaces[key] = surface
+        self.__screen.blit(surface, rect.topleft)
+    
+    def __render_gradient_button(self, width, height, color1, color2, text, text_color) -> pygame.Surface:
+        """Compõe sombra, gradiente, borda e texto de um botão em uma superfície"""
+        surface = self.__create_keyed_surface(width + 4, height + 4)
+        rect = pygame.Rect(0, 0, width, height)
+        
         # Sombra do botão
         shadow_rect = pygame.Rect(rect.x + 4, rect.y + 4, rect.width, rect.height)
-        pygame.draw.rect(self.__screen, (0, 0, 0, 100), shadow_rect, border_radius=10)
+        pygame.draw.rect(surface, (0, 0, 0, 100), shadow_rect, border_radius=10)
         
         # Gradiente do botão
         for i in range(rect.height):
@@ -121,25 +175,36 @@ class Menu:
             r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
             g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
             b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            pygame.draw.line(self.__screen, (r, g, b), 
+            pygame.draw.line(surface, (r, g, b), 
                            (rect.x, rect.y + i), (rect.x + rect.width, rect.y + i))
         
         # Borda do botão
-        pygame.draw.rect(self.__screen, self.__WHITE, rect, 3, border_radius=10)
+        pygame.draw.rect(surface, self.__WHITE, rect, 3, border_radius=10)
         
         # Texto do botão
-        button_text = self.__font_large.render(text, True, text_color)
+        button_text = self.__text_cache.render(self.__font_large, text, True, text_color)
         text_rect = button_text.get_rect(center=rect.center)
-        self.__screen.blit(button_text, text_rect)
+        surface.blit(button_text, text_rect)
+        return surface
     
     def __draw_background_pattern(self):
-        """Desenha um padrão decorativo de fundo adaptado para tela cheia"""
+        """Desenha o padrão decorativo de fundo (gerado uma vez por resolução)"""
+        size = (self.__width, self.__height)
+        if self.__background_surface is None or self.__background_size != size:
+            self.__background_surface = self.__render_background_pattern()
+            self.__background_size = size
+        self.__screen.blit(self.__background_surface, (0, 0))
+    
+    def __render_background_pattern(self) -> pygame.Surface:
+        """Gera o padrão decorativo de fundo adaptado para tela cheia"""
+        surface = self.__create_keyed_surface(self.__width, self.__height)
+        
         # Gradiente de fundo sutil
         for y in range(0, self.__height, 2):
             # Gradiente vertical do preto para um cinza muito escuro
             intensity = int(10 + (y / self.__height) * 5)
             color = (intensity, intensity, intensity)
-            pygame.draw.line(self.__screen, color, (0, y), (self.__width, y))
+            pygame.draw.line(surface, color, (0, y), (self.__width, y))
         
         # Linhas diagonais sutis mais espaçadas
         spacing = max(80, self.__width // 20)  # Espaçamento adaptativo
@@ -151,18 +216,19 @@ class Menu:
             end_y = min(self.__height, self.__width + self.__height - i)
             
             if start_x < end_x and start_y < end_y:
-                pygame.draw.line(self.__screen, (25, 25, 25), 
+                pygame.draw.line(surface, (25, 25, 25), 
                                (start_x, start_y), (end_x, end_y), 1)
         
         # Pontos decorativos mais sutis e espaçados
         dot_spacing = max(120, self.__width // 15)  # Espaçamento adaptativo
         for x in range(dot_spacing, self.__width, dot_spacing):
             for y in range(dot_spacing, self.__height, dot_spacing):
-                pygame.draw.circle(self.__screen, (35, 35, 35), (x, y), 1)
+                pygame.draw.circle(surface, (35, 35, 35), (x, y), 1)
         
         # Bordas sutis
-        pygame.draw.rect(self.__screen, (40, 40, 40), 
+        pygame.draw.rect(surface, (40, 40, 40), 
                         (0, 0, self.__width, self.__height), 2)
+        return surface
     
     def __draw_main_menu(self):
         """Desenha o menu principal com estilização melhorada"""
@@ -194,12 +260,12 @@ class Menu:
         ]
         for i, instruction in enumerate(instructions):
             # Sombra do texto
-            shadow_text = self.__font_small.render(instruction, True, (0, 0, 0))
+            shadow_text = self.__text_cache.render(self.__font_small, instruction, True, (0, 0, 0))
             shadow_rect = shadow_text.get_rect(center=(self.__width // 2 + 1, 560 + i * 25 + 1))
             self.__screen.blit(shadow_text, shadow_rect)
             
             # Texto principal
-            text = self.__font_small.render(instruction, True, self.__GRAY)
+            text = self.__text_cache.render(self.__font_small, instruction, True, self.__GRAY)
             text_rect = text.get_rect(center=(self.__width // 2, 560 + i * 25))
             self.__screen.blit(text, text_rect)
     
@@ -208,11 +274,11 @@ class Menu:
         self.__draw_title()
         
         # Título da seção com efeitos
-        title_text = self.__font_large.render("Escolha a Dificuldade:", True, self.__WHITE)
+        title_text = self.__text_cache.render(self.__font_large, "Escolha a Dificuldade:", True, self.__WHITE)
         title_rect = title_text.get_rect(center=(self.__width // 2, 200))
         
         # Sombra do título
-        shadow_text = self.__font_large.render("Escolha a Dificuldade:", True, (0, 0, 0))
+        shadow_text = self.__text_cache.render(self.__font_large, "Escolha a Dificuldade:", True, (0, 0, 0))
         shadow_rect = shadow_text.get_rect(center=(self.__width // 2 + 2, 202))
         self.__screen.blit(shadow_text, shadow_rect)
         
@@ -258,7 +324,7 @@ class Menu:
             self.__draw_gradient_button(diff_rect, color1, color2, difficulty.title(), text_color)
             
             # Descrição da dificuldade
-            desc_text = self.__font_small.render(difficulties_info[difficulty], True, self.__GRAY)
+            desc_text = self.__text_cache.render(self.__font_small, difficulties_info[difficulty], True, self.__GRAY)
             desc_rect = desc_text.get_rect(center=(self.__width // 2, y_pos + 40))
             self.__screen.blit(desc_text, desc_rect)
         
@@ -277,12 +343,12 @@ class Menu:
         ]
         for i, instruction in enumerate(instructions):
             # Sombra do texto
-            shadow_text = self.__font_small.render(instruction, True, (0, 0, 0))
+            shadow_text = self.__text_cache.render(self.__font_small, instruction, True, (0, 0, 0))
             shadow_rect = shadow_text.get_rect(center=(self.__width // 2 + 1, 660 + i * 20 + 1))
             self.__screen.blit(shadow_text, shadow_rect)
             
             # Texto principal
-            text = self.__font_small.render(instruction, True, self.__GRAY)
+            text = self.__text_cache.render(self.__font_small, instruction, True, self.__GRAY)
             text_rect = text.get_rect(center=(self.__width // 2, 660 + i * 20))
             self.__screen.blit(text, text_rect)
     
@@ -291,7 +357,7 @@ class Menu:
         self.__draw_title()
         
         # Título da seção
-        title_text = self.__font_large.render("Digite seu nome:", True, self.__WHITE)
+        title_text = self.__text_cache.render(self.__font_large, "Digite seu nome:", True, self.__WHITE)
         title_rect = title_text.get_rect(center=(self.__width // 2, 220))
         self.__screen.blit(title_text, title_rect)
         
@@ -302,7 +368,7 @@ class Menu:
             for i, line in enumerate(stats_lines):
                 if line.strip():
                     color = self.__GREEN if self.__is_new_player else self.__LIGHT_BLUE
-                    stats_text = self.__font_small.render(line, True, color)
+                    stats_text = self.__text_cache.render(self.__font_small, line, True, color)
                     stats_rect = stats_text.get_rect(center=(self.__width // 2, y_offset + i * 20))
                     self.__screen.blit(stats_text, stats_rect)
         
@@ -314,7 +380,7 @@ class Menu:
         pygame.draw.rect(self.__screen, self.__WHITE, input_rect, 3)
         
         # Texto do nome
-        name_text = self.__font_medium.render(self.__player_name, True, self.__BLACK)
+        name_text = self.__text_cache.render(self.__font_medium, self.__player_name, True, self.__BLACK)
         name_rect = name_text.get_rect(center=input_rect.center)
         self.__screen.blit(name_text, name_rect)
         
@@ -330,7 +396,7 @@ class Menu:
         pygame.draw.rect(self.__screen, self.__GREEN, confirm_rect)
         pygame.draw.rect(self.__screen, self.__WHITE, confirm_rect, 3)
         
-        confirm_text = self.__font_medium.render("CONFIRMAR", True, self.__BLACK)
+        confirm_text = self.__text_cache.render(self.__font_medium, "CONFIRMAR", True, self.__BLACK)
         confirm_text_rect = confirm_text.get_rect(center=confirm_rect.center)
         self.__screen.blit(confirm_text, confirm_text_rect)
         
@@ -341,21 +407,40 @@ class Menu:
             "Pressione ESC para voltar ao menu"
         ]
         for i, instruction in enumerate(instructions):
-            text = self.__font_small.render(instruction, True, self.__GRAY)
+            text = self.__text_cache.render(self.__font_small, instruction, True, self.__GRAY)
             text_rect = text.get_rect(center=(self.__width // 2, instructions_y + i * 25))
             self.__screen.blit(text, text_rect)
     
     def __draw_ranking(self):
-        """Desenha a tela de ranking"""
+        """Desenha a tela de ranking (quadro pré-renderizado, refeito só quando o ranking muda)"""
         self.__draw_title()
         
+        # Alterações de outros processos: ao abrir a tela e depois no máximo uma vez por segundo
+        now = pygame.time.get_ticks()
+        if (self.__ranking_refreshed_at is None or
+                now - self.__ranking_refreshed_at >= RANKING_REFRESH_INTERVAL):
+            self.__score_manager.refresh()
+            self.__ranking_refreshed_at = now
+        board_key = (self.__score_manager.version, self.__width, self.__height)
+        if self.__ranking_board is None or self.__ranking_board_key != board_key:
+            self.__ranking_board = self.__render_ranking_board()
+            self.__ranking_board_key = board_key
+        self.__screen.blit(self.__ranking_board, (0, 0))
+    
+    def __render_ranking_board(self) -> pygame.Surface:
+        """Compõe título, cabeçalhos, linhas e botão do ranking em uma superfície"""
+        ranking = self.__score_manager.get_ranking()
+        header_y = 200
+        start_y = header_y + 40
+        back_y = min(500, start_y + len(ranking) * 35 + 30) if ranking else 500
+        board = pygame.Surface((self.__width, back_y + 60), pygame.SRCALPHA).convert_alpha()
+        
         # Título da seção
-        title_text = self.__font_large.render("🏆 RANKING TOP 10 🏆", True, self.__GOLD)
+        title_text = self.__text_cache.render(self.__font_large, "🏆 RANKING TOP 10 🏆", True, self.__GOLD)
         title_rect = title_text.get_rect(center=(self.__width // 2, 150))
-        self.__screen.blit(title_text, title_rect)
+        board.blit(title_text, title_rect)
         
         # Cabeçalho do ranking
-        header_y = 200
         header_texts = ["Pos", "Nome", "Melhor Score", "Jogos", "Vitórias"]
         header_x_positions = [
             self.__width // 2 - 300,
@@ -366,65 +451,64 @@ class Menu:
         ]
         
         for i, (header_text, x_pos) in enumerate(zip(header_texts, header_x_positions)):
-            header = self.__font_small.render(header_text, True, self.__GOLD)
+            header = self.__text_cache.render(self.__font_small, header_text, True, self.__GOLD)
             header_rect = header.get_rect(center=(x_pos, header_y))
-            self.__screen.blit(header, header_rect)
+            board.blit(header, header_rect)
         
         # Linha separadora
-        pygame.draw.line(self.__screen, self.__GOLD, 
+        pygame.draw.line(board, self.__GOLD, 
                         (self.__width // 2 - 350, header_y + 20), 
                         (self.__width // 2 + 350, header_y + 20), 2)
         
         # Ranking
-        ranking = self.__score_manager.get_ranking()
         if ranking:
-            start_y = header_y + 40
             for i, entry in enumerate(ranking):
                 y_pos = start_y + i * 35
                 
                 # Posição com medalha
                 medal = "🥇" if i == 0 else "🥈" if i == 1 else "🥉" if i == 2 else f"{i+1}º"
-                pos_text = self.__font_small.render(medal, True, self.__WHITE)
+                pos_text = self.__text_cache.render(self.__font_small, medal, True, self.__WHITE)
                 pos_rect = pos_text.get_rect(center=(header_x_positions[0], y_pos))
-                self.__screen.blit(pos_text, pos_rect)
+                board.blit(pos_text, pos_rect)
                 
                 # Nome
                 name = entry.get("name", "Unknown")
-                name_text = self.__font_small.render(name, True, self.__WHITE)
+                name_text = self.__text_cache.render(self.__font_small, name, True, self.__WHITE)
                 name_rect = name_text.get_rect(center=(header_x_positions[1], y_pos))
-                self.__screen.blit(name_text, name_rect)
+                board.blit(name_text, name_rect)
                 
                 # Melhor Score
                 best_score = entry.get("best_score", entry.get("score", 0))
-                score_text = self.__font_small.render(str(best_score), True, self.__GREEN)
+                score_text = self.__text_cache.render(self.__font_small, str(best_score), True, self.__GREEN)
                 score_rect = score_text.get_rect(center=(header_x_positions[2], y_pos))
-                self.__screen.blit(score_text, score_rect)
+                board.blit(score_text, score_rect)
                 
                 # Total de Jogos
                 total_games = entry.get("total_games", 0)
-                games_text = self.__font_small.render(str(total_games), True, self.__LIGHT_BLUE)
+                games_text = self.__text_cache.render(self.__font_small, str(total_games), True, self.__LIGHT_BLUE)
                 games_rect = games_text.get_rect(center=(header_x_positions[3], y_pos))
-                self.__screen.blit(games_text, games_rect)
+                board.blit(games_text, games_rect)
                 
                 # Vitórias
                 total_wins = entry.get("total_wins", 0)
-                wins_text = self.__font_small.render(str(total_wins), True, self.__GREEN)
+                wins_text = self.__text_cache.render(self.__font_small, str(total_wins), True, self.__GREEN)
                 wins_rect = wins_text.get_rect(center=(header_x_positions[4], y_pos))
-                self.__screen.blit(wins_text, wins_rect)
+                board.blit(wins_text, wins_rect)
         else:
-            no_scores_text = self.__font_medium.render("Nenhuma pontuação registrada ainda!", True, self.__GRAY)
+            no_scores_text = self.__text_cache.render(self.__font_medium, "Nenhuma pontuação registrada ainda!", True, self.__GRAY)
             no_scores_rect = no_scores_text.get_rect(center=(self.__width // 2, 300))
-            self.__screen.blit(no_scores_text, no_scores_rect)
+            board.blit(no_scores_text, no_scores_rect)
         
         # Botão Voltar
-        back_y = min(500, start_y + len(ranking) * 35 + 30) if ranking else 500
         back_rect = pygame.Rect(self.__width // 2 - 100, back_y, 200, 50)
-        pygame.draw.rect(self.__screen, self.__BLUE, back_rect)
-        pygame.draw.rect(self.__screen, self.__WHITE, back_rect, 3)
+        pygame.draw.rect(board, self.__BLUE, back_rect)
+        pygame.draw.rect(board, self.__WHITE, back_rect, 3)
         
-        back_text = self.__font_medium.render("VOLTAR", True, self.__WHITE)
+        back_text = self.__text_cache.render(self.__font_medium, "VOLTAR", True, self.__WHITE)
         back_text_rect = back_text.get_rect(center=back_rect.center)
-        self.__screen.blit(back_text, back_text_rect)
+        board.blit(back_text, back_text_rect)
+        
+        return board
     
     def __handle_main_menu_click(self, pos):
         """Processa cliques no menu principal"""
@@ -453,6 +537,7 @@ class Menu:
         elif (button_x <= x <= button_x + button_width and 
               380 <= y <= 380 + button_height):
             self.__current_screen = "ranking"
+            self.__ranking_refreshed_at = None
         
         # Botão Sair
         elif (button_x <= x <= button_x + button_width and 
@@ -569,6 +654,9 @@ class Menu:
             self.__width = info.current_w
             self.__height = info.current_h
             self.__screen = pygame.display.set_mode((self.__width, self.__height), pygame.FULLSCREEN)
+        
+        # Notifica a mudança de resolução (invalida caches de renderização)
+        self.__responsive.update_screen_size(self.__width, self.__height)
     
     def __handle_keyboard_input(self, event):
         """Processa entrada do teclado"""
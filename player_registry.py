@@ -3,62 +3,109 @@ Classe PlayerRegistry - Gerencia cadastro de jogadores persistente em arquivo lo
 Implementa encapsulamento com atributos privados e métodos públicos
 """
 
-import json
 import os
 from datetime import datetime
 from typing import Optional, Dict, List
+from journal_store import JournalStore
+from indexed_store import IndexedStore
+from sqlite_store import SqliteStore, database_path_for
+from leaderboard import Leaderboard
+
+# Modos de armazenamento (padrão definido pela variável de ambiente BYTHEPONG_STORAGE)
+STORAGE_JSON = "json"          # dicionário completo em memória
+STORAGE_INDEXED = "indexed"    # índice nome -> posição, registros lidos sob demanda
+STORAGE_SQLITE = "sqlite"      # banco SQLite embutido (migra os JSON na primeira abertura)
+STORAGE_MODES = (STORAGE_JSON, STORAGE_INDEXED, STORAGE_SQLITE)
+
+
+def default_storage() -> str:
+    """Retorna o modo de armazenamento configurado no ambiente"""
+    storage = os.environ.get("BYTHEPONG_STORAGE", STORAGE_JSON).lower()
+    return storage if storage in STORAGE_MODES else STORAGE_JSON
+
 
 class PlayerRegistry:
-    def __init__(self, players_file: str = "players.json"):
+    def __init__(self, players_file: str = "players.json", storage: Optional[str] = None,
+                 database_file: Optional[str] = None):
         """
         Inicializa o registro de jogadores
         
         Args:
             players_file (str): Nome do arquivo para salvar os jogadores
+            storage (Optional[str]): "json", "indexed" ou "sqlite" (None = BYTHEPONG_STORAGE)
+            database_file (Optional[str]): Banco do modo sqlite (padrão: ao lado do players_file)
         """
         self.__players_file = players_file
-        self.__players = self.__load_players()
+        self.__storage = storage or default_storage()
+        if self.__storage not in STORAGE_MODES:
+            raise ValueError(f"Modo de armazenamento inválido: {self.__storage}")
+        if self.__storage == STORAGE_SQLITE:
+            # Tabela indexada por nome (minúsculo) e best_score; importa players.json uma vez
+            self.__players = SqliteStore(database_file or database_path_for(players_file), "players",
+                                         migrate_from=players_file, decode=self.__decode_players)
+        elif self.__storage == STORAGE_INDEXED:
+            # Índice pequeno em players.json.idx; registros lidos via mmap quando usados
+            self.__players = IndexedStore(players_file, decode=self.__decode_players)
+        else:
+            # Snapshot em players.json + journal append-only com as alterações
+            self.__players = JournalStore(players_file, decode=self.__decode_players,
+                                          encode=self.__encode_players)
+        # Índice ordenado por best_score (criado na primeira consulta de ranking)
+        self.__leaderboard: Optional[Leaderboard] = None
     
-    def __load_players(self) -> Dict[str, Dict]:
+    @staticmethod
+    def __decode_players(data) -> Dict[str, Dict]:
         """
-        Carrega os jogadores do arquivo JSON
+        Converte o conteúdo do arquivo JSON no dicionário de jogadores
         
         Returns:
             Dict[str, Dict]: Dicionário com nome do jogador como chave e dados como valor
         """
-        if os.path.exists(self.__players_file):
-            try:
-                with open(self.__players_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Converte lista para dicionário se necessário (compatibilidade)
-                    if isinstance(data, list):
-                        players_dict = {}
-                        for player in data:
-                            if isinstance(player, dict) and 'name' in player:
-                                players_dict[player['name'].lower()] = player
-                        return players_dict
-                    elif isinstance(data, dict) and 'players' in data:
-                        players_dict = {}
-                        for player in data['players']:
-                            if isinstance(player, dict) and 'name' in player:
-                                players_dict[player['name'].lower()] = player
-                        return players_dict
-                    elif isinstance(data, dict):
-                        # Já está no formato de dicionário
-                        return data
-            except (json.JSONDecodeError, FileNotFoundError, KeyError):
-                return {}
+        # Converte lista para dicionário se necessário (compatibilidade)
+        if isinstance(data, list):
+            players_dict = {}
+            for player in data:
+                if isinstance(player, dict) and 'name' in player:
+                    players_dict[player['name'].lower()] = player
+            return players_dict
+        elif isinstance(data, dict) and 'players' in data:
+            players_dict = {}
+            for player in data['players']:
+                if isinstance(player, dict) and 'name' in player:
+                    players_dict[player['name'].lower()] = player
+            return players_dict
+        elif isinstance(data, dict):
+            # Já está no formato de dicionário
+            return data
         return {}
     
-    def __save_players(self):
-        """Salva os jogadores no arquivo JSON"""
-        try:
-            # Salva no formato com chave "players" para organização
-            data = {"players": list(self.__players.values())}
-            with open(self.__players_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"Erro ao salvar jogadores: {e}")
+    @staticmethod
+    def __encode_players(players: Dict[str, Dict]) -> Dict:
+        """Formato do snapshot: chave "players" para organização"""
+        return {"players": list(players.values())}
+    
+    def __get_leaderboard(self) -> Leaderboard:
+        """Retorna o índice por best_score, construindo-o na primeira chamada"""
+        if self.__leaderboard is None:
+            if self.__storage == STORAGE_INDEXED:
+                # best_score já está no índice: não precisa ler os registros
+                scores = ((name_lower, best_score or 0) for name_lower, best_score in self.__players.summaries())
+            else:
+                scores = ((name_lower, player.get("best_score", 0)) for name_lower, player in self.__players.items())
+            self.__leaderboard = Leaderboard(scores)
+        return self.__leaderboard
+    
+    def refresh(self) -> bool:
+        """
+        Carrega as alterações gravadas por outros processos (só o trecho novo do journal)
+        
+        Returns:
+            bool: True se algo mudou
+        """
+        if not self.__players.refresh():
+            return False
+        self.__leaderboard = None
+        return True
     
     def register_player(self, name: str) -> bool:
         """
@@ -76,22 +123,31 @@ class PlayerRegistry:
         if not name_proper:
             raise ValueError("Nome do jogador não pode estar vazio")
         
-        if name_lower in self.__players:
-            return False
-        
-        now = datetime.now().isoformat()
-        self.__players[name_lower] = {
-            "name": name_proper,
-            "total_games": 0,
-            "total_wins": 0,
-            "best_score": 0,
-            "created_at": now,
-            "last_played": now
-        }
-        
-        self.__save_players()
+        # Trava os arquivos: outro processo pode estar cadastrando o mesmo nome
+        with self.__players.transaction() as changed:
+            if changed:
+                self.__leaderboard = None
+            if name_lower in self.__players:
+                return False
+            
+            now = datetime.now().isoformat()
+            self.__players.put(name_lower, {
+                "name": name_proper,
+                "total_games": 0,
+                "total_wins": 0,
+                "best_score": 0,
+                "created_at": now,
+                "last_played": now
+            })
+            if self.__leaderboard is not None:
+                self.__leaderboard.update(name_lower, 0)
         return True
     
+    @property
+    def storage(self) -> str:
+        """Retorna o modo de armazenamento em uso"""
+        return self.__storage
+    
     def get_player(self, name: str) -> Optional[Dict]:
         """
         Retorna os dados de um jogador
@@ -103,6 +159,7 @@ class PlayerRegistry:
             Optional[Dict]: Dados do jogador ou None se não encontrado
         """
         name_lower = name.strip().lower()
+        self.refresh()
         return self.__players.get(name_lower)
     
     def player_exists(self, name: str) -> bool:
@@ -116,6 +173,7 @@ class PlayerRegistry:
             bool: True se jogador existe, False caso contrário
         """
         name_lower = name.strip().lower()
+        self.refresh()
         return name_lower in self.__players
     
     def update_player_stats(self, name: str, score: int, won: bool = False):
@@ -129,25 +187,34 @@ class PlayerRegistry:
         """
         name_lower = name.strip().lower()
         
-        if name_lower not in self.__players:
-            # Se jogador não existe, registra automaticamente
-            self.register_player(name)
-        
-        player = self.__players[name_lower]
-        player["total_games"] = player.get("total_games", 0) + 1
-        
-        if won:
-            player["total_wins"] = player.get("total_wins", 0) + 1
-        
-        # Atualiza melhor pontuação se necessário
-        current_best = player.get("best_score", 0)
-        if score > current_best:
-            player["best_score"] = score
-        
-        # Atualiza última vez que jogou
-        player["last_played"] = datetime.now().isoformat()
-        
-        self.__save_players()
+        # Ler-alterar-gravar sob a trava: partidas simultâneas em outros processos
+        # não perdem incrementos
+        with self.__players.transaction() as changed:
+            if changed:
+                self.__leaderboard = None
+            
+            if name_lower not in self.__players:
+                # Se jogador não existe, registra automaticamente
+                self.register_player(name)
+            
+            player = dict(self.__players.get(name_lower))
+            player["total_games"] = player.get("total_games", 0) + 1
+            
+            if won:
+                player["total_wins"] = player.get("total_wins", 0) + 1
+            
+            # Atualiza melhor pontuação se necessário
+            current_best = player.get("best_score", 0)
+            if score > current_best:
+                player["best_score"] = score
+            
+            # Atualiza última vez que jogou
+            player["last_played"] = datetime.now().isoformat()
+            
+            # Uma única linha acrescentada ao journal
+            self.__players.put(name_lower, player)
+            if self.__leaderboard is not None:
+                self.__leaderboard.update(name_lower, player["best_score"])
     
     def get_all_players(self) -> List[Dict]:
         """
@@ -156,6 +223,7 @@ class PlayerRegistry:
         Returns:
             List[Dict]: Lista com todos os jogadores
         """
+        self.refresh()
         return list(self.__players.values())
     
     def get_player_stats(self, name: str) -> Optional[Dict]:
@@ -180,7 +248,23 @@ class PlayerRegistry:
         Returns:
             List[Dict]: Lista de jogadores ordenados por best_score
         """
-        players = list(self.__players.values())
-        players.sort(key=lambda x: x.get("best_score", 0), reverse=True)
-        return players[:limit]
+        self.refresh()
+        if self.__storage == STORAGE_SQLITE:
+            return self.__players.top(limit)
+        return [self.__players.get(name_lower) for name_lower, _ in self.__get_leaderboard().top(limit)]
+    
+    def get_player_rank(self, name: str) -> Optional[int]:
+        """
+        Retorna a posição de um jogador entre todos os cadastrados (por best_score)
+        
+        Args:
+            name (str): Nome do jogador
+            
+        Returns:
+            Optional[int]: Posição (1 = primeiro) ou None se não encontrado
+        """
+        self.refresh()
+        if self.__storage == STORAGE_SQLITE:
+            return self.__players.rank(name.strip().lower())
+        return self.__get_leaderboard().rank(name.strip().lower())
 
@@ -3,6 +3,8 @@ ByThePong - Utilitários de Responsividade
 Sistema para adaptação automática de elementos do jogo a diferentes resoluções
 """
 
+from types import MappingProxyType
+
 class ResponsiveManager:
     """
     Gerenciador de responsividade para adaptar elementos do jogo
@@ -22,6 +24,65 @@ class ResponsiveManager:
         self.__scale_x = 1.0
         self.__scale_y = 1.0
         self.__scale_factor = 1.0
+        
+        # Callbacks chamados quando a resolução muda (ex.: invalidar caches)
+        self.__resize_listeners = []
+        
+        # Tabela de layout da resolução atual (somente leitura, refeita a cada mudança)
+        self.__paddle_props = None
+        self.__ball_props = None
+        self.__margins = None
+        self.__scaled_lengths = {}
+        self.__scaled_fonts = {}
+        self.__build_layout()
+    
+    def __build_layout(self):
+        """Pré-calcula as propriedades escaladas para a resolução atual"""
+        self.__scaled_lengths = {}
+        self.__scaled_fonts = {}
+        
+        base_width = 15
+        base_height = 100
+        base_speed = 7
+        self.__paddle_props = MappingProxyType({
+            'width': self.scale_width(base_width),
+            'height': self.scale_height(base_height),
+            'speed': max(3, int(base_speed * self.__scale_factor)),
+            'speed_multiplier': self.__scale_factor
+        })
+        
+        base_radius = 10
+        self.__ball_props = MappingProxyType({
+            'radius': max(5, self.scale_width(base_radius)),
+            'speed_multiplier': self.__scale_factor
+        })
+        
+        self.__margins = MappingProxyType({
+            'small': self.scale_width(10),
+            'medium': self.scale_width(20),
+            'large': self.scale_width(40),
+            'paddle_offset': self.scale_width(50)
+        })
+    
+    def add_resize_listener(self, callback):
+        """
+        Registra uma função chamada (sem argumentos) sempre que a resolução mudar
+        
+        Args:
+            callback: Função a ser chamada
+        """
+        if callback not in self.__resize_listeners:
+            self.__resize_listeners.append(callback)
+    
+    def remove_resize_listener(self, callback):
+        """
+        Remove uma função registrada com add_resize_listener
+        
+        Args:
+            callback: Função registrada anteriormente
+        """
+        if callback in self.__resize_listeners:
+            self.__resize_listeners.remove(callback)
     
     def update_screen_size(self, width: int, height: int):
         """
@@ -31,6 +92,7 @@ class ResponsiveManager:
             width (int): Nova largura da tela
             height (int): Nova altura da tela
         """
+        changed = (width, height) != (self.__current_width, self.__current_height)
         self.__current_width = width
         self.__current_height = height
         
@@ -40,6 +102,11 @@ class ResponsiveManager:
         
         # Usa o menor fator para manter proporção
         self.__scale_factor = min(self.__scale_x, self.__scale_y)
+        self.__build_layout()
+        
+        if changed:
+            for callback in list(self.__resize_listeners):
+                callback()
     
     @property
     def scale_factor(self) -> float:
@@ -66,7 +133,10 @@ class ResponsiveManager:
         Returns:
             int: Largura escalada
         """
-        return int(width * self.__scale_factor)
+        scaled = self.__scaled_lengths.get(width)
+        if scaled is None:
+            scaled = self.__scaled_lengths[width] = int(width * self.__scale_factor)
+        return scaled
     
     def scale_height(self, height: int) -> int:
         """
@@ -78,7 +148,11 @@ class ResponsiveManager:
         Returns:
             int: Altura escalada
         """
-        return int(height * self.__scale_factor)
+        # Mesmo fator da largura: as duas compartilham a tabela
+        scaled = self.__scaled_lengths.get(height)
+        if scaled is None:
+            scaled = self.__scaled_lengths[height] = int(height * self.__scale_factor)
+        return scaled
     
     def scale_font_size(self, size: int) -> int:
         """
@@ -90,57 +164,40 @@ class ResponsiveManager:
         Returns:
             int: Tamanho escalado da fonte
         """
-        scaled = int(size * self.__scale_factor)
-        return max(12, scaled)  # Tamanho mínimo
+        scaled = self.__scaled_fonts.get(size)
+        if scaled is None:
+            scaled = self.__scaled_fonts[size] = max(12, int(size * self.__scale_factor))  # Tamanho mínimo
+        return scaled
     
     @property
-    def paddle_props(self) -> dict:
+    def paddle_props(self) -> MappingProxyType:
         """
-        Retorna propriedades escaladas das raquetes
+        Retorna propriedades escaladas das raquetes (pré-calculadas, somente leitura)
         
         Returns:
-            dict: Propriedades das raquetes
+            MappingProxyType: Propriedades das raquetes
         """
-        base_width = 15
-        base_height = 100
-        base_speed = 7
-        
-        return {
-            'width': self.scale_width(base_width),
-            'height': self.scale_height(base_height),
-            'speed': max(3, int(base_speed * self.__scale_factor)),
-            'speed_multiplier': self.__scale_factor
-        }
+        return self.__paddle_props
     
     @property
-    def ball_props(self) -> dict:
+    def ball_props(self) -> MappingProxyType:
         """
-        Retorna propriedades escaladas da bola
+        Retorna propriedades escaladas da bola (pré-calculadas, somente leitura)
         
         Returns:
-            dict: Propriedades da bola
+            MappingProxyType: Propriedades da bola
         """
-        base_radius = 10
-        
-        return {
-            'radius': max(5, self.scale_width(base_radius)),
-            'speed_multiplier': self.__scale_factor
-        }
+        return self.__ball_props
     
     @property
-    def margins(self) -> dict:
+    def margins(self) -> MappingProxyType:
         """
-        Retorna margens escaladas para diferentes elementos
+        Retorna margens escaladas para diferentes elementos (pré-calculadas, somente leitura)
         
         Returns:
-            dict: Margens responsivas
+            MappingProxyType: Margens responsivas
         """
-        return {
-            'small': self.scale_width(10),
-            'medium': self.scale_width(20),
-            'large': self.scale_width(40),
-            'paddle_offset': self.scale_width(50)
-        }
+        return self.__margins
     
     def get_responsive_position(self, x: int, y: int) -> tuple:
         """
@@ -3,47 +3,79 @@ Classe ScoreManager - Gerencia pontuação e ranking do jogo ByThePong
 Implementa encapsulamento com atributos privados e métodos públicos
 """
 
-import json
-import os
 from typing import List, Dict, Tuple, Optional
 from player import Player
-from player_registry import PlayerRegistry
+from player_registry import PlayerRegistry, STORAGE_SQLITE, default_storage
+from journal_store import JournalStore
+from sqlite_store import SqliteStore, database_path_for
+from leaderboard import Leaderboard
 
 class ScoreManager:
-    def __init__(self, ranking_file: str = "ranking.json"):
+    def __init__(self, ranking_file: str = "ranking.json", storage: Optional[str] = None,
+                 database_file: Optional[str] = None):
         """
         Inicializa o gerenciador de pontuação
         
         Args:
             ranking_file (str): Nome do arquivo para salvar o ranking
+            storage (Optional[str]): "json", "indexed" ou "sqlite" (None = BYTHEPONG_STORAGE)
+            database_file (Optional[str]): Banco do modo sqlite (padrão: ao lado do ranking_file)
         """
         self.__ranking_file = ranking_file
-        self.__player_registry = PlayerRegistry()
-        self.__ranking = self.__load_ranking()
+        storage = storage or default_storage()
+        self.__player_registry = PlayerRegistry(storage=storage, database_file=database_file)
+        # Entradas do ranking por nome (minúsculo), na ordem da última alteração
+        if storage == STORAGE_SQLITE:
+            # Tabela "ranking" no mesmo banco; importa ranking.json na primeira abertura
+            self.__ranking_store = SqliteStore(database_file or database_path_for(ranking_file), "ranking",
+                                               migrate_from=ranking_file, decode=self.__decode_ranking)
+        else:
+            # Persistidas em ranking.json (snapshot) + journal append-only
+            self.__ranking_store = JournalStore(ranking_file, decode=self.__decode_ranking,
+                                                encode=self.__encode_ranking)
         self.__max_ranking_size = 10
+        # Índice ordenado das entradas do ranking (atualizado em O(log n) por partida)
+        self.__ranking_index = self.__build_ranking_index()
+        self.__ranking = self.__build_ranking()
+        # Versão do ranking: incrementada a cada alteração (permite detectar mudanças)
+        self.__version = 0
     
-    def __load_ranking(self) -> List[Dict[str, int]]:
+    @staticmethod
+    def __decode_ranking(data) -> Dict[str, Dict]:
+        """Converte a lista do ranking.json no dicionário interno (mantendo a ordem)"""
+        if not isinstance(data, list):
+            return {}
+        return {entry["name"].lower(): entry for entry in data
+                if isinstance(entry, dict) and "name" in entry}
+    
+    @staticmethod
+    def __encode_ranking(entries: Dict[str, Dict]) -> List[Dict]:
+        """Grava o snapshot no formato original do ranking.json (lista ordenada)"""
+        ranking = sorted(entries.values(), key=lambda x: x.get("best_score", 0), reverse=True)
+        for i, entry in enumerate(ranking, 1):
+            entry["position"] = i
+        return ranking
+    
+    def __build_ranking_index(self) -> Leaderboard:
+        """Indexa as entradas armazenadas (a ordem do armazenamento desempata)"""
+        return Leaderboard((key, entry.get("best_score", 0)) for key, entry in self.__ranking_store.items())
+    
+    def __build_ranking(self) -> List[Dict[str, int]]:
         """
-        Carrega o ranking do arquivo JSON
+        Monta a lista ordenada do ranking a partir do índice
         
         Returns:
             List[Dict[str, int]]: Lista de jogadores no ranking
         """
-        if os.path.exists(self.__ranking_file):
-            try:
-                with open(self.__ranking_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return []
-        return []
-    
-    def __save_ranking(self):
-        """Salva o ranking no arquivo JSON"""
-        try:
-            with open(self.__ranking_file, 'w', encoding='utf-8') as f:
-                json.dump(self.__ranking, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"Erro ao salvar ranking: {e}")
+        ranking = []
+        for key, _ in self.__ranking_index.top(self.__max_ranking_size):
+            entry = self.__ranking_store.get(key)
+            if entry is None:
+                continue  # removida por outro processo depois da indexação
+            entry = dict(entry)
+            entry["position"] = len(ranking) + 1
+            ranking.append(entry)
+        return ranking
     
     def add_score(self, player_name: str, score: int, won: bool = False):
         """
@@ -65,11 +97,7 @@ class ScoreManager:
         player_stats = self.__player_registry.get_player_stats(player_name)
         
         if player_stats:
-            # Remove entrada antiga do mesmo jogador (se existir)
-            self.__ranking = [entry for entry in self.__ranking 
-                            if entry.get("name", "").lower() != player_name.lower()]
-            
-            # Adiciona nova entrada com dados completos
+            # Substitui a entrada do jogador (vai para o fim da ordem de alteração)
             new_entry = {
                 "name": player_stats["name"],
                 "score": player_stats["best_score"],  # Usa best_score para ranking
@@ -77,21 +105,41 @@ class ScoreManager:
                 "total_wins": player_stats.get("total_wins", 0),
                 "best_score": player_stats.get("best_score", 0)
             }
-            self.__ranking.append(new_entry)
-            
-            # Ordena por best_score (maior primeiro)
-            self.__ranking.sort(key=lambda x: x.get("best_score", 0), reverse=True)
-            
-            # Mantém apenas os top 10
-            if len(self.__ranking) > self.__max_ranking_size:
-                self.__ranking = self.__ranking[:self.__max_ranking_size]
-            
-            # Adiciona posição a cada entrada
-            for i, entry in enumerate(self.__ranking, 1):
-                entry["position"] = i
-            
-            # Salva no arquivo
-            self.__save_ranking()
+            key = player_name.strip().lower()
+            # Sob a trava: entradas gravadas por outros processos entram antes do corte do top 10
+            with self.__ranking_store.transaction() as changed:
+                if changed:
+                    self.__ranking_index = self.__build_ranking_index()
+                self.__ranking_store.put(key, new_entry)
+                self.__ranking_index.update(key, new_entry["best_score"])
+                
+                # Descarta quem saiu do top 10
+                while len(self.__ranking_index) > self.__max_ranking_size:
+                    evicted_key = self.__ranking_index.top(self.__max_ranking_size + 1)[-1][0]
+                    self.__ranking_index.remove(evicted_key)
+                    self.__ranking_store.delete(evicted_key)
+                self.__ranking = self.__build_ranking()
+            self.__version += 1
+    
+    def refresh(self) -> bool:
+        """
+        Recarrega o ranking se os arquivos foram alterados por outra instância
+        (no modo JSON só as linhas novas do journal são lidas)
+        
+        Returns:
+            bool: True se o ranking foi recarregado
+        """
+        if not self.__ranking_store.refresh():
+            return False
+        self.__ranking_index = self.__build_ranking_index()
+        self.__ranking = self.__build_ranking()
+        self.__version += 1
+        return True
+    
+    @property
+    def version(self) -> int:
+        """Retorna a versão atual do ranking (aumenta a cada alteração)"""
+        return self.__version
     
     def get_ranking(self) -> List[Dict[str, int]]:
         """
@@ -100,8 +148,33 @@ class ScoreManager:
         Returns:
             List[Dict[str, int]]: Lista ordenada do ranking
         """
+        self.refresh()
         return self.__ranking.copy()
     
+    def get_top_players(self, limit: int = 10) -> List[Dict]:
+        """
+        Retorna os melhores jogadores cadastrados (qualquer quantidade, não só o top 10)
+        
+        Args:
+            limit (int): Número máximo de jogadores a retornar
+            
+        Returns:
+            List[Dict]: Estatísticas dos jogadores ordenadas por best_score
+        """
+        return self.__player_registry.get_top_players_by_best_score(limit)
+    
+    def get_player_rank(self, player_name: str) -> Optional[int]:
+        """
+        Retorna a posição de um jogador entre todos os cadastrados
+        
+        Args:
+            player_name (str): Nome do jogador
+            
+        Returns:
+            Optional[int]: Posição (1 = primeiro) ou None se não encontrado
+        """
+        return self.__player_registry.get_player_rank(player_name)
+    
     def get_top_score(self) -> int:
         """
         Retorna a maior pontuação do ranking
@@ -109,6 +182,7 @@ class ScoreManager:
         Returns:
             int: Maior pontuação ou 0 se não houver ranking
         """
+        self.refresh()
         if self.__ranking:
             return self.__ranking[0].get("best_score", self.__ranking[0].get("score", 0))
         return 0
@@ -142,8 +216,11 @@ class ScoreManager:
     
     def clear_ranking(self):
         """Limpa todo o ranking"""
+        with self.__ranking_store.transaction():
+            self.__ranking_store.clear()
+        self.__ranking_index.clear()
         self.__ranking = []
-        self.__save_ranking()
+        self.__version += 1
     
     def get_ranking_display(self) -> str:
         """
@@ -152,6 +229,7 @@ class ScoreManager:
         Returns:
             str: Ranking formatado
         """
+        self.refresh()
         if not self.__ranking:
             return "Nenhuma pontuação registrada ainda!"
         
@@ -0,0 +1,147 @@
+"""
+Classe SpatialGrid - Grade uniforme para detecção de colisões (broad phase)
+Implementa encapsulamento com atributos privados e métodos públicos
+"""
+
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+Cell = Tuple[int, int]
+
+
+class SpatialGrid:
+    def __init__(self, cell_size: int = 64):
+        """
+        Inicializa a grade uniforme
+
+        Args:
+            cell_size (int): Tamanho (em pixels) de cada célula quadrada
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size deve ser positivo")
+        self.__cell_size = cell_size
+        self.__cells: Dict[Cell, Set[Hashable]] = {}
+        self.__item_cells: Dict[Hashable, Tuple[int, int, int, int]] = {}
+
+    @property
+    def cell_size(self) -> int:
+        """Retorna o tamanho das células"""
+        return self.__cell_size
+
+    def __len__(self) -> int:
+        return len(self.__item_cells)
+
+    def __cell_range(self, rect) -> Tuple[int, int, int, int]:
+        """
+        Calcula o intervalo de células coberto por um retângulo
+
+        Args:
+            rect: Sequência (x, y, largura, altura) ou pygame.Rect
+
+        Returns:
+            Tuple[int, int, int, int]: (col_ini, lin_ini, col_fim, lin_fim)
+        """
+        x, y, w, h = rect[0], rect[1], rect[2], rect[3]
+        size = self.__cell_size
+        return (int(x // size), int(y // size),
+                int((x + max(w, 1) - 1) // size), int((y + max(h, 1) - 1) // size))
+
+    def __add_to_cells(self, key: Hashable, cell_range: Tuple[int, int, int, int]):
+        cx0, cy0, cx1, cy1 = cell_range
+        cells = self.__cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    bucket = cells[(cx, cy)] = set()
+                bucket.add(key)
+
+    def __remove_from_cells(self, key: Hashable, cell_range: Tuple[int, int, int, int]):
+        cx0, cy0, cx1, cy1 = cell_range
+        cells = self.__cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del cells[(cx, cy)]
+
+    def insert(self, key: Hashable, rect):
+        """
+        Insere (ou reposiciona) um item na grade
+
+        Args:
+            key (Hashable): Identificador do item
+            rect: Retângulo (x, y, largura, altura) do item
+        """
+        if key in self.__item_cells:
+            self.update(key, rect)
+            return
+        cell_range = self.__cell_range(rect)
+        self.__item_cells[key] = cell_range
+        self.__add_to_cells(key, cell_range)
+
+    def update(self, key: Hashable, rect):
+        """
+        Atualiza a posição de um item; só mexe nas células se ele mudou de célula
+
+        Args:
+            key (Hashable): Identificador do item
+            rect: Novo retângulo (x, y, largura, altura) do item
+        """
+        old_range = self.__item_cells.get(key)
+        if old_range is None:
+            self.insert(key, rect)
+            return
+        new_range = self.__cell_range(rect)
+        if new_range == old_range:
+            return
+        self.__remove_from_cells(key, old_range)
+        self.__item_cells[key] = new_range
+        self.__add_to_cells(key, new_range)
+
+    def remove(self, key: Hashable):
+        """Remove um item da grade"""
+        cell_range = self.__item_cells.pop(key, None)
+        if cell_range is not None:
+            self.__remove_from_cells(key, cell_range)
+
+    def clear(self):
+        """Remove todos os itens"""
+        self.__cells.clear()
+        self.__item_cells.clear()
+
+    def query(self, rect) -> Set[Hashable]:
+        """
+        Retorna os itens cujas células se sobrepõem ao retângulo
+
+        Args:
+            rect: Retângulo (x, y, largura, altura) consultado
+
+        Returns:
+            Set[Hashable]: Candidatos à colisão (ainda exigem teste exato)
+        """
+        cx0, cy0, cx1, cy1 = self.__cell_range(rect)
+        cells = self.__cells
+        found: Set[Hashable] = set()
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return found
+
+    def rebuild(self, items: Iterable[Tuple[Hashable, object]]):
+        """
+        Reconstrói a grade a partir de pares (chave, retângulo)
+
+        Args:
+            items: Iterável de (chave, retângulo)
+        """
+        self.clear()
+        for key, rect in items:
+            self.insert(key, rect)
+
+    def occupied_cells(self) -> List[Cell]:
+        """Retorna as células ocupadas (útil para depuração)"""
+        return list(self.__cells.keys())
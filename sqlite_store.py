@@ -0,0 +1,312 @@
+"""
+Classe SqliteStore - Armazenamento de registros em uma tabela SQLite embutida
+Implementa encapsulamento com atributos privados e métodos públicos
+
+Oferece a mesma interface do JournalStore/IndexedStore (get/put/delete/...),
+com cada alteração virando uma escrita de uma única linha e consultas de
+ranking respondidas pelo índice (best_score DESC, seq).
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_DATABASE = "bythepong.sqlite3"
+
+
+def database_path_for(data_file: str) -> str:
+    """Banco padrão: mesmo diretório do arquivo JSON correspondente"""
+    return os.path.join(os.path.dirname(os.path.abspath(data_file)), DEFAULT_DATABASE)
+
+
+class _SharedConnection:
+    """
+    Conexão única por arquivo de banco no processo
+
+    As tabelas do mesmo banco (players, ranking) usam a mesma conexão, trava e
+    transação: assim PRAGMA data_version só muda com escritas de outros processos.
+    """
+
+    def __init__(self, database_path: str, key: Optional[Tuple[int, str]]):
+        self.key = key
+        self.connection = sqlite3.connect(database_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.RLock()
+        self.transaction_depth = 0
+        self.users = 0
+
+
+_connections: Dict[Tuple[int, str], _SharedConnection] = {}
+_connections_lock = threading.Lock()
+
+
+def _acquire_connection(database_path: str) -> _SharedConnection:
+    """Retorna a conexão do banco (criada na primeira tabela aberta)"""
+    if database_path == ":memory:":
+        shared = _SharedConnection(database_path, None)  # cada conexão é um banco próprio
+        shared.users = 1
+        return shared
+    # O pid evita reaproveitar no processo filho (fork) a conexão herdada do pai
+    key = (os.getpid(), os.path.realpath(database_path))
+    with _connections_lock:
+        shared = _connections.get(key)
+        if shared is None:
+            shared = _connections[key] = _SharedConnection(database_path, key)
+        shared.users += 1
+        return shared
+
+
+def _release_connection(shared: _SharedConnection):
+    """Fecha a conexão quando a última tabela que a usa é fechada"""
+    with _connections_lock:
+        shared.users -= 1
+        if shared.users > 0:
+            return
+        if shared.key is not None and _connections.get(shared.key) is shared:
+            del _connections[shared.key]
+    with shared.lock:
+        shared.connection.close()
+
+
+class SqliteStore:
+    def __init__(self, database_path: str, table: str, migrate_from: Optional[str] = None,
+                 decode: Optional[Callable[[Any], Dict[str, Any]]] = None,
+                 summary_field: str = "best_score"):
+        """
+        Abre (ou cria) a tabela e migra os dados do JSON na primeira vez
+
+        Args:
+            database_path (str): Arquivo do banco SQLite
+            table (str): Nome da tabela (ex.: "players", "ranking")
+            migrate_from (Optional[str]): Snapshot JSON importado na primeira abertura
+            decode (Optional[Callable]): Converte o JSON do snapshot no dicionário de registros
+            summary_field (str): Campo do registro indexado para ordenação
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Nome de tabela inválido: {table}")
+        self.__database_path = database_path
+        self.__table = table
+        self.__summary_field = summary_field
+        self.__shared = _acquire_connection(database_path)
+        self.__lock = self.__shared.lock
+        self.__connection = self.__shared.connection
+        self.__closed = False
+        self.__create_schema()
+        self.__data_version = self.__read_data_version()
+        if migrate_from is not None:
+            self.__migrate(migrate_from, decode)
+
+    @property
+    def database_path(self) -> str:
+        return self.__database_path
+
+    def __create_schema(self):
+        table = self.__table
+        with self.__connection:
+            self.__connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, "          # nome em minúsculas
+                "seq INTEGER NOT NULL, "          # ordem da última alteração (desempate)
+                "best_score INTEGER NOT NULL DEFAULT 0, "
+                "data TEXT NOT NULL)")
+            self.__connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_best_score ON {table} (best_score DESC, seq)")
+            self.__connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_seq ON {table} (seq)")
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+
+    def __migrate(self, json_path: str, decode: Optional[Callable[[Any], Dict[str, Any]]]):
+        """Importa snapshot + journal do modo JSON uma única vez (mesmo com aberturas simultâneas)"""
+        marker = f"migrated:{self.__table}"
+        with self.__lock:
+            if self.__is_migrated(marker):
+                return
+            records: Dict[str, Any] = {}
+            if os.path.exists(json_path) or os.path.exists(json_path + ".journal"):
+                # Reaproveita a leitura do modo JSON (snapshot + journals pendentes)
+                from journal_store import JournalStore
+                source = JournalStore(json_path, decode=decode, background=False)
+                records = dict(source.items())
+                source.close()
+            # Marca conferida de novo sob a trava de escrita: outro processo pode ter migrado antes
+            self.__connection.execute("BEGIN IMMEDIATE")
+            try:
+                if self.__is_migrated(marker):
+                    self.__connection.rollback()
+                    return
+                self.__connection.executemany(
+                    f"INSERT OR IGNORE INTO {self.__table} (key, seq, best_score, data) VALUES (?, ?, ?, ?)",
+                    ((key, seq, self.__summary(value), json.dumps(value, ensure_ascii=False))
+                     for seq, (key, value) in enumerate(records.items(), 1)))
+                self.__connection.execute("INSERT INTO meta (name, value) VALUES (?, ?)",
+                                          (marker, json_path))
+            except BaseException:
+                self.__connection.rollback()
+                raise
+            self.__connection.commit()
+            if records:
+                print(f"{len(records)} registros migrados de {json_path} para {self.__database_path}")
+
+    def __is_migrated(self, marker: str) -> bool:
+        return self.__connection.execute(
+            "SELECT 1 FROM meta WHERE name = ?", (marker,)).fetchone() is not None
+
+    def __summary(self, value: Any) -> int:
+        if isinstance(value, dict):
+            return value.get(self.__summary_field) or 0
+        return 0
+
+    def __read_data_version(self) -> int:
+        return self.__connection.execute("PRAGMA data_version").fetchone()[0]
+
+    # ---------------------- Leitura ----------------------
+    def get(self, key: str, default: Any = None) -> Any:
+        with self.__lock:
+            row = self.__connection.execute(
+                f"SELECT data FROM {self.__table} WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row is not None else default
+
+    def __contains__(self, key: str) -> bool:
+        with self.__lock:
+            return self.__connection.execute(
+                f"SELECT 1 FROM {self.__table} WHERE key = ?", (key,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute(f"SELECT COUNT(*) FROM {self.__table}").fetchone()[0]
+
+    def __iter__(self) -> Iterator[str]:
+        with self.__lock:
+            rows = self.__connection.execute(f"SELECT key FROM {self.__table} ORDER BY seq").fetchall()
+        return iter([row[0] for row in rows])
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Pares (chave, registro) na ordem da última alteração"""
+        with self.__lock:
+            rows = self.__connection.execute(f"SELECT key, data FROM {self.__table} ORDER BY seq").fetchall()
+        return [(key, json.loads(data)) for key, data in rows]
+
+    def values(self) -> List[Any]:
+        return [value for _, value in self.items()]
+
+    def top(self, limit: int) -> List[Any]:
+        """
+        Registros com maior pontuação (consulta indexada)
+
+        Args:
+            limit (int): Quantidade de registros
+
+        Returns:
+            List[Any]: Registros em ordem (empate: alterado antes primeiro)
+        """
+        with self.__lock:
+            rows = self.__connection.execute(
+                f"SELECT data FROM {self.__table} ORDER BY best_score DESC, seq LIMIT ?",
+                (max(0, limit),)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def rank(self, key: str) -> Optional[int]:
+        """
+        Posição (1 = primeiro) de uma chave pela pontuação
+
+        Returns:
+            Optional[int]: Posição ou None se a chave não existir
+        """
+        with self.__lock:
+            row = self.__connection.execute(
+                f"SELECT best_score, seq FROM {self.__table} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            best_score, seq = row
+            ahead = self.__connection.execute(
+                f"SELECT COUNT(*) FROM {self.__table} WHERE best_score > ? OR (best_score = ? AND seq < ?)",
+                (best_score, best_score, seq)).fetchone()[0]
+        return ahead + 1
+
+    def refresh(self) -> bool:
+        """
+        Indica se outra conexão (outro processo) alterou o banco desde a última chamada
+
+        Returns:
+            bool: True se houve alteração externa
+        """
+        with self.__lock:
+            version = self.__read_data_version()
+            if version == self.__data_version:
+                return False
+            self.__data_version = version
+            return True
+
+    @contextmanager
+    def transaction(self):
+        """
+        Transação de escrita (BEGIN IMMEDIATE): ler-alterar-gravar seguro entre processos
+
+        Yields:
+            bool: True se outro processo alterou o banco desde a última verificação
+        """
+        shared = self.__shared
+        with self.__lock:
+            if shared.transaction_depth:
+                # Aninhada (mesma tabela ou outra do mesmo banco): participa da transação aberta
+                shared.transaction_depth += 1
+                try:
+                    yield self.refresh()
+                finally:
+                    shared.transaction_depth -= 1
+                return
+            self.__connection.execute("BEGIN IMMEDIATE")
+            shared.transaction_depth = 1
+            try:
+                yield self.refresh()
+            except BaseException:
+                self.__connection.rollback()
+                raise
+            else:
+                self.__connection.commit()
+            finally:
+                shared.transaction_depth = 0
+
+    # ---------------------- Escrita ----------------------
+    def __write(self, sql: str, params: Tuple = ()):
+        """Executa uma escrita (confirmada na hora ou ao fim da transação aberta)"""
+        try:
+            with self.__lock:
+                if self.__shared.transaction_depth:
+                    self.__connection.execute(sql, params)
+                else:
+                    with self.__connection:
+                        self.__connection.execute(sql, params)
+        except sqlite3.Error as e:
+            print(f"Erro ao gravar em {self.__database_path}: {e}")
+
+    def put(self, key: str, value: Any):
+        """Grava (ou substitui) o registro de uma chave: uma única linha"""
+        table = self.__table
+        self.__write(
+            f"INSERT INTO {table} (key, seq, best_score, data) "
+            f"VALUES (?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM {table}), ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET seq = excluded.seq, "
+            "best_score = excluded.best_score, data = excluded.data",
+            (key, self.__summary(value), json.dumps(value, ensure_ascii=False)))
+
+    def delete(self, key: str):
+        """Remove uma chave (sem efeito se não existir)"""
+        self.__write(f"DELETE FROM {self.__table} WHERE key = ?", (key,))
+
+    def clear(self):
+        """Remove todas as chaves"""
+        self.__write(f"DELETE FROM {self.__table}")
+
+    def compact(self, wait: bool = False):
+        """Sem journal próprio para compactar (mantido pela interface comum)"""
+
+    def close(self):
+        """Libera a conexão (fechada quando nenhuma tabela do banco a usa mais)"""
+        if not self.__closed:
+            self.__closed = True
+            _release_connection(self.__shared)
@@ -0,0 +1,85 @@
+"""
+Classe TextCache - Cache LRU de superfícies de texto renderizadas pelo pygame
+Implementa encapsulamento com atributos privados e métodos públicos
+"""
+
+from collections import OrderedDict
+
+
+class TextCache:
+    def __init__(self, max_entries: int = 512):
+        """
+        Inicializa o cache de textos
+
+        Args:
+            max_entries (int): Quantidade máxima de superfícies mantidas em cache
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries deve ser positivo")
+        self.__max_entries = max_entries
+        self.__surfaces = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def max_entries(self) -> int:
+        """Retorna o limite de entradas"""
+        return self.__max_entries
+
+    @property
+    def size(self) -> int:
+        """Retorna a quantidade de superfícies em cache"""
+        return len(self.__surfaces)
+
+    @property
+    def hits(self) -> int:
+        """Retorna quantas renderizações foram atendidas pelo cache"""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Retorna quantas renderizações precisaram chamar font.render"""
+        return self.__misses
+
+    def render(self, font, text: str, antialias: bool, color, background=None):
+        """
+        Equivalente a ``font.render(text, antialias, color, background)`` com cache
+
+        A superfície retornada é compartilhada: quem chama não deve alterá-la.
+
+        Args:
+            font (pygame.font.Font): Fonte usada
+            text (str): Texto a renderizar
+            antialias (bool): Suavização das bordas
+            color: Cor do texto
+            background: Cor de fundo opcional
+
+        Returns:
+            pygame.Surface: Superfície com o texto renderizado
+        """
+        key = (font, text, tuple(color), antialias,
+               tuple(background) if background is not None else None)
+        surfaces = self.__surfaces
+        surface = surfaces.get(key)
+        if surface is not None:
+            surfaces.move_to_end(key)
+            self.__hits += 1
+            return surface
+
+        self.__misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        surfaces[key] = surface
+        if len(surfaces) > self.__max_entries:
+            surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Descarta todas as superfícies (ex.: mudança de resolução)"""
+        self.__surfaces.clear()
+
+
+# Cache compartilhado entre menu e jogo
+shared_text_cache = TextCache()